@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             batch.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Replays a trace file of commands against a system without
+#                   prompting. Each line is a command as typed at the command
+#                   line, followed by the params its prompts would ask for, as
+#                   key=value pairs:
+#
+#                       a size=12 t=5             new process
+#                       a size=12 nice=-5         ... with CFS nice value
+#                       a size=12 deadline=20 period=50
+#                       t t=3                     terminate active process
+#                       k4 t=2                    kill process 4
+#                       d1 t=4 file=f1 addr=1a rw=w len=8 cyl=40
+#                                                 system call (lowercase)
+#                       D1 t=2                    interrupt (uppercase)
+#                       q                         stop replaying
+#
+#                   t is the time since the last interrupt (0 if not given)
+#                   and addr is in hex. Blank lines & lines starting with #
+#                   are skipped. The file is read a line at a time, so traces
+#                   of any length replay in constant memory.
+
+from __future__ import division
+import sys
+
+from pcb import InvalidAddress
+from memory import InvalidProcess
+
+def parse(line):
+    """
+    Returns (command, params) for a line of a trace, where params is a dict
+    of key -> value strings, or None for a blank or comment line
+    """
+    fields = line.split()
+    if not fields or fields[0].startswith("#"):
+        return None
+
+    params = {}
+    for field in fields[1:]:
+        key, eq, value = field.partition("=")
+        if not eq:
+            raise ValueError("Expected key=value, not " + field)
+        params[key.lower()] = value
+    return fields[0], params
+
+def _int(params, key, default=None):
+    return int(params[key]) if key in params else default
+
+def run(system, command, params):
+    """ Runs one command of a trace on system """
+    elapsed = _int(params, "t", 0)
+    cmd = command.lower()
+
+    if cmd == "a":
+        system.new_process(_int(params, "size"), elapsed, _int(params, "nice"),
+                           _int(params, "deadline"), _int(params, "period"))
+
+    elif cmd == "t":
+        system.terminate(elapsed)
+
+    elif cmd[0] == "k" and cmd[1:].isdigit():
+        system.kill(int(cmd[1:]), elapsed)
+
+    elif system.device(cmd) is None:
+        raise ValueError("Invalid command")
+
+    elif command.islower(): # System call
+        system.syscall(cmd, elapsed, params.get("file", ""), int(params.get("addr", "0"), 16),
+                       params.get("rw"), _int(params, "len"), _int(params, "cyl"))
+
+    else: # Interrupt
+        system.interrupt(cmd, elapsed)
+
+def replay(system, lines, errors=sys.stderr):
+    """
+    Runs each command in lines (any iterable of trace lines, such as an
+    open file) on system, until the end or a q command. Invalid commands
+    are reported to errors and skipped. Returns (commands run, invalid
+    commands).
+    """
+    ops = bad = 0
+    for n, line in enumerate(lines, 1):
+        try:
+            parsed = parse(line)
+            if parsed is None:
+                continue
+            if parsed[0].lower() == "q":
+                break
+            ops += 1
+            run(system, *parsed)
+        except (ValueError, TypeError, KeyError, IndexError, InvalidAddress, InvalidProcess) as e:
+            bad += 1
+            errors.write("Line {}: {} ({})\n".format(n, line.strip(), str(e) or type(e).__name__))
+    return ops, bad
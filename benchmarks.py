@@ -0,0 +1,760 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             benchmarks.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Timing benchmarks for the system's core data structures.
+#                   Runs without any interactive input.
+# Run using:        python benchmarks.py
+
+from __future__ import division
+import os
+import sys
+import timeit
+import random
+import heapq
+import json
+import shutil
+import tempfile
+from contextlib import contextmanager
+import msg
+from pcb import PCB
+from memory import LongTermScheduler, Memory, CompactMemory, DemandPagedMemory, admission_policies, pages_needed
+from paging import replacement_policies
+from tlb import TLB
+from stack_distance import fault_curve
+from devices import Device, DiskDrive, MultiCoreCPU, CPU, MLFQ, CFS, EDF, cpu_policies
+from system import System
+import batch
+import config
+from simulation import EventCalendar, Simulator
+from workload import Workload
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def report(name, rows, headers):
+    """ Prints results of a benchmark as a table """
+    w = min(15, msg.screen_width // len(headers))
+    print msg.snapshot_header(name)
+    print "".join("{:^{w}}".format(h, w=w) for h in headers)
+    print msg.ruler()
+    for r in rows:
+        print "".join("{:^{w}}".format(c, w=w) for c in r)
+
+@contextmanager
+def quiet():
+    """ Silences console output of the system while benchmark runs """
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        yield
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+def deep_size(obj):
+    """ Approximate bytes used by object, its attributes & their contents """
+    size = sys.getsizeof(obj)
+    attrs = obj.__dict__.values() if hasattr(obj, "__dict__") else [getattr(obj, a) for a in obj.__slots__ if hasattr(obj, a)]
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    for a in attrs:
+        size += sys.getsizeof(a)
+        if isinstance(a, dict):
+            size += sum(sys.getsizeof(v) for v in a.itervalues() if v is not None)
+        elif isinstance(a, list):
+            size += sum(sys.getsizeof(v) for v in a)
+    return size
+
+## Processes
+
+def bench_pcb(pages=(1, 16, 256), bursts=100, count=100000):
+    """ Memory per PCB after a number of bursts, and time to create PCBs """
+    rows = []
+    for n in pages:
+        p = PCB(1, n, n, 1, 0.5, 5)
+        for pg in xrange(n):
+            p.allocate_memory(pg, pg)
+        for b in xrange(bursts):
+            p.record_burst_time(b)
+
+        start = timeit.default_timer()
+        procs = [PCB(pid, n, n, 1, 0.5, 5) for pid in xrange(count)]
+        elapsed = timeit.default_timer() - start
+        del procs
+
+        rows.append((n, deep_size(p), "{:.2f}".format(elapsed / count * 1e6)))
+
+    report("PCB size ({} bursts)".format(bursts), rows, ("PAGES", "BYTES/PCB", "USEC/NEW PCB"))
+
+## Memory
+
+def bench_terminate(mem_sizes=(2**12, 2**16, 2**20), pg_size=4, proc_size=64, reps=50):
+    """
+    Time LongTermScheduler.terminate on a process of fixed size as total
+    memory grows. Latency should stay flat, as only the frames held by the
+    terminated process are visited.
+    """
+    rows = []
+    pages = proc_size // pg_size
+    for mem in mem_sizes:
+        lts = LongTermScheduler(mem, pg_size)
+        procs = [PCB(i, proc_size, pages, pg_size, 0.5, 5) for i in range(1, reps+1)]
+
+        for p in procs:
+            lts.schedule(p)
+
+        start = timeit.default_timer()
+        for p in procs:
+            lts.terminate(p.pid)
+        elapsed = timeit.default_timer() - start
+
+        rows.append((mem, mem // pg_size, "{:.2f}".format(elapsed / reps * 1e6)))
+
+    report("Terminate latency", rows, ("MEM SIZE", "FRAMES", "USEC/TERM"))
+
+def bench_memory_startup(mem_sizes=(2**16, 2**20, 2**22), pg_size=1):
+    """ Time building an empty frame table with & without the compact layout """
+    rows = []
+    for mem in mem_sizes:
+        row = [mem // pg_size]
+        for cls in (Memory, CompactMemory):
+            start = timeit.default_timer()
+            m = cls(mem, pg_size)
+            row.append("{:.3f}".format(timeit.default_timer() - start))
+            del m
+        rows.append(row)
+
+    report("Memory startup (sec)", rows, ("FRAMES", "DICT/DEQUE", "COMPACT"))
+
+def bench_admission(mem_size=2**16, pg_size=16, max_proc_size=4096, jobs=100000, terms=200, seed=1):
+    """
+    For each admission policy, fill memory & a job pool with the same random
+    jobs, then terminate random processes in memory. Reports avg jobs
+    admitted per terminate, avg memory utilisation after admitting and avg
+    time per terminate.
+    """
+    rows = []
+    for name in sorted(admission_policies):
+        rand = random.Random(seed)
+        lts = LongTermScheduler(mem_size, pg_size, policy=name)
+        in_mem = []
+
+        with quiet():
+            for pid in xrange(1, jobs+1):
+                size = rand.randint(1, max_proc_size)
+                p = PCB(pid, size, pages_needed(size, pg_size), pg_size, 0.5, 5)
+                if lts.schedule(p):
+                    in_mem.append(pid)
+
+            start = timeit.default_timer()
+            for i in xrange(terms):
+                if not in_mem:
+                    break
+                pid = in_mem.pop(rand.randrange(len(in_mem)))
+                in_mem.extend(p.pid for p in lts.terminate(pid))
+            elapsed = timeit.default_timer() - start
+
+        admitted, util = lts.admission_stats()
+        rows.append((name, "{:.2f}".format(admitted), "{:.2%}".format(util), "{:.2f}".format(elapsed / lts.releases * 1e3)))
+
+    report("Admission policies ({} jobs)".format(jobs), rows, ("POLICY", "ADMIT/TERM", "UTILISATION", "MSEC/TERM"))
+
+def reference_trace(procs, pages, refs, rand, locality=0.9, span=8):
+    """
+    Yields (process, page) references. Most references fall near the last
+    page a process referenced, the rest anywhere in the process
+    """
+    last = [0] * len(procs)
+    for i in xrange(refs):
+        n = rand.randrange(len(procs))
+        if rand.random() < locality:
+            last[n] = (last[n] + rand.randint(-span, span)) % pages
+        else:
+            last[n] = rand.randrange(pages)
+        yield procs[n], last[n]
+
+def bench_paging(frames=2048, num_procs=16, pages=256, refs=10**6, seed=1):
+    """ Page faults, evictions & time to replay the same trace with each policy """
+    rows = []
+    for name in sorted(replacement_policies):
+        rand = random.Random(seed)
+        ram = DemandPagedMemory(frames, 1, name)
+        procs = [PCB(pid, pages, pages, 1, 0.5, 5) for pid in xrange(1, num_procs+1)]
+        for p in procs:
+            ram.allocate(p)
+
+        trace = list(reference_trace(procs, pages, refs, rand))
+        start = timeit.default_timer()
+        for p, page in trace:
+            ram.reference(p, page)
+        elapsed = timeit.default_timer() - start
+
+        rows.append((name, ram.page_faults, ram.evictions, "{:.2f}".format(elapsed)))
+
+    report("Page replacement ({} refs)".format(refs), rows, ("POLICY", "FAULTS", "EVICTIONS", "SEC"))
+
+def bench_tlb(configs=((16, 4), (64, 4), (64, 64), (256, 8)), num_procs=4, pages=1024, refs=200000, seed=1):
+    """
+    Hit rate, effective access time & translations/sec for TLBs of different
+    sizes, on the same trace, with a context switch every 1000 references
+    """
+    rows = []
+    for entries, ways in configs:
+        for policy in ("lru", "random"):
+            for asid in (True, False):
+                rand = random.Random(seed)
+                tlb = TLB(entries, ways, policy, asid, seed=seed)
+                procs = [PCB(pid, pages, pages, 1, 0.5, 5) for pid in xrange(1, num_procs+1)]
+                for p in procs:
+                    for pg in xrange(pages):
+                        p.allocate_memory(pg, pg)
+
+                # One process at a time, as on a CPU
+                trace = []
+                for i in xrange(0, refs, 1000):
+                    p = procs[rand.randrange(num_procs)]
+                    trace.extend((p, pg) for q, pg in reference_trace([p], pages, 1000, rand))
+
+                start = timeit.default_timer()
+                for p, pg in trace:
+                    tlb.switch(p.pid)
+                    p.translate(pg, tlb)
+                elapsed = timeit.default_timer() - start
+
+                rows.append(("{}/{}".format(entries, ways), policy, "asid" if asid else "flush",
+                    "{:.2%}".format(tlb.hit_rate()), "{:.2f}".format(tlb.effective_access_time()), int(refs / elapsed)))
+
+    report("TLB", rows, ("ENTRIES/WAYS", "EVICTION", "SWITCH", "HIT RATE", "EAT", "XLATE/SEC"))
+
+def bench_stack_distance(num_procs=16, pages=256, refs=10**6, frames=(256, 1024, 2048, 4096), seed=1):
+    """
+    Time to get the whole LRU fault curve in one pass, compared with the
+    faults from simulating LRU with a few memory sizes
+    """
+    rand = random.Random(seed)
+    procs = [PCB(pid, pages, pages, 1, 0.5, 5) for pid in xrange(1, num_procs+1)]
+    trace = list(reference_trace(procs, pages, refs, rand))
+
+    start = timeit.default_timer()
+    curve = fault_curve((p.pid, pg) for p, pg in trace)
+    elapsed = timeit.default_timer() - start
+
+    rows = []
+    for f in frames:
+        ram = DemandPagedMemory(f, 1, "lru")
+        sim_procs = [PCB(p.pid, pages, pages, 1, 0.5, 5) for p in procs]
+        for p in sim_procs:
+            ram.allocate(p)
+
+        sim = timeit.default_timer()
+        for p, pg in trace:
+            ram.reference(sim_procs[p.pid-1], pg)
+        sim = timeit.default_timer() - sim
+
+        rows.append((f, curve[min(f, len(curve)-1)], ram.page_faults, "{:.2f}".format(sim)))
+
+    report("LRU fault curve: one pass in {:.2f} sec".format(elapsed), rows, ("FRAMES", "CURVE FAULTS", "SIM FAULTS", "SIM SEC"))
+
+def bench_translate_batch(pages=4096, pg_size=256, sizes=(10**4, 10**6), seed=1):
+    """ Addresses translated/sec one at a time vs with translate_batch """
+    if np is None:
+        print msg.snapshot_header("Batch translation")
+        print "NumPy not installed, skipping".center(msg.screen_width)
+        return
+
+    p = PCB(1, pages * pg_size, pages, pg_size, 0.5, 5)
+    rand = random.Random(seed)
+    frames = range(pages)
+    rand.shuffle(frames)
+    for pg, f in enumerate(frames):
+        p.allocate_memory(pg, f)
+
+    rows = []
+    for n in sizes:
+        addrs = np.random.RandomState(seed).randint(0, p.proc_size, n)
+
+        start = timeit.default_timer()
+        single = [p.translate(a) for a in addrs.tolist()]
+        one = timeit.default_timer() - start
+
+        start = timeit.default_timer()
+        phys, invalid = p.translate_batch(addrs)
+        batch = timeit.default_timer() - start
+
+        assert phys.tolist() == single
+        rows.append((n, int(n / one), int(n / batch)))
+
+    report("Batch translation (addrs/sec)", rows, ("ADDRESSES", "ONE AT A TIME", "BATCH"))
+
+## CPU scheduling
+
+def bench_cpu_policies(ops=100000, seed=1):
+    """
+    Runs the same stream of arrivals, system calls, returns to the CPU &
+    terminations, with the same times between interrupts, on a CPU with
+    each scheduling policy
+    """
+    rand = random.Random(seed)
+    steps = [rand.random() for i in xrange(ops)]
+    times = [int(rand.expovariate(0.2)) + 1 for i in xrange(2 * ops)]
+
+    rows = []
+    for name, cpu in (("SJF", CPU()), ("MLFQ", MLFQ(quanta=(2, 4, 8, 16), boost=200)), ("CFS", CFS())):
+        waiting = []
+        pid = 0
+        t = iter(times)
+
+        with quiet():
+            start = timeit.default_timer()
+            for r in steps:
+                if r < 0.2 or not (cpu.busy() or waiting):
+                    pid += 1
+                    cpu.enqueue(PCB(pid, 1, 1, 1, 0.5, 5), next(t) if cpu.busy() else 0)
+                elif r < 0.6 and cpu.busy():
+                    waiting.append(cpu.dequeue(next(t)))
+                elif r < 0.8 and waiting:
+                    cpu.enqueue(waiting.pop(int(r * len(waiting)) % len(waiting)), next(t) if cpu.busy() else 0)
+                elif cpu.busy():
+                    cpu.terminate(elapsed=next(t))
+            elapsed = timeit.default_timer() - start
+
+        rows.append((name, pid, cpu.completions, "{:.1f}".format(cpu.mean_response_time()),
+                     "{:.1f}".format(cpu.mean_turnaround_time()), int(ops / elapsed)))
+
+    report("CPU scheduling policies (mean times)", rows,
+           ("POLICY", "PROCESSES", "COMPLETED", "RESPONSE", "TURNAROUND", "OPS/SEC"))
+
+def bench_cfs(procs=(1000, 100000), ticks=10**6, seed=1):
+    """
+    Fairness & overhead with many CPU bound processes of random nice values,
+    all ready at once. Each process's fair share of CPU time is in proportion
+    to its weight. Lag is how far a process's CPU time is from its fair
+    share, and Jain's index of CPU time / fair share is 1 if every process
+    got exactly its share, down to 1/n if one process got all of it.
+    """
+    rows = []
+    for n in procs:
+        rand = random.Random(seed)
+        nices = [rand.randint(-5, 5) for i in xrange(n)]
+        for name, new_cpu in (("SJF", CPU), ("MLFQ", lambda: MLFQ(quanta=(2, 4, 8, 16), boost=200)), ("CFS", CFS)):
+            cpu = new_cpu()
+            ps = []
+            for i, nice in enumerate(nices):
+                p = PCB(i + 1, 1, 1, 1, 0.5, 5)
+                p.set_nice(nice)
+                ps.append(p)
+            with quiet():
+                for p in ps:
+                    cpu.enqueue(p)
+                start = timeit.default_timer()
+                for i in xrange(ticks):
+                    cpu.elapse(1)
+                elapsed = timeit.default_timer() - start
+
+            total_weight = sum(p.weight for p in ps)
+            shares = [p.curr_burst / (ticks * p.weight / total_weight) for p in ps]
+            lag = max(abs(p.curr_burst - ticks * p.weight / total_weight) for p in ps)
+            jain = sum(shares) ** 2 / (n * sum(x * x for x in shares))
+            rows.append((name, n, "{:.1f}".format(lag), "{:.4f}".format(jain),
+                         "{:.2f}".format(elapsed / ticks * 10**6)))
+
+    report("CPU fairness, {} ticks of CPU bound processes".format(ticks), rows,
+           ("POLICY", "PROCESSES", "MAX LAG", "JAIN INDEX", "US/TICK"))
+
+def periodic_tasks(n, utilisation, rand, periods=(100, 1000)):
+    """
+    Returns list of (burst, period) for n periodic tasks whose total
+    utilisation (sum of burst / period) is close to the one given
+    """
+    shares = [rand.random() for i in xrange(n)]
+    total = sum(shares)
+    tasks = []
+    for share in shares:
+        period = rand.randint(*periods)
+        tasks.append((max(1, int(round(utilisation * share / total * period))), period))
+    return tasks
+
+def bench_edf(utilisations=(0.7, 0.9, 1.0, 1.1), tasks=20, ticks=10**5, seed=1):
+    """
+    Runs the same set of periodic tasks, each with a deadline equal to its
+    period, on an SJF & an EDF CPU, one tick at a time. Each task releases a
+    burst every period, or as soon as its last burst is done if that is
+    later. EDF should miss no deadlines while utilisation is at most 1.
+    """
+    rows = []
+    for u in utilisations:
+        rand = random.Random(seed)
+        task_set = periodic_tasks(tasks, u, rand)
+        actual = sum(c / t for c, t in task_set)
+
+        for name, cpu in (("SJF", CPU()), ("EDF", EDF())):
+            ps = []
+            for i, (c, t) in enumerate(task_set):
+                p = PCB(i + 1, 1, 1, 1, 0.5, c)
+                p.rel_deadline = p.period = t
+                ps.append(p)
+
+            # (release time, pid) of each task's next burst, and the
+            # deadline of each task's burst in the CPU
+            releases = [(0, p.pid) for p in ps]
+            deadlines = {}
+            jobs = misses = 0
+            worst = None
+
+            with quiet():
+                start = timeit.default_timer()
+                for now in xrange(ticks):
+                    while releases and releases[0][0] <= now:
+                        release, pid = heapq.heappop(releases)
+                        deadlines[pid] = release + task_set[pid - 1][1]
+                        cpu.enqueue(ps[pid - 1])
+
+                    p = cpu.active
+                    if p and p.curr_burst + 1 >= task_set[p.pid - 1][0]:
+                        # Burst finishes this tick
+                        cpu.dequeue(1)
+                        deadline = deadlines.pop(p.pid)
+                        lateness = now + 1 - deadline
+                        jobs += 1
+                        misses += lateness > 0
+                        worst = lateness if worst is None else max(worst, lateness)
+                        heapq.heappush(releases, (max(now + 1, deadline), p.pid))
+                    else:
+                        cpu.elapse(1)
+                elapsed = timeit.default_timer() - start
+
+            rows.append((name, "{:.2f}".format(actual), jobs, misses, worst, int(ticks / elapsed)))
+
+    report("Periodic deadlines, {} tasks".format(tasks), rows,
+           ("POLICY", "UTILISATION", "BURSTS", "MISSED", "MAX LATENESS", "TICKS/SEC"))
+
+def bench_multicore(cores=(1, 2, 4, 8, 16), procs=64, ops=100000, seed=1):
+    """
+    Runs the same stream of CPU arrivals & system calls on CPUs with
+    different numbers of cores. Processes leave the CPU for a system call,
+    and come back later.
+    """
+    rand = random.Random(seed)
+    steps = [rand.random() for i in xrange(ops)]
+    times = [rand.randint(1, 20) for i in xrange(ops)]
+
+    rows = []
+    for n in cores:
+        cpu = MultiCoreCPU(n)
+        waiting = [PCB(pid, 1, 1, 1, 0.5, 5) for pid in xrange(1, procs + 1)]
+
+        t = iter(times)
+
+        with quiet():
+            start = timeit.default_timer()
+            for r in steps:
+                if waiting and (r < 0.5 or not cpu.busy()):
+                    cpu.enqueue(waiting.pop(int(r * len(waiting))), next(t) if cpu.busy() else 0)
+                else:
+                    waiting.append(cpu.dequeue(next(t)))
+            elapsed = timeit.default_timer() - start
+
+        util = sum(cpu.utilisation(i) for i in xrange(n)) / n
+        rows.append((n, "{:.2%}".format(util), cpu.migrations, cpu.steals, int(ops / elapsed)))
+
+    report("Multi-core CPU, {} processes".format(procs), rows,
+           ("CORES", "AVG UTILISATION", "MIGRATIONS", "STEALS", "OPS/SEC"))
+
+## Disk scheduling
+
+def bench_disk(cylinders=5000, requests=100000, depth=32, seed=1):
+    """
+    Runs the same stream of requests through a disk drive with each
+    scheduling policy, keeping `depth` requests outstanding
+    """
+    rand = random.Random(seed)
+    stream = [rand.randint(0, cylinders) for i in xrange(requests)]
+
+    rows = []
+    for policy in ("fcfs", "sstf", "scan", "cscan", "look", "clook", "flook"):
+        drive = DiskDrive("d1", cylinders, policy)
+        procs = [PCB(pid, 1, 1, 1, 0.5, 5) for pid in xrange(requests)]
+
+        start = timeit.default_timer()
+        i = done = 0
+        while done < requests:
+            while i < requests and i - done < depth:
+                procs[i].params["cyl"] = stream[i]
+                drive.enqueue(procs[i])
+                i += 1
+            drive.dequeue()
+            done += 1
+        elapsed = timeit.default_timer() - start
+
+        rows.append((policy.upper(), drive.total_seek, "{:.1f}".format(drive.avg_seek()), drive.max_seek(), int(requests / elapsed)))
+
+    report("Disk scheduling, {} requests over {} cylinders".format(requests, cylinders), rows,
+           ("POLICY", "TOTAL SEEK", "AVG SEEK", "MAX SEEK", "REQUESTS/SEC"))
+
+def bench_disk_merge(cylinders=5000, requests=100000, hot=50, depth=32, seed=1):
+    """
+    Runs a stream of requests clustered on a few hot cylinders & files through
+    a LOOK disk drive, with and without merging requests
+    """
+    rand = random.Random(seed)
+    hot_cyls = [rand.randint(1, cylinders - 1) for i in xrange(hot)]
+    stream = [(rand.choice(hot_cyls) + rand.randint(-1, 1), rand.choice("rw"), "f" + str(rand.randrange(hot)))
+              for i in xrange(requests)]
+
+    rows = []
+    for merge in (False, True):
+        drive = DiskDrive("d1", cylinders, "look", merge)
+        procs = [PCB(pid, 1, 1, 1, 0.5, 5) for pid in xrange(requests)]
+
+        start = timeit.default_timer()
+        i = done = 0
+        while done < requests:
+            while i < requests and i - done < depth:
+                procs[i].params["cyl"], procs[i].params["rw"], procs[i].params["file"] = stream[i]
+                drive.enqueue(procs[i])
+                i += 1
+            done += len(drive.dequeue_all())
+        elapsed = timeit.default_timer() - start
+
+        rows.append(("ON" if merge else "OFF", drive.requests_serviced(), drive.total_seek, drive.merged, drive.seeks_saved, int(requests / elapsed)))
+
+    report("Disk request merging, {} requests on {} hot cylinders".format(requests, hot), rows,
+           ("MERGING", "SERVICES", "TOTAL SEEK", "MERGED", "SEEKS SAVED", "REQUESTS/SEC"))
+
+## Whole system
+
+def bench_system(ops=10**6, mem_size=2**16, pg_size=16, max_proc_size=1024, seed=1):
+    """
+    Drives a whole system through the headless API, with the mix of
+    commands a user would type: new processes, system calls to printers,
+    disks & CD drives, interrupts, terminations & kills
+    """
+    rand = random.Random(seed)
+    rows = []
+    for cores, policy in ((1, "sjf"), (1, "cfs"), (4, "sjf")):
+        all_devices = ([Device("p" + str(i), "Printer") for i in xrange(1, 3)] +
+                       [DiskDrive("d" + str(i), 1000) for i in xrange(1, 5)] +
+                       [Device("c" + str(i), "CD/RW") for i in xrange(1, 3)])
+        names = [dev.get_dev_name() for dev in all_devices]
+        system = System(all_devices, 0.5, 5, mem_size, pg_size, max_proc_size, cores, policy)
+        cpu = system.cpu
+
+        with quiet():
+            start = timeit.default_timer()
+            for i in xrange(ops):
+                r = rand.random()
+                elapsed = rand.randint(1, 20) if cpu.busy() else 0
+                if r < 0.1:
+                    system.new_process(rand.randint(1, max_proc_size), elapsed)
+                elif r < 0.45 and cpu.busy():
+                    proc = cpu.get_active_process()
+                    address = rand.randrange(proc.proc_size)
+                    system.syscall(rand.choice(names), elapsed, "f", address, rand.choice("rw"),
+                                   proc.proc_size - address, rand.randint(0, 1000))
+                elif r < 0.8:
+                    dev = system.device(rand.choice(names))
+                    if dev.length():
+                        system.interrupt(dev.get_dev_name(), elapsed)
+                elif r < 0.97 and cpu.busy():
+                    system.terminate(elapsed)
+                elif system.pid_count:
+                    pid = rand.randint(1, system.pid_count)
+                    if pid in system.registry:
+                        system.kill(pid, elapsed)
+            elapsed = timeit.default_timer() - start
+
+        rows.append(("{} x {}".format(cores, policy.upper()), system.pid_count, system.completed,
+                     len(system.registry), int(ops / elapsed)))
+
+    report("Headless system, {} commands".format(ops), rows,
+           ("CPU", "PROCESSES", "COMPLETED", "LIVE", "OPS/SEC"))
+
+def trace_lines(ops, names, max_proc_size, rand):
+    """
+    Yields lines of a trace with a mix of commands like bench_system's.
+    Commands that turn out to be invalid when replayed are just skipped.
+    """
+    pid = 0
+    for i in xrange(ops):
+        r = rand.random()
+        t = rand.randint(1, 20)
+        if r < 0.1:
+            pid += 1
+            yield "a size={} t={}\n".format(rand.randint(1, max_proc_size), t)
+        elif r < 0.45:
+            yield "{} t={} file=f addr=0 rw={} len=1 cyl={}\n".format(
+                rand.choice(names), t, rand.choice("rw"), rand.randint(0, 1000))
+        elif r < 0.8:
+            yield "{} t={}\n".format(rand.choice(names).upper(), t)
+        elif r < 0.97:
+            yield "t t={}\n".format(t)
+        else:
+            yield "k{} t={}\n".format(rand.randint(1, pid or 1), t)
+
+def bench_replay(ops=10**6, mem_size=2**16, pg_size=16, max_proc_size=1024, seed=1):
+    """
+    Replays a trace generated on the fly, so it is never held in memory,
+    through batch mode
+    """
+    rand = random.Random(seed)
+    all_devices = ([Device("p" + str(i), "Printer") for i in xrange(1, 3)] +
+                   [DiskDrive("d" + str(i), 1000) for i in xrange(1, 5)] +
+                   [Device("c" + str(i), "CD/RW") for i in xrange(1, 3)])
+    names = [dev.get_dev_name() for dev in all_devices]
+    system = System(all_devices, 0.5, 5, mem_size, pg_size, max_proc_size)
+
+    with quiet():
+        start = timeit.default_timer()
+        run, bad = batch.replay(system, trace_lines(ops, names, max_proc_size, rand), open(os.devnull, "w"))
+        elapsed = timeit.default_timer() - start
+
+    report("Trace replay, {} lines".format(ops), [(run, bad, system.completed, int(run / elapsed))],
+           ("COMMANDS", "INVALID", "COMPLETED", "OPS/SEC"))
+
+## Discrete event simulation
+
+def bench_calendar(events=10**7, pending=1000, seed=1):
+    """
+    Events/sec through the event calendar alone, keeping a steady number
+    of events pending: each event taken schedules another
+    """
+    rand = random.Random(seed)
+    calendar = EventCalendar()
+    for i in xrange(pending):
+        calendar.schedule(rand.random() * 100, 0)
+
+    start = timeit.default_timer()
+    for i in xrange(events):
+        calendar.next()
+        calendar.schedule(rand.random() * 100, 0)
+    elapsed = timeit.default_timer() - start
+
+    report("Event calendar, {} pending".format(pending), [(events, int(events / elapsed), int(calendar.now))],
+           ("EVENTS", "EVENTS/SEC", "CLOCK"))
+
+def bench_simulation(jobs=20000, mem_size=2**16, pg_size=16, max_proc_size=1024, seed=1):
+    """
+    Events/sec simulating the same jobs with each CPU scheduling policy, on
+    one & four cores, and the turnaround time they give
+    """
+    rows = []
+    for cores in (1, 4):
+        for policy in sorted(cpu_policies):
+            all_devices = ([Device("p" + str(i), "Printer") for i in xrange(1, 3)] +
+                           [DiskDrive("d" + str(i), 1000) for i in xrange(1, 5)])
+            system = System(all_devices, 0.5, 5, mem_size, pg_size, max_proc_size, cores, policy)
+            sim = Simulator(system)
+
+            with quiet():
+                start = timeit.default_timer()
+                events = sim.run(Workload(all_devices, max_proc_size, seed, jobs, mix={"Printer": 1, "Disk Drive": 1}))
+                elapsed = timeit.default_timer() - start
+
+            rows.append(("{} x {}".format(cores, policy.upper()), events, system.completed,
+                         "{:.1f}".format(system.cpu.mean_turnaround_time()), int(events / elapsed)))
+
+    report("Discrete event simulation, {} jobs".format(jobs), rows,
+           ("CPU", "EVENTS", "COMPLETED", "TURNAROUND", "EVENTS/SEC"))
+
+def bench_workload(jobs=10**6, seed=1):
+    """
+    Jobs/sec generated with each arrival process & burst distribution.
+    Jobs are generated as they are iterated over & then dropped, so memory
+    stays constant however many there are.
+    """
+    all_devices = ([Device("p" + str(i), "Printer") for i in xrange(1, 3)] +
+                   [DiskDrive("d" + str(i), 1000) for i in xrange(1, 5)] +
+                   [Device("c" + str(i), "CD/RW") for i in xrange(1, 3)])
+    rand = random.Random(seed)
+    samples = [rand.paretovariate(2) * 5 for i in xrange(1000)]
+    rows = []
+    for arrivals, bursts, options in (("poisson", "exponential", {}), ("bursty", "exponential", {}),
+                                      ("poisson", "hyperexponential", {"cv": 4}),
+                                      ("poisson", "trace", {"samples": samples})):
+        workload = Workload(all_devices, 1024, seed, jobs, arrivals, bursts=bursts, burst_options=options)
+
+        start = timeit.default_timer()
+        calls = cpu = 0
+        for job in workload:
+            calls += len(job.io)
+            cpu += sum(job.bursts)
+        elapsed = timeit.default_timer() - start
+
+        rows.append((arrivals, bursts, "{:.2f}".format(job.time / jobs), "{:.2f}".format(cpu / jobs),
+                     "{:.2f}".format(calls / jobs), int(jobs / elapsed)))
+
+    report("Workload generation, {} jobs".format(jobs), rows,
+           ("ARRIVALS", "BURSTS", "MEAN GAP", "CPU/JOB", "CALLS/JOB", "JOBS/SEC"))
+
+## Config files
+
+def bench_config_startup(disks=(5, 500, 5000), mem_sizes=(2**16, 2**24)):
+    """
+    Time to read a config file & build the whole system from it, for JSON
+    & INI files with many disk drives & large memories
+    """
+    tmp = tempfile.mkdtemp()
+    rows = []
+    try:
+        for n in disks:
+            for mem_size in mem_sizes:
+                settings = {
+                    "devices": {"printers": 2, "disk_drives": n, "cd_drives": 2,
+                                "cylinders": [1000 + i for i in xrange(n)], "merge": True},
+                    "cpu": {"alpha": 0.5, "tau": 5, "cores": 4, "policy": "cfs", "latency": 20, "min_granularity": 1},
+                    "memory": {"size": mem_size, "page_size": 16, "max_proc_size": 1024},
+                    "tlb": {"entries": 64, "ways": 4},
+                }
+                json_path = os.path.join(tmp, "sys.json")
+                with open(json_path, "w") as f:
+                    json.dump(settings, f)
+                ini_path = os.path.join(tmp, "sys.ini")
+                with open(ini_path, "w") as f:
+                    for name, section in settings.iteritems():
+                        f.write("[{}]\n".format(name))
+                        for key, value in section.iteritems():
+                            value = ", ".join(map(str, value)) if isinstance(value, list) else value
+                            f.write("{} = {}\n".format(key, value))
+
+                times = []
+                for path in (json_path, ini_path):
+                    start = timeit.default_timer()
+                    system = config.build(config.read(path))
+                    times.append("{:.4f}".format(timeit.default_timer() - start))
+                rows.append([n, mem_size] + times + [len(system.all_devices)])
+    finally:
+        shutil.rmtree(tmp)
+
+    report("System startup from config file", rows, ("DISKS", "MEM SIZE", "JSON SECS", "INI SECS", "DEVICES"))
+
+def main():
+    bench_pcb()
+    bench_terminate()
+    bench_memory_startup()
+    bench_admission(jobs=200)
+    bench_admission(jobs=100000)
+    bench_paging()
+    bench_tlb()
+    bench_stack_distance()
+    bench_translate_batch()
+    bench_cpu_policies()
+    bench_cfs()
+    bench_edf()
+    bench_multicore()
+    bench_disk()
+    bench_disk_merge()
+    bench_system()
+    bench_replay()
+    bench_calendar()
+    bench_workload()
+    bench_simulation()
+    bench_config_startup()
+
+if __name__ == '__main__':
+    main()
@@ -10,95 +10,146 @@
 #					and memory management parameters.
 #	 				Prompts user for commands in command lineand performs 
 #					actions on system devices, queues and processes 
-#					based on input.
+#					based on input, through the headless System API.
 
 from __future__ import division
 import sys
 import cmd
-from math import ceil
 
 import sys_gen
-import io 
+import msg 
 import devices
 import queues
-from pcb import PCB
-from memory import LongTermScheduler, InvalidProcess
+from pcb import parse_rw
+from memory import InvalidProcess, admission_policies
+from paging import replacement_policies
+from tlb import TLB, tlb_policies
+from system import System
+
+def generate_system():
+	"""
+	Prompts user for devices & system parameters. Returns new System
+	"""
+	## SYS GEN PHASE: Set up queues & devices in system
+	all_devices = sys_gen.generate()
+
+  	# Set up history parameter alpha & initial bust estimate tau with valid values
+ 	print msg.sys_mode("Initialize CPU Scheduling Parameters",'-')
+
+	set_alpha = False
+	while not set_alpha:
+		try: 
+			a = float(raw_input("History Parameter >>> "))
+			if a < 0 or a > 1: raise ValueError
+			alpha = a
+			set_alpha = True
+		except ValueError: 
+			print msg.err("Please enter a number between 0 and 1")
+		except OverflowError:
+			print msg.err("Overflow error: Please enter a shorter number")
+
+	tau = msg.get_valid_int("Initial Burst Estimate")
+
+	# Each core has its own ready queue
+	cores = msg.get_valid_int("Number of CPU Cores")
+
+	# Shortest job first using burst estimates, multi-level feedback
+	# queue with a time quantum for each level, completely fair
+	# scheduling by virtual runtime, or earliest deadline first
+	cpu_policy = msg.get_valid_choice("CPU Scheduling Policy", sorted(devices.cpu_policies), "sjf")
+	cpu_options = {}
+	if cpu_policy == "mlfq":
+		levels = msg.get_valid_int("Number of Queue Levels")
+		cpu_options["quanta"] = [msg.get_valid_int("Time Quantum for Level " + str(i+1)) for i in range(levels)]
+		cpu_options["boost"] = msg.get_valid_int("Priority Boost Period")
+	elif cpu_policy == "cfs":
+		cpu_options["latency"] = msg.get_valid_int("Target Latency")
+		cpu_options["min_granularity"] = msg.get_valid_int("Minimum Granularity")
+
+	# Set up memory size & page size
+	print msg.sys_mode("Initialize Memory Parameters",'-')
+
+	# Get page & mem size. Verify page size is a power of two and a factor of memory size.
+	set_size = False
+	while not set_size: 
+		total_mem_size = msg.get_valid_int("Total Memory Size")
+		page_size = msg.get_pow_two("Page Size")
+		if total_mem_size % page_size == 0: 
+			set_size = True
+		else: 
+			print msg.err("Memory size must be divisible by page size")
+
+	# Get & verify maximum process size
+	set_proc_size = False
+	while not set_proc_size: 
+		max_proc_size = msg.get_valid_int("Maximum Process Size")
+		if max_proc_size <= total_mem_size: 
+			set_proc_size = True
+		else: 
+			print msg.err("Maximum process size cannot be larger than total memory")
+
+	# How jobs in the job pool are picked when memory is freed
+	admission = msg.get_valid_choice("Job Pool Admission Policy", sorted(admission_policies), "largest")
+
+	# Load whole processes up front, or demand page with a replacement policy
+	paging = msg.get_valid_choice("Page Replacement Policy", ["none"] + sorted(replacement_policies), "none")
+	if paging == "none":
+		paging = None
+
+	# Set up TLB, if simulating one
+	tlb = None
+	if msg.get_valid_choice("Simulate TLB", ["y", "n"], "n") == "y":
+		set_tlb = False
+		while not set_tlb:
+			entries = msg.get_valid_int("TLB Entries")
+			ways = msg.get_valid_int("TLB Associativity")
+			if entries % ways == 0:
+				set_tlb = True
+			else:
+				print msg.err("Number of TLB entries must be a multiple of associativity")
+		policy = msg.get_valid_choice("TLB Eviction Policy", sorted(tlb_policies), "lru")
+		asid = msg.get_valid_choice("Tag TLB entries with ASID or flush on context switch", ["asid", "flush"], "asid") == "asid"
+		tlb = TLB(entries, ways, policy, asid)
+
+	# Set up long term scheduler (with RAM & job pool), CPU & registry
+	return System(all_devices, alpha, tau, total_mem_size, page_size, max_proc_size,
+		cores, cpu_policy, cpu_options, admission, paging, tlb)
 
 class SysCommand(cmd.Cmd):
 
-	def __init__(self, completekey = None):
+	def __init__(self, completekey = None, system = None):
 		cmd.Cmd.__init__(self, completekey = None)
 		self.prompt = " >>> "
 
-		## SYS GEN PHASE: Set up queues & devices in system
-		self.all_devices = sys_gen.generate()
-
-  		# Set up history parameter alpha & initial bust estimate tau with valid values
- 		print io.sys_mode("Initialize CPU Scheduling Parameters",'-')
-
-		set_alpha = False
-		while not set_alpha:
-			try: 
-				a = float(raw_input("History Parameter >>> "))
-				if a < 0 or a > 1: raise ValueError
-				self.alpha = a
-				set_alpha = True
-			except ValueError: 
-				print io.err("Please enter a number between 0 and 1")
-			except OverflowError:
-				print io.err("Overflow error: Please enter a shorter number")
-
-		self.tau = io.get_valid_int("Initial Burst Estimate")
-
-		# Set up memory size & page size
-		print io.sys_mode("Initialize Memory Parameters",'-')
-
-		# Get page & mem size. Verify page size is a power of two and a factor of memory size.
-		set_size = False
-		while not set_size: 
-			self.total_mem_size = io.get_valid_int("Total Memory Size")
-			self.page_size = io.get_pow_two("Page Size")
-			if self.total_mem_size % self.page_size == 0: 
-				set_size = True
-			else: 
-				print io.err("Memory size must be divisible by page size")
-
-		# Get & verify maximum process size
-		set_proc_size = False
-		while not set_proc_size: 
-			self.max_proc_size = io.get_valid_int("Maximum Process Size")
-			if self.max_proc_size <= self.total_mem_size: 
-				set_proc_size = True
-			else: 
-				print io.err("Maximum process size cannot be larger than total memory")
-
-		# Set up long term scheduler. This will also set up RAM & job pool
-		self.lts = LongTermScheduler(self.total_mem_size, self.page_size)
-
-		# Set up CPU & PID
-		self.cpu = devices.CPU()
-		self.pid_count = 0
-
-		# Set up system stats
-		self.completed = 0
-		self.total_cpu_time = 0
-		self.avg_cpu_time = 0
+		## SYS GEN PHASE: Set up system from prompts, unless already set up
+		self.system = system or generate_system()
 
 		# Print out list of devices to console
-		print io.sys_mode("System Generation Complete")
+		print msg.sys_mode("System Generation Complete")
 		print "Your system is now running with the following devices: "
-		print io.ruler(38)
+		print msg.ruler(38)
 		print "{:<10}{:<28}".format("DEV NAME", "DEV TYPE")
-		print io.ruler(38)
-		for dev in self.all_devices: 
+		print msg.ruler(38)
+		for dev in self.system.all_devices: 
 			print "{:<10}{:<28}".format(dev.get_dev_name(), dev.get_dev_type())
 
 		## Now in the RUNNING PHASE
-		print io.sys_mode("System running")
+		print msg.sys_mode("System running")
 		print "Input a command to start a process in the system."
 		print "-- Type H or h to view a list of valid commands" + "\n"
 
 
+	## Prompting for time since last interrupt
+
+	def time_passed(self):
+		"""
+		Prompts for time since last interrupt, if the CPU has been running
+		or is holding processes until their release
+		"""
+		if self.system.cpu.busy() or self.system.cpu.held():
+			return msg.get_valid_int("Time since last interrupt")
+		return 0
+
 	## User Command: New process
 	def do_a(self, args):
 		"""
@@ -108,20 +159,25 @@ class SysCommand(cmd.Cmd):
 		go to job pool. 
 		"""
 
-		procsize = io.get_valid_int("Process size")
-		if procsize > self.total_mem_size: 
-			print io.err("Proccess cannot be larger than total memory")
-		elif procsize > self.max_proc_size: 
-			print io.err("Proccess cannot be larger than maximum process size of " + str(self.max_proc_size))
-		else: 
-			# Create new process
-			self.pid_count += 1
-			pages = int(ceil(procsize / self.page_size))
-			new_proc = PCB(self.pid_count, procsize, pages, self.page_size, self.alpha, self.tau)
-
-			# If enough memory, new process can run, else goes to job pool
-			if self.lts.schedule(new_proc): 
-				self.cpu.enqueue(new_proc)
+		procsize = msg.get_valid_int("Process size")
+		try:
+			self.system.check_process_size(procsize)
+		except ValueError as e:
+			print msg.err(str(e))
+			return
+
+		nice = deadline = period = None
+		if self.system.cpu_policy == "cfs":
+			nice = msg.get_int_in_range("Nice Value", -20, 19, 0)
+		elif self.system.cpu_policy == "edf":
+			# 0 for a process without deadline, or a one-off burst
+			deadline = msg.get_int_in_range("Relative Deadline", 0, default=0)
+			if deadline:
+				period = msg.get_int_in_range("Period", 0, default=0)
+
+		# Only prompt for time if process will go to the CPU, not the job pool
+		elapsed = self.time_passed() if self.system.lts.ram.fits(procsize) else 0
+		self.system.new_process(procsize, elapsed, nice, deadline, period)
 
 	## User Command: Terminate Process
 	def do_t(self, args):
@@ -132,36 +188,14 @@ class SysCommand(cmd.Cmd):
 		Update and print system statistics (Number of completed processes and
 		average CPU time per process)
 		"""
-		try:
-			proc = self.cpu.get_active_process()
-
-			# Deallocate memory with long term scheduler
-			# This will also allocate any freed memory to anything in job pool
-			# and return a list of processes that it has allocated memory too
-			new_procs = self.lts.terminate(proc.pid)
-
-			# Terminate current process
-			self.cpu.terminate()
-
-			# Enqueue all new processes to ready queue
-			# No need to update burst time
-			if new_procs: 
-				for p in new_procs: 
-					self.cpu.enqueue(p, False)
-
-			# Update system stats with total CPU time for terminated process
-			self.total_cpu_time += proc.tot_burst_time()
-			self.completed += 1
-			if self.completed == 0: 
-				self.avg_cpu_time = 0
-			else:
-				self.avg_cpu_time = self.total_cpu_time / self.completed
+		if not self.system.cpu.busy():
+			print msg.nothing_in_cpu()
+			return
 
-			# Print system stats
-			self.print_system_stats()
+		self.system.terminate(self.time_passed())
 
-		except IndexError as e: 
-			print io.nothing_in_cpu()
+		# Print system stats
+		self.print_system_stats()
 
 	def kill(self, pid): 
 		try:
@@ -169,31 +203,20 @@ class SysCommand(cmd.Cmd):
 			pid = int(pid)
 			if not isinstance(pid, (int, long)) or pid <= 0: raise ValueError
 
-			# Look for process in devices and terminate when found
-			if self.cpu.contains(pid):
-				self.cpu.terminate(pid)
-
-			else: 
-				for dev in self.all_devices:
-					if dev.contains(pid): 
-						dev.terminate(pid)
+			# Time only passes for processes running in the CPU or a device,
+			# not the job pool
+			dev = self.system.registry.get_device(pid)
+			elapsed = 0
+			if dev is not None and dev is not self.system.lts.job_pool:
+				elapsed = self.time_passed()
 
-						if self.cpu.active: 
-							elapsed = io.get_valid_int("Time since last interrupt")
-							self.cpu.active.update_burst_time(elapsed)
-
-			# Deallocate memory for process and reallocate memory
-			# No need to update burst time
-			new_procs = self.lts.terminate(pid)
-			if new_procs: 
-				for p in new_procs: 
-					self.cpu.enqueue(p, False)
+			self.system.kill(pid, elapsed)
 
 		except ValueError as e:
-			print io.err("Please enter a valid positive integer")
+			print msg.err("Please enter a valid positive integer")
 		except InvalidProcess: 
 			# Process not found in job pool or in memory
-			print io.err("Process does not exist")
+			print msg.err("Process does not exist")
 
 	## User Command: Queue Snapshot
 	def do_s(self, args):
@@ -203,34 +226,38 @@ class SysCommand(cmd.Cmd):
 		"""
 
 		# Request device type from user
-		print io.sys_mode("Snapshot Mode")
+		print msg.sys_mode("Snapshot Mode")
 		print "Enter the first letter of a device type to view the queues of all devices of"
-		print "that type." + "\n"
+		print "that type, or a PID to view a single process." + "\n"
 		type_to_snapshot = raw_input("Device Type >>> ").lower()
 
+		# Show a single process
+		if type_to_snapshot.isdigit():
+			self.system.registry.snapshot(int(type_to_snapshot))
+
 		# Show active process in CPU & processes in ready queue 
-		if type_to_snapshot == "r": 
-			self.cpu.snapshot()
-			self.lts.show_job_pool()
+		elif type_to_snapshot == "r": 
+			self.system.cpu.snapshot()
+			self.system.lts.show_job_pool()
 
 		# Show what's in memory
 		elif type_to_snapshot == "m": 
-			self.lts.snapshot()
+			self.system.lts.snapshot()
 
 		# Show processes in device 
-		elif type_to_snapshot in [d.get_dev_type()[0].lower() for d in self.all_devices]:
+		elif type_to_snapshot in [d.get_dev_type()[0].lower() for d in self.system.all_devices]:
 
-			for dev in self.all_devices: 
+			for dev in self.system.all_devices: 
 				if type_to_snapshot == dev.get_dev_type()[0].lower(): 
 					dev.snapshot()
 
 		else: 
-			print io.err("Unknown device type")
+			print msg.err("Unknown device type")
 
 		# Print system stats
 		self.print_system_stats()
 
-		print io.sys_mode("Exiting Snapshot Mode")
+		print msg.sys_mode("Exiting Snapshot Mode")
 
 
 	## User Command: Device request or unknown (Invalid) command
@@ -244,58 +271,82 @@ class SysCommand(cmd.Cmd):
 			return self.kill(self.lastcmd.lower()[1:]) 
 
 		# User requests or ends a device
-		device_found = False 
-
-		for dev in self.all_devices:
-			if dev.is_device_name(self.lastcmd.lower()): 
-				device_found = True
-
-				if self.lastcmd.islower(): # SYSTEM CALL (lowercase input)
-
-				# Get active process from CPU, replace with head of ready queue
-					try: 
-						proc = self.cpu.dequeue()
-					except IndexError: 
-						print io.nothing_in_cpu()
-						break
-
-					# Prompt user for and set PCB params 
+		dev = self.system.device(self.lastcmd.lower())
+		if dev is None:
+			print msg.invalid_command()
 
-					print io.sys_mode("Set system call parameters")
-					proc.set_syst_call_params()
-					proc.set_read_write_params(dev.get_dev_type())
-
-					if (dev.get_dev_type().lower() == "disk drive"):
-						proc.set_cylinder_params(dev.get_num_cylinders())
-
-					print io.sys_mode("System call parameters set")
-
-					# Add process to back of device queue
-					dev.enqueue(proc)
-
-				else:  # INTERRUPT  (uppercase input)
-					# Process at head of device queue complete
-					# Remove from device queue, move to back of ready queue
-					try: 
-						proc = dev.dequeue()
-						print "%s completed %s" %(dev, proc)
-						self.cpu.enqueue(proc)
-					except IndexError:
-						print io.err("{!s} queue is empty".format(dev))		
+		elif self.lastcmd.islower(): # SYSTEM CALL (lowercase input)
+			try: 
+				proc = self.system.cpu.get_active_process()
+			except IndexError: 
+				print msg.nothing_in_cpu()
+				return
+			elapsed = self.time_passed()
+
+			# Prompt user for PCB params, then move process from CPU to
+			# back of device queue
+			print msg.sys_mode("Set system call parameters")
+			params = self.syscall_params(proc, dev)
+			print msg.sys_mode("System call parameters set")
+
+			self.system.syscall(dev.get_dev_name(), elapsed, *params)
+
+		else:  # INTERRUPT  (uppercase input)
+			# Process at head of device queue complete
+			# Remove from device queue, move to back of ready queue
+			# Disk drives may complete several merged requests at once.
+			# Only prompt for time since last interrupt once
+			if not dev.length():
+				print msg.err("{!s} queue is empty".format(dev))
+			else:
+				self.system.interrupt(dev.get_dev_name(), self.time_passed())
 
-		if not device_found: 
-			print io.invalid_command()
+	def syscall_params(self, proc, dev):
+		"""
+		Prompts for & validates system call params of process requesting
+		given device. Returns (file, address, rw, length, cylinder)
+		"""
+		file_name = raw_input("File Name >>> ")
+
+		address = msg.get_valid_hex("Starting Memory Location in Hex")
+		while not proc.valid_address(address):
+			print msg.err("Invalid starting memory location")
+			address = msg.get_valid_hex("Starting Memory Location in Hex")
+
+		rw = "w"
+		if dev.get_dev_type().lower() != "printer":
+			rw = parse_rw(raw_input("Read or Write? >>> "))
+			while rw is None:
+				print msg.err("Invalid read/write parameters")
+				print "Please enter either 'r', 'read', 'w' or 'write'"
+				rw = parse_rw(raw_input("Read or Write? >>> "))
+
+		length = None
+		if rw == "w":
+			length = msg.get_valid_int("File Length")
+			while length + address > proc.proc_size:
+				print msg.err("Invalid length (too long)")
+				length = msg.get_valid_int("File Length")
+
+		cyl = None
+		if dev.get_dev_type().lower() == "disk drive":
+			cyl = msg.get_valid_int("Cylinder")
+			while cyl > dev.get_num_cylinders():
+				print "Invalid cylinder number. Please try again."
+				cyl = msg.get_valid_int("Cylinder")
+
+		return file_name, address, rw, length, cyl
 
 	## User Command: Display Help
 	def do_h(self, args): 
 		""" Displays the list of valid command line inputs to user """
-		print io.sys_mode("Help - Commands")
-		print io.command_list()
+		print msg.sys_mode("Help - Commands")
+		print msg.command_list()
 
 	## User Command: Unknown input (special cases)
 	def emptyline(self):
 		""" If empty line is entered, returns invalid input error """
-		print io.invalid_command()
+		print msg.invalid_command()
 
 	def precmd(self, line):
 		""" If > 1 argument entered, returns invalid input error """
@@ -319,8 +370,7 @@ class SysCommand(cmd.Cmd):
 		return True
 
 	def print_system_stats(self):
-		print "\n" + "{:-^78}".format(" Completed Processes Report ")
-		print "Total Completed: {:<5} Avg Total CPU Time: {:<5}".format(self.completed, self.avg_cpu_time).center(78, ' ')
+		self.system.print_stats()
 
 	## Command shortcuts & aliases
 	do_A = do_a
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             config.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Builds a system from a config file instead of sys gen
+#                   prompts. The file is JSON (ending in .json) or INI, with
+#                   the same settings in either, one section each:
+#
+#                       [devices]   printers, disk_drives, cd_drives (counts)
+#                                   cylinders (one for every disk drive, or
+#                                   a list with one per disk drive)
+#                                   disk_policy, merge
+#                       [cpu]       alpha, tau, cores, policy
+#                                   quanta, boost (mlfq)
+#                                   latency, min_granularity (cfs)
+#                       [memory]    size, page_size, max_proc_size,
+#                                   admission, paging
+#                       [tlb]       entries, ways, policy, asid (optional:
+#                                   no TLB if the section is missing)
+#                       [workload]  seed, jobs, arrivals, mean_gap,
+#                                   burstiness, mean_run, bursts, mean_burst,
+#                                   cv, burst_file, mean_io, printer_weight,
+#                                   disk_drive_weight, cd_drive_weight
+#                                   (optional, for python main.py -s)
+#
+#                   Lists are JSON lists or comma separated in INI files.
+#                   Settings are checked against the same rules as the sys
+#                   gen prompts, and settings with defaults there can be
+#                   left out. Any invalid or unknown setting raises a
+#                   ValueError naming it.
+
+from __future__ import division
+import os
+import json
+from ConfigParser import RawConfigParser, Error as ConfigParserError
+
+import sys_gen
+from devices import cpu_policies
+from disk import disk_schedulers
+from memory import admission_policies
+from paging import replacement_policies
+from tlb import TLB, tlb_policies
+from system import System
+from workload import Workload, arrival_processes, burst_distributions, read_bursts
+
+# Config file key of each device type's count, and in [workload], its weight
+device_keys = {
+    "Printer": "printers",
+    "Disk Drive": "disk_drives",
+    "CD/RW": "cd_drives",
+}
+weight_keys = {
+    "Printer": "printer_weight",
+    "Disk Drive": "disk_drive_weight",
+    "CD/RW": "cd_drive_weight",
+}
+
+# Settings allowed in each section
+sections = {
+    "devices": ["cylinders", "disk_policy", "merge"] + device_keys.values(),
+    "cpu": ["alpha", "tau", "cores", "policy", "quanta", "boost", "latency", "min_granularity"],
+    "memory": ["size", "page_size", "max_proc_size", "admission", "paging"],
+    "tlb": ["entries", "ways", "policy", "asid"],
+    "workload": ["seed", "jobs", "arrivals", "mean_gap", "burstiness", "mean_run", "bursts",
+                 "mean_burst", "cv", "burst_file", "mean_io"] + weight_keys.values(),
+}
+
+class Section:
+    """ Settings in one section of a config file, read & checked by type """
+
+    def __init__(self, name, settings):
+        self.name = name
+        self._settings = settings
+
+    def __contains__(self, key):
+        return key in self._settings
+
+    def _get(self, key, default):
+        if key in self._settings:
+            return self._settings[key]
+        if default is None:
+            raise ValueError("[{}] {}: missing".format(self.name, key))
+        return default
+
+    def error(self, key, problem):
+        return ValueError("[{}] {}: {}".format(self.name, key, problem))
+
+    def number(self, key, lo, hi=None, default=None):
+        """ Number from lo to hi (inclusive), or any number from lo up if hi is None """
+        value = self._get(key, default)
+        try:
+            if isinstance(value, bool):
+                raise ValueError
+            value = float(value)
+        except (TypeError, ValueError):
+            raise self.error(key, "must be a number")
+        if value < lo or (hi is not None and value > hi):
+            raise self.error(key, "must be from {}".format(lo) + (" to {}".format(hi) if hi is not None else " up"))
+        return value
+
+    def whole(self, key, lo=1, default=None):
+        """ Whole number from lo up: a positive integer by default, as for sys gen prompts """
+        value = self._get(key, default)
+        try:
+            if isinstance(value, (bool, float)):
+                raise ValueError
+            value = int(value)
+        except (TypeError, ValueError):
+            raise self.error(key, "must be a whole number")
+        if value < lo:
+            raise self.error(key, "must be {} or more".format(lo))
+        return value
+
+    def wholes(self, key, default=None):
+        """ Non-empty list of positive integers """
+        value = self._get(key, default)
+        if isinstance(value, basestring):
+            value = [v.strip() for v in value.split(",")]
+        elif not isinstance(value, list):
+            value = [value]
+        if not value:
+            raise self.error(key, "must not be empty")
+        items = Section(self.name + "." + key, dict(enumerate(value)))
+        return [items.whole(i) for i in xrange(len(value))]
+
+    def text(self, key, default=None):
+        return str(self._get(key, default))
+
+    def choice(self, key, choices, default=None):
+        value = str(self._get(key, default)).lower()
+        if value not in choices:
+            raise self.error(key, "must be one of " + ", ".join(sorted(choices)))
+        return value
+
+    def flag(self, key, default=None):
+        """ Yes or no: true/false in JSON, or y/yes/true/1 & n/no/false/0 in INI """
+        value = self._get(key, default)
+        if isinstance(value, bool):
+            return value
+        value = str(value).lower()
+        if value in ("y", "yes", "true", "1"):
+            return True
+        if value in ("n", "no", "false", "0"):
+            return False
+        raise self.error(key, "must be yes or no")
+
+## Reading config files
+
+def read(path):
+    """
+    Returns settings in config file at given path, as a dict of section
+    name -> dict of settings. Raises IOError if it can't be read and
+    ValueError if it isn't valid JSON or INI, or has unknown settings.
+    """
+    if path.lower().endswith(".json"):
+        with open(path) as f:
+            settings = json.load(f)
+        if not isinstance(settings, dict) or not all(isinstance(s, dict) for s in settings.values()):
+            raise ValueError("Config must be an object of sections, each an object of settings")
+    else:
+        parser = RawConfigParser()
+        try:
+            with open(path) as f:
+                parser.readfp(f)
+        except ConfigParserError as e:
+            raise ValueError(str(e))
+        settings = dict((s, dict(parser.items(s))) for s in parser.sections())
+
+    for name, section in settings.iteritems():
+        if name not in sections:
+            raise ValueError("[{}]: unknown section".format(name))
+        for key in section:
+            if key not in sections[name]:
+                raise ValueError("[{}] {}: unknown setting".format(name, key))
+
+    # Relative burst file paths are relative to the config file
+    if "burst_file" in settings.get("workload", {}):
+        burst_file = settings["workload"]["burst_file"]
+        settings["workload"]["burst_file"] = os.path.join(os.path.dirname(path), burst_file)
+    return settings
+
+## Building the system
+
+def devices(settings):
+    """ Returns list of all devices in [devices] """
+    s = Section("devices", settings.get("devices", {}))
+
+    counts = dict((t, s.whole(key)) for t, key in device_keys.iteritems())
+    disks = counts["Disk Drive"]
+
+    cylinders = s.wholes("cylinders")
+    if len(cylinders) == 1:
+        cylinders *= disks
+    elif len(cylinders) != disks:
+        raise s.error("cylinders", "must be one number, or one for each of {} disk drives".format(disks))
+
+    policy = s.choice("disk_policy", disk_schedulers, "flook")
+    merge = s.flag("merge", False)
+    return sys_gen.make_devices(counts, cylinders, policy, merge)
+
+def build(settings):
+    """
+    Returns new System with devices, CPU, memory & TLB in settings (as
+    returned by read). Raises ValueError for invalid settings.
+    """
+    all_devices = devices(settings)
+
+    # CPU scheduling parameters
+    cpu = Section("cpu", settings.get("cpu", {}))
+    alpha = cpu.number("alpha", 0, 1)
+    tau = cpu.whole("tau")
+    cores = cpu.whole("cores")
+    cpu_policy = cpu.choice("policy", cpu_policies, "sjf")
+    cpu_options = {}
+    if cpu_policy == "mlfq":
+        cpu_options["quanta"] = cpu.wholes("quanta")
+        cpu_options["boost"] = cpu.whole("boost")
+    elif cpu_policy == "cfs":
+        cpu_options["latency"] = cpu.whole("latency")
+        cpu_options["min_granularity"] = cpu.whole("min_granularity")
+
+    # Memory size & page size. Page size is a power of two and a factor of
+    # memory size, and processes can't be larger than memory
+    mem = Section("memory", settings.get("memory", {}))
+    total_mem_size = mem.whole("size")
+    page_size = mem.whole("page_size")
+    if page_size & (page_size - 1):
+        raise mem.error("page_size", "must be a power of two")
+    if total_mem_size % page_size:
+        raise mem.error("size", "must be divisible by page size")
+    max_proc_size = mem.whole("max_proc_size")
+    if max_proc_size > total_mem_size:
+        raise mem.error("max_proc_size", "cannot be larger than total memory")
+    admission = mem.choice("admission", admission_policies, "largest")
+    paging = mem.choice("paging", ["none"] + replacement_policies.keys(), "none")
+    if paging == "none":
+        paging = None
+
+    # TLB, if simulating one
+    tlb = None
+    if "tlb" in settings:
+        t = Section("tlb", settings["tlb"])
+        entries = t.whole("entries")
+        ways = t.whole("ways")
+        if entries % ways:
+            raise t.error("entries", "must be a multiple of associativity")
+        tlb = TLB(entries, ways, t.choice("policy", tlb_policies, "lru"), t.flag("asid", True))
+
+    return System(all_devices, alpha, tau, total_mem_size, page_size, max_proc_size,
+                  cores, cpu_policy, cpu_options, admission, paging, tlb)
+
+def workload(settings, system):
+    """
+    Returns Workload in [workload] for system, or None if there isn't
+    one. Raises ValueError for invalid settings, or IOError if its burst
+    file can't be read.
+    """
+    if "workload" not in settings:
+        return None
+    w = Section("workload", settings["workload"])
+
+    arrivals = w.choice("arrivals", arrival_processes, "poisson")
+    arrival_options = {}
+    if arrivals == "bursty":
+        arrival_options["burstiness"] = w.number("burstiness", 1, default=10)
+        arrival_options["mean_run"] = w.number("mean_run", 1, default=20)
+
+    bursts = w.choice("bursts", burst_distributions, "exponential")
+    burst_options = {}
+    mean_burst = None
+    if bursts == "trace":
+        with open(w.text("burst_file")) as f:
+            burst_options["samples"] = read_bursts(f)
+        try:
+            burst_distributions[bursts](None, None, **burst_options)
+        except ValueError as e:
+            raise w.error("burst_file", str(e))
+    else:
+        mean_burst = w.number("mean_burst", 0.001, default=10)
+        if bursts == "hyperexponential":
+            burst_options["cv"] = w.number("cv", 1, default=2)
+
+    mix = dict((t, w.number(key, 0, default=1)) for t, key in weight_keys.iteritems())
+
+    return Workload(system.all_devices, system.max_proc_size, w.whole("seed", 0, 1),
+                    w.whole("jobs", 0, 0) or None, arrivals, w.number("mean_gap", 0.001, default=40),
+                    arrival_options, bursts, mean_burst, burst_options,
+                    w.number("mean_io", 0, default=2), mix)
@@ -9,11 +9,13 @@
 #                   methods allowing user to see/change what process(es) a
 #                   device is running or are in the device queue. 
 
+from __future__ import division
 import sys
-from collections import deque
-import io
-from queues import FIFOQueue, PriorityQueue
-from pcb import PCB
+from array import array
+import msg
+from queues import Queue, FIFOQueue, PriorityQueue, by_est_burst, by_vruntime, by_deadline, by_release
+from disk import disk_schedulers
+from pcb import PCB, nice_0_weight
 
 class Device(FIFOQueue):
 
@@ -44,6 +46,10 @@ class Device(FIFOQueue):
         proc.clear_params()
         return proc
 
+    def dequeue_all(self):
+        """ Remove and return list of processes completed by one interrupt """
+        return [self.dequeue()]
+
     ## Methods to print device in human readable form to console
 
     def __repr__(self):
@@ -56,7 +62,7 @@ class Device(FIFOQueue):
 
     def snapshot(self):
         """ Prints all processes in queue to console """
-        print io.snapshot_header(self._dev_name)
+        print msg.snapshot_header(self._dev_name)
         FIFOQueue.snapshot(self)
 
     ## Methods to check/return device name/type
@@ -73,21 +79,49 @@ class Device(FIFOQueue):
     def get_dev_name(self):
         return self._dev_name
 
-class DiskDrive(PriorityQueue):
+class DiskDrive(Queue):
     """
-    Initializes new disk drive with device name and two empty queues
-    to implement FLOOK disk scheduling
+    Initializes new disk drive with device name, number of cylinders and
+    disk scheduling policy (F-LOOK by default). Drive head starts at
+    cylinder 0, moving up.
+
+    If merge is set, a new request on the same or an adjacent cylinder to a
+    pending request, or reading the same file as a pending read, is merged
+    with it. Merged requests are completed together by one service.
     """ 
 
-    def __init__(self, dname, cyl):
+    # Requests at most this many cylinders apart can be merged
+    merge_gap = 1
+
+    def __init__(self, dname, cyl, policy="flook", merge=False):
 
         self._dev_type = "Disk Drive"
         self._dev_name = dname
         self._cylinders = cyl
 
-        # Two priority queues to implement FSCAN. Q2 is frozen
-        self._q1 = PriorityQueue()
-        self._q2 = PriorityQueue(True)
+        # Pending requests, held & ordered by scheduling policy
+        self._policy = policy
+        self._q = disk_schedulers[policy](cyl)
+
+        # Only the first request of a merged group (its lead) is scheduled.
+        # Maps lead pid -> requests merged with it, merged pid -> lead, and
+        # file name -> lead of group with a pending read of that file
+        self._merge = merge
+        self._group = {}
+        self._lead = {}
+        self._reads = {}
+
+        # Head position & direction (1 up, -1 down), and seek distance of
+        # each service
+        self.head = 0
+        self.direction = 1
+        self.total_seek = 0
+        self.seeks = array('l')
+
+        # Requests completed along with the lead of their merged group, and
+        # seeks saved by not servicing them separately
+        self.merged = 0
+        self.seeks_saved = 0
 
     ## Methods to check/return device properties
 
@@ -107,66 +141,154 @@ class DiskDrive(PriorityQueue):
         return self._dev_type
 
     def contains(self,pid):
-        return (self._q1.contains(pid) or self._q2.contains(pid))
+        return pid in self._q or pid in self._lead
+
+    def length(self):
+        """ Number of pending requests, including those merged with another """
+        return len(self._q) + len(self._lead)
+
+    def _place(self, proc, queue):
+        if self._registry is not None:
+            self._registry.place(proc, self, queue)
 
     ## Scheduling methods
 
     def enqueue(self, proc):
         """
-        Enqueue processes to unfrozen queue. Update process location.
-        If frozen queue is empty, unfreeze and freeze other queue
-
+        Add request to pending requests, or merge with a pending request.
+        Update process location.
         """
-        if self._q1.is_frozen(): #Q1 is frozen, add to Q2
-            proc.set_proc_loc(self._dev_name)
-            self._q2.enqueue(proc)
-            if self._q1.empty():
-                self._q2.freeze()
-                self._q1.unfreeze()
+        proc.set_proc_loc(self._dev_name)
+        params = proc.params
+
+        lead = None
+        if self._merge:
+            if params["rw"] == "r":
+                lead = self._reads.get(params["file"])
+            if lead is None:
+                lead = self._q.near(params["cyl"], self.merge_gap)
+
+        if lead is None:
+            self._place(proc, self._q.add(proc))
+            lead = proc
+        else:
+            self._group.setdefault(lead.pid, []).append(proc)
+            self._lead[proc.pid] = lead
+            if self._registry is not None:
+                self._place(proc, self._registry.lookup(lead.pid)[2])
 
-        else: #Q2 frozen, add to Q1
-            proc.set_proc_loc(self._dev_name)
-            self._q1.enqueue(proc)
-            if self._q2.empty():
-                self._q1.freeze()
-                self._q2.unfreeze()
+        if self._merge:
+            self._remember_reads([proc], lead)
 
-    def dequeue(self):
+    def _service(self):
+        """ Remove next request chosen by scheduling policy, moving head to its cylinder """
+        if not self._q:
+            raise IndexError
+
+        proc, self.head, self.direction, seek = self._q.next(self.head, self.direction)
+        self.total_seek += seek
+        self.seeks.append(seek)
+        return proc
+
+    def _done(self, proc):
+        """ Request has left drive """
+        self._removed(proc)
+        proc.clear_params()
+        return proc
+
+    def _forget_reads(self, procs, lead):
+        """ Requests have left group of given lead """
+        for p in procs:
+            if self._reads.get(p.params["file"]) is lead:
+                del self._reads[p.params["file"]]
+
+    def _remember_reads(self, procs, lead):
+        """ Requests are now in group of given lead """
+        for p in procs:
+            if p.params["rw"] == "r":
+                self._reads.setdefault(p.params["file"], lead)
+
+    def _promote(self, lead):
+        """
+        Lead of group is leaving drive on its own. Oldest request merged
+        with it becomes lead of the rest and is scheduled in its place.
         """
-        Remove and return process at head of frozen queue. Clear any
-        parameters passed when queued.
+        group = self._group.pop(lead.pid, [])
+        self._forget_reads([lead] + group, lead)
+        if group:
+            new = group.pop(0)
+            del self._lead[new.pid]
+            queue = self._q.add(new)
+            self._place(new, queue)
+            if group:
+                self._group[new.pid] = group
+            for p in group:
+                self._lead[p.pid] = new
+                self._place(p, queue)
+            self._remember_reads([new] + group, new)
 
-        Only dequeue processes from whichever queue is frozen. If dequeuing
-        empties queue, freeze queue and unfreeze other queue
+    def dequeue(self):
+        """
+        Remove and return next request chosen by scheduling policy, moving
+        head to its cylinder. Clear any parameters passed when queued.
+        Requests merged with it stay pending, see dequeue_all.
         """ 
-        if self._q1.is_frozen():
-            proc = self._q1.dequeue()
-            if self._q1.empty():
-                self._q2.freeze()
-                self._q1.unfreeze()
+        proc = self._service()
+        self._promote(proc)
+        return self._done(proc)
 
-        else: 
-            proc = self._q2.dequeue()
-            if self._q2.empty():
-                self._q1.freeze()
-                self._q2.unfreeze()
+    def dequeue_all(self):
+        """
+        Remove next request chosen by scheduling policy and return list of
+        it and all requests merged with it, which are completed together.
+        """
+        proc = self._service()
+        group = [proc] + self._group.pop(proc.pid, [])
+
+        if len(group) > 1:
+            self.merged += len(group) - 1
+            self.seeks_saved += len(group) - 1
+            for p in group[1:]:
+                del self._lead[p.pid]
+        self._forget_reads(group, proc)
+
+        return [self._done(p) for p in group]
+
+    def pop(self, pid):
+        """ Remove and return request of process with given pid """
+        if pid in self._lead:
+            lead = self._lead.pop(pid)
+            group = self._group[lead.pid]
+            proc = next(p for p in group if p.pid == pid)
+            group.remove(proc)
+            if not group:
+                del self._group[lead.pid]
+            self._forget_reads([proc], lead)
+            self._remember_reads([lead] + group, lead)
+            self._removed(proc)
+            return proc
 
-        proc.clear_params()
+        proc = self._q.remove(pid)
+        if proc:
+            self._promote(proc)
+            self._removed(proc)
         return proc
 
     def terminate(self, pid):
-        if self._q1.contains(pid): 
-            self._q1.terminate(pid)
-            if self._q1.is_frozen() and self._q1.empty():
-                self._q1.unfreeze()
-                self._q2.freeze()
-        elif self._q2.contains(pid):
-            self._q2.terminate(pid)
-            if self._q2.is_frozen() and self._q2.empty():
-                self._q2.unfreeze()
-                self._q1.freeze()
-        else:
+        if not self.contains(pid):
             raise IndexError
+        Queue.terminate(self, pid)
+
+    ## Seek stats
+
+    def requests_serviced(self):
+        return len(self.seeks)
+
+    def avg_seek(self):
+        return self.total_seek / len(self.seeks) if self.seeks else 0
+
+    def max_seek(self):
+        return max(self.seeks) if self.seeks else 0
 
      ## Methods to print device in human readable form to console
 
@@ -181,139 +303,247 @@ class DiskDrive(PriorityQueue):
         """
         Prints active processes in disk drive queue, in order they will be processed
         """
-        print io.snapshot_header(self._dev_name)
-
-        if self._q1.empty() and self._q2.empty():
+        print msg.snapshot_header(self._dev_name)
+        print "{}  Head: {} ({})  Serviced: {}  Total Seek: {}  Avg Seek: {:.2f}".format(
+            self._policy.upper(), self.head, "up" if self.direction > 0 else "down",
+            self.requests_serviced(), self.total_seek, self.avg_seek()).center(78)
+        if self._merge:
+            print "Merged Requests: {}  Seeks Saved: {}".format(self.merged, self.seeks_saved).center(78)
+
+        if not self._q:
             print '{:^78}'.format("EMPTY: No processes in queue")
         else:
-            if self._q1.is_frozen():
-                print io.snapshot_header("PROCESSING [FROZEN]", "-")
-                self._q1.snapshot()
-                print io.snapshot_header("NEW REQUESTS", "-")
-                self._q2.snapshot()
-            else:
-                print io.snapshot_header("PROCESSING [FROZEN]", "-")
-                self._q2.snapshot()
-                print io.snapshot_header("NEW REQUESTS", "-")
-                self._q1.snapshot()
+            for title, procs in self._q.sections(self.head, self.direction):
+                if title:
+                    print msg.snapshot_header(title, "-")
+                Queue.snapshot(self, self._with_merged(procs))
+
+    def _with_merged(self, procs):
+        """ Yields each request followed by requests merged with it """
+        for p in procs:
+            yield p
+            for m in self._group.get(p.pid, ()):
+                yield m
 
 class CPU(PriorityQueue): 
 
-    def __init__(self):
+    def __init__(self, tlb=None):
         """
         Initializes CPU with no active processes and empty non-frozen
-        Priority Queue
+        Priority Queue, and optionally a TLB
         """ 
         self.active = None
         self._dev_name = "CPU"
-        PriorityQueue.__init__(self)
+        self.tlb = tlb
+        PriorityQueue.__init__(self, key=by_est_burst)
+
+        # Time since system started, counted from time entered at each
+        # interrupt, and totals of response time (from arrival in CPU until
+        # first run) & turnaround time (from arrival until termination)
+        self.clock = 0
+        self.responses = 0
+        self.response_total = 0
+        self.completions = 0
+        self.turnaround_total = 0
 
     def empty(self):
         return True if self.active else False
 
     def contains(self, pid): 
-        # CPU is empty
-        if not self.active: 
-            return False
-        if pid == self.active.pid: 
+        if self.active and pid == self.active.pid: 
             return True
         else: 
-            return PriorityQueue.contains(self,pid)
+            return self._in_ready(pid)
+
+    ## Ready queue. Other scheduling policies override these
+
+    def _ready(self, proc):
+        """ Inserts process into ready queue """
+        PriorityQueue.enqueue(self, proc)
+
+    def _take_ready(self):
+        """ Removes & returns next process to run from ready queue, or None """
+        return PriorityQueue.dequeue(self) if self._q else None
+
+    def _pop_ready(self, pid):
+        return PriorityQueue.pop(self, pid)
+
+    def _in_ready(self, pid):
+        return PriorityQueue.contains(self, pid)
+
+    def _head(self):
+        return PriorityQueue.head(self)
+
+    def _before(self, p, q):
+        """ True if process p should run before process q """
+        return p.next_est_burst < q.next_est_burst
+
+    def _run(self, elapsed):
+        """ Active process has run for elapsed time """
+        self.active.update_burst_time(elapsed)
+
+    def _used(self, proc, burst):
+        """ Process is leaving CPU after running for burst """
+        pass
+
+    def time_to_preempt(self):
+        """
+        Time until the scheduling policy may preempt the active process, or
+        release a held process, on its own without another process
+        arriving, or None if it never does. SJF only preempts when a
+        process arrives.
+        """
+        return None
+
+    def held(self):
+        """
+        Number of processes in CPU that are not ready to run yet. Time
+        passes for them even when the CPU is idle
+        """
+        return 0
 
     ## Methods to modify active process in CPU
 
-    def enqueue(self, proc, updateburst=True):
+    def enqueue(self, proc, elapsed=0):
+        """
+        Adds process to back of ready queue and updates PCB status/location,
+        after elapsed time since last interrupt
+        """
+        if elapsed:
+            # Update burst time for current process
+            self.elapse(elapsed)
+
+        self._add(proc)
+        print proc.status()
+
+    def _add(self, proc):
         """
-        Adds process to back of ready queue and updates PCB status/location 
+        If CPU is idle, process goes straight to CPU. Else inserts process
+        into ready queue, preempting active process if it should run first
         """
+        if proc.arrival is None:
+            proc.arrival = self.clock
+
         if not self.active:
-            # No processes in CPU, process goes straight to CPU
-            # No need to prompt for time
             proc.set_proc_loc(self._dev_name)
-            self.active = proc
+            self.switch_to(proc)
         else:
-            if updateburst: 
-                # Prompt for time since last interrupt
-                elapsed = io.get_valid_int("Time since last interrupt")
-
-                # Update burst time for current process
-                self.active.update_burst_time(elapsed)
-
             # Insert  into ready queue
             proc.set_proc_loc("ready")
-            PriorityQueue.enqueue(self,proc)
+            self._ready(proc)
+            self._preempt()
+
+    def _preempt(self):
+        """
+        Move active process to ready queue if it should now run after the
+        process at the head of the ready queue, i.e. for SJF if it has a
+        higher remaining burst time left
+        """
+        if self._before(self._head(), self.active):
+            p = self._take_ready()
+            self.active.set_proc_loc("ready")
+            p.set_proc_loc("CPU")
+            self._ready(self.active)
+            self.switch_to(p)
+
+    def elapse(self, elapsed):
+        """ Time has passed since last interrupt, which active process has run for """
+        self.clock += elapsed
+        if self.active:
+            self._run(elapsed)
 
-            # Move active process to ready queue if it now has a higher
-            # remaining burst time left than any process in the ready queue
-            if PriorityQueue.head(self) < self.active:
-                p = PriorityQueue.dequeue(self)
-                self.active.set_proc_loc("ready")
-                p.set_proc_loc("CPU")
-                PriorityQueue.enqueue(self,self.active)
-                self.active = p
+    def record_burst(self, proc, burst):
+        """
+        Record burst time for process proc leaving CPU, which is also time
+        passed since last interrupt
+        """
+        proc.record_burst_time(burst)
+        self._used(proc, burst)
+        self.elapse(burst)
 
-        print proc.status()
+    def busy(self):
+        return self.active is not None
 
     def ready_to_CPU(self):
         """
         Moves process at head of ready queue to CPU
         """
-        if not PriorityQueue.empty(self):
-                self.active = PriorityQueue.dequeue(self)
+        proc = self._take_ready()
+        if proc:
+                self.switch_to(proc)
                 self.active.set_proc_loc(self._dev_name)
         else: # Nothing in ready queue
             self.active = None
-            print io.nothing_in_ready()
-
-    def terminate(self, pid = None):
+            print msg.nothing_in_ready()
+
+    def switch_to(self, proc):
+        """ Context switch: makes given process the active process """
+        self.active = proc
+        if self.tlb:
+            self.tlb.switch(proc.pid)
+        if self._registry is not None:
+            self._registry.place(proc, self._owner or self)
+
+        if proc.first_run is None:
+            proc.first_run = self.clock
+            self.responses += 1
+            self.response_total += self.clock - proc.arrival
+
+    def _finished(self, proc):
+        """ Process has terminated """
+        self.completions += 1
+        self.turnaround_total += self.clock - proc.arrival
+
+    def terminate(self, pid = None, elapsed = 0):
         """
         If no pid given, terminates active process in CPU. Else, terminates 
-        process with given pid. 
+        process with given pid. elapsed is time since last interrupt.
         If active process is terminated, moves head of Ready Queue to CPU.
         Precondition: pid is a valid PID for a process in the ready queue or CPU
         """
-        proc = None
-        if self.active: 
+        if self.active and (not pid or self.active.pid == pid): 
             # Terminate active process if no pid given or if active process has
             # given pid
+            proc = self.active 
+            self._removed(proc)
+            self.active = None
+            self.record_burst(proc, elapsed)
+            self._finished(proc)
+            self.ready_to_CPU()
 
-            if not pid or self.active.pid == pid: 
-                proc = self.active 
-                self.ready_to_CPU()
-                self.record_burst(proc)
-
-            else: # Look for process in ready queue and remove
-                proc = PriorityQueue.pop(self, pid)
-
-                # Prompt for time since last interrupt
-                # Update burst time for active process
-                elapsed = io.get_valid_int("Time since last interrupt")
-                self.active.update_burst_time(elapsed)
+        elif pid and self._in_ready(pid):
+            # Look for process in ready queue and remove
+            proc = self._pop_ready(pid)
 
-            # Print stats
-            print "\n" + "{:-^78}".format(" Terminated Process Report ")
-            print "PID: {:<4} Avg CPU Burst Time: {:<5} Total CPU Time: {:<5}".format(proc.pid, proc.avg_burst_time(), proc.tot_burst_time()).center(78," ")
-            
-            del proc
+            # Update burst time for active process
+            self.elapse(elapsed)
 
         else: 
             raise IndexError
+
+        # Print stats
+        print "\n" + "{:-^78}".format(" Terminated Process Report ")
+        print "PID: {:<4} Avg CPU Burst Time: {:<5} Total CPU Time: {:<5}".format(proc.pid, proc.avg_burst_time(), proc.tot_burst_time()).center(78," ")
+        
+        del proc
                 
 
-    def dequeue(self):
+    def dequeue(self, elapsed=0):
         """
-        Returns current active process in CPU. Removes from CPU and moves next
-        process in Ready Queue to CPU.
-
+        Returns current active process in CPU, which has run for elapsed
+        time since last interrupt. Removes from CPU and moves next process in
+        Ready Queue to CPU.
         """
         if self.active: 
-            # Terminate active process and replace from ready queue
+            # Remove active process
             print "{a!s} removed from CPU".format(a = str(self.active).capitalize())
             proc = self.active
-            self.ready_to_CPU()
+            self._removed(proc)
+            self.active = None
 
-            # Get & record burst time
-            self.record_burst(proc)
+            # Record burst time, then replace from ready queue
+            self.record_burst(proc, elapsed)
+            self.ready_to_CPU()
 
             # Clear current burst time before exiting CPU
             proc.clear_curr_burst()
@@ -323,14 +553,28 @@ class CPU(PriorityQueue):
         else: # Nothing to dequeue
             raise IndexError 
 
+    ## Stats
+
+    def mean_response_time(self):
+        return self.response_total / self.responses if self.responses else 0
+
+    def mean_turnaround_time(self):
+        return self.turnaround_total / self.completions if self.completions else 0
+
+    def _snapshot_ready(self):
+        print msg.snapshot_header("ready")
+        PriorityQueue.snapshot(self)
+
+    def _active_info(self):
+        return "Est time remaining: {0:}".format(str(self.active.next_est_burst))
+
     def snapshot(self):
         """ Prints processes in ready queue, plus active process in CPU with headers """
-        print io.snapshot_header("ready")
-        PriorityQueue.snapshot(self)
+        self._snapshot_ready()
         if self.active: 
-            print " ACTIVE IN CPU (Est time remaining: {0:}) ".format(str(self.active.next_est_burst)).center(78, "=")
+            print " ACTIVE IN CPU ({}) ".format(self._active_info()).center(78, "=")
             self.active.headers()
-            print io.ruler()
+            print msg.ruler()
             self.active.snapshot()
         else:
             print "\n" + "No active process in the CPU".center(78)
@@ -342,3 +586,620 @@ class CPU(PriorityQueue):
         else: 
             raise IndexError
 
+class MLFQ(CPU):
+    """
+    Multi-level feedback queue. Each level is a FIFO queue with its own time
+    quantum, and processes in higher levels run first. A process that uses up
+    its quantum at a level moves down a level. Every `boost` units of time,
+    all processes in the CPU move back to the top level.
+    """
+
+    def __init__(self, tlb=None, quanta=(2, 4, 8), boost=100):
+        CPU.__init__(self, tlb)
+        self._quanta = list(quanta)
+        self._levels = [FIFOQueue() for q in self._quanta]
+        self._boost = boost
+        self._next_boost = boost
+
+        self.demotions = 0
+        self.boosts = 0
+
+    def set_registry(self, registry, owner=None):
+        """ Processes in any level are registered as in this CPU """
+        CPU.set_registry(self, registry, owner)
+        for level in self._levels:
+            level.set_registry(registry, owner or self)
+
+    def length(self):
+        return sum(level.length() for level in self._levels)
+
+    ## Ready queue
+
+    def _ready(self, proc):
+        self._levels[proc.level].enqueue(proc)
+
+    def _take_ready(self):
+        for level in self._levels:
+            if level._q:
+                return level.dequeue()
+        return None
+
+    def _pop_ready(self, pid):
+        for level in self._levels:
+            if level.contains(pid):
+                return level.pop(pid)
+        return None
+
+    def _in_ready(self, pid):
+        return any(level.contains(pid) for level in self._levels)
+
+    def _head(self):
+        for level in self._levels:
+            if level._q:
+                return next(level._q.itervalues())
+
+    def _before(self, p, q):
+        return p.level < q.level
+
+    def _used(self, proc, burst):
+        """
+        Charges burst to process's quantum at its level, moving it down a
+        level each time it uses up a quantum. Returns True if it did.
+        """
+        proc.level_time += burst
+        expired = False
+        while proc.level_time >= self._quanta[proc.level]:
+            proc.level_time -= self._quanta[proc.level]
+            expired = True
+            if proc.level < len(self._quanta) - 1:
+                proc.level += 1
+                self.demotions += 1
+        return expired
+
+    def _run(self, elapsed):
+        """ If active process used up its quantum, it goes to back of its level """
+        CPU._run(self, elapsed)
+        if self._used(self.active, elapsed) and self.length():
+            self.active.set_proc_loc("ready")
+            self._ready(self.active)
+            self.ready_to_CPU()
+
+    def time_to_preempt(self):
+        """ Active process's quantum left, or time to next boost if sooner """
+        if not self.active or not self.length():
+            return None
+        p = self.active
+        return min(self._quanta[p.level] - p.level_time, self._next_boost - self.clock)
+
+    def elapse(self, elapsed):
+        CPU.elapse(self, elapsed)
+        while self.clock >= self._next_boost:
+            self._next_boost += self._boost
+            self.boost()
+
+    def boost(self):
+        """ Moves every process in CPU back to top level """
+        top = self._levels[0]
+        for level in self._levels[1:]:
+            while level._q:
+                top.enqueue(level.dequeue())
+        for proc in top._q.itervalues():
+            proc.level = proc.level_time = 0
+        if self.active:
+            self.active.level = self.active.level_time = 0
+        self.boosts += 1
+
+    ## Stats
+
+    def _snapshot_ready(self):
+        print msg.snapshot_header("ready")
+        for i, level in enumerate(self._levels):
+            print msg.snapshot_header("level {} (quantum {})".format(i + 1, self._quanta[i]), "-")
+            level.snapshot()
+
+    def _active_info(self):
+        p = self.active
+        return "Level {}, quantum left: {}".format(p.level + 1, self._quanta[p.level] - p.level_time)
+
+class CFS(CPU):
+    """
+    Completely fair scheduler. A process's virtual runtime is the CPU time it
+    has used, scaled down the higher its weight (see PCB.set_nice), and the
+    ready process with the lowest virtual runtime runs next. The active
+    process runs for its share of the target latency, the time in which
+    every ready process should get to run, but never less than the minimum
+    granularity.
+
+    Virtual runtime only changes while a process is in the CPU, so the ready
+    queue is a heap ordered by virtual runtime, and picking the next process
+    or putting one back is O(log n).
+    """
+
+    def __init__(self, tlb=None, latency=20, min_granularity=1):
+        CPU.__init__(self, tlb)
+        self._key = by_vruntime
+        self._latency = latency
+        self._min_granularity = min_granularity
+
+        # Never decreasing lowest virtual runtime in CPU, which new & waking
+        # processes start from, and total weight of ready processes
+        self.min_vruntime = 0
+        self._ready_weight = 0
+        self._slice_used = 0
+
+    ## Ready queue
+
+    def _ready(self, proc):
+        self._ready_weight += proc.weight
+        CPU._ready(self, proc)
+
+    def _take_ready(self):
+        proc = CPU._take_ready(self)
+        if proc:
+            self._ready_weight -= proc.weight
+        return proc
+
+    def _pop_ready(self, pid):
+        proc = CPU._pop_ready(self, pid)
+        if proc:
+            self._ready_weight -= proc.weight
+        return proc
+
+    def _before(self, p, q):
+        # Only preempt if it is worth a context switch
+        return p.vruntime + self._min_granularity < q.vruntime
+
+    def _update_min_vruntime(self):
+        v = [p.vruntime for p in (self.active, self._head() if self._q else None) if p]
+        if v:
+            self.min_vruntime = max(self.min_vruntime, min(v))
+
+    def _slice(self):
+        """ Active process's share of the target latency """
+        w = self.active.weight
+        return max(self._min_granularity, self._latency * w / (self._ready_weight + w))
+
+    ## Running processes
+
+    def _add(self, proc):
+        """
+        New processes start at the lowest virtual runtime, so they don't run
+        until they've caught up. Processes back from I/O get half a target
+        latency of credit, but can't bank time spent waiting.
+        """
+        credit = 0 if proc.arrival is None else self._latency / 2
+        proc.vruntime = max(proc.vruntime, self.min_vruntime - credit)
+        CPU._add(self, proc)
+
+    def _run(self, elapsed):
+        """ Once active process has had its slice, next process runs if it is behind """
+        CPU._run(self, elapsed)
+        self._slice_used += elapsed
+        self._update_min_vruntime()
+        if self._slice_used >= self._slice() and self._q and self._head().vruntime < self.active.vruntime:
+            self.active.set_proc_loc("ready")
+            self._ready(self.active)
+            self.ready_to_CPU()
+
+    def time_to_preempt(self):
+        """
+        Active process's slice left or, once it has had its slice, time
+        until its virtual runtime passes the head of the ready queue (at
+        least the minimum granularity)
+        """
+        if not self.active or not self._q:
+            return None
+        left = self._slice() - self._slice_used
+        if left > 0:
+            return left
+        behind = (self._head().vruntime - self.active.vruntime) * self.active.weight / nice_0_weight
+        return max(behind, self._min_granularity)
+
+    def switch_to(self, proc):
+        CPU.switch_to(self, proc)
+        self._slice_used = 0
+        self._update_min_vruntime()
+
+    ## Stats
+
+    def _active_info(self):
+        p = self.active
+        return "vruntime: {:.1f}, slice left: {:.1f}".format(p.vruntime, max(0, self._slice() - self._slice_used))
+
+class EDF(CPU):
+    """
+    Earliest deadline first. Each CPU burst of a process with a relative
+    deadline must finish by its release into the CPU plus the deadline. A
+    periodic process releases at most one burst per period. The ready queue
+    is a heap ordered by absolute deadline, and a process arriving with an
+    earlier deadline than the active process preempts it. Processes without
+    a deadline only run when no process with one is ready. A periodic
+    process that comes back to the CPU before its next period starts is
+    held in a heap ordered by release time, and only becomes ready once
+    the CPU's clock reaches its release.
+
+    On a single CPU, EDF meets every deadline if the density of the
+    processes in it, the sum of estimated burst / min(deadline, period),
+    is at most 1. This is checked whenever a burst is released.
+    """
+
+    def __init__(self, tlb=None):
+        CPU.__init__(self, tlb)
+        self._key = by_deadline
+
+        # Density of processes in ready queue, and periodic processes
+        # waiting for their next release
+        self._ready_density = 0
+        self._held = PriorityQueue(key=by_release)
+
+        # Bursts with deadlines completed, how many missed their deadline,
+        # total & max lateness (finish - deadline) of those completed
+        self.jobs = 0
+        self.misses = 0
+        self.tardiness_total = 0
+        self.max_lateness = None
+
+        # Utilisation bound checks, how many found the CPU overloaded, and
+        # highest density seen
+        self.bound_checks = 0
+        self.overloads = 0
+        self.max_density = 0
+
+    def _density(self, proc):
+        if not proc.rel_deadline:
+            return 0
+        return proc.next_est_burst / min(proc.rel_deadline, proc.period or proc.rel_deadline)
+
+    def set_registry(self, registry, owner=None):
+        """ Held processes are registered as in this CPU """
+        CPU.set_registry(self, registry, owner)
+        self._held.set_registry(registry, owner or self)
+
+    def held(self):
+        return self._held.length()
+
+    ## Ready queue
+
+    def _ready(self, proc):
+        self._ready_density += self._density(proc)
+        CPU._ready(self, proc)
+
+    def _take_ready(self):
+        proc = CPU._take_ready(self)
+        if proc:
+            self._ready_density -= self._density(proc)
+        return proc
+
+    def _pop_ready(self, pid):
+        if self._held.contains(pid):
+            return self._held.pop(pid)
+        proc = CPU._pop_ready(self, pid)
+        if proc:
+            self._ready_density -= self._density(proc)
+        return proc
+
+    def _in_ready(self, pid):
+        return self._held.contains(pid) or CPU._in_ready(self, pid)
+
+    def _before(self, p, q):
+        return by_deadline(p) < by_deadline(q)
+
+    ## Deadlines
+
+    def _add(self, proc):
+        """
+        Works out when process's next burst is released: now, or for a
+        periodic process, no sooner than a period after its last release.
+        Holds it until then.
+        """
+        if proc.rel_deadline:
+            release = self.clock
+            if proc.period and proc.release is not None:
+                release = max(release, proc.release + proc.period)
+            proc.release = release
+            if release > self.clock:
+                proc.set_proc_loc("held")
+                self._held.enqueue(proc)
+                return
+        self._release(proc)
+        CPU._add(self, proc)
+
+    def _release(self, proc):
+        """ Releases process's burst, setting its absolute deadline """
+        if proc.rel_deadline:
+            proc.deadline = proc.release + proc.rel_deadline
+            self._check_bound(proc)
+
+    def elapse(self, elapsed):
+        """
+        Releases held processes whose release time has now passed. On an
+        idle CPU, which may be idle only because its active process is
+        leaving, they go to the ready queue and the earliest deadline runs
+        """
+        CPU.elapse(self, elapsed)
+        idle = not self.active
+        while self._held.length() and self._held.head().release <= self.clock:
+            proc = self._held.dequeue()
+            self._release(proc)
+            if idle:
+                proc.set_proc_loc("ready")
+                self._ready(proc)
+            else:
+                CPU._add(self, proc)
+        if idle and self.length():
+            CPU.ready_to_CPU(self)
+
+    def ready_to_CPU(self):
+        """ Does nothing if a process released as the active one left has taken the CPU """
+        if not self.active:
+            CPU.ready_to_CPU(self)
+
+    def time_to_preempt(self):
+        """ Time until next held process is released, which may preempt """
+        if not self._held.length():
+            return None
+        return self._held.head().release - self.clock
+
+    def _check_bound(self, proc):
+        """ Warns if releasing process's burst overloads the CPU """
+        density = self._ready_density + self._density(proc)
+        if self.active:
+            density += self._density(self.active)
+        self.bound_checks += 1
+        self.max_density = max(self.max_density, density)
+        if density > 1:
+            self.overloads += 1
+            print msg.err("CPU density {:.2f} is over 1, deadlines may be missed".format(density))
+
+    def _used(self, proc, burst):
+        """ Process's burst is done, finishing after running for burst """
+        if proc.deadline is None:
+            return
+        lateness = self.clock + burst - proc.deadline
+        self.jobs += 1
+        if lateness > 0:
+            self.misses += 1
+            self.tardiness_total += lateness
+        self.max_lateness = lateness if self.max_lateness is None else max(self.max_lateness, lateness)
+
+    ## Stats
+
+    def _snapshot_ready(self):
+        CPU._snapshot_ready(self)
+        if self._held.length():
+            print msg.snapshot_header("held until release", "-")
+            self._held.snapshot()
+
+    def _active_info(self):
+        p = self.active
+        return "Deadline: {}".format(p.deadline) if p.deadline is not None else "No deadline"
+
+def deadline_report(cores):
+    """ Prints deadline misses & utilisation bound checks of EDF cores """
+    jobs = sum(core.jobs for core in cores)
+    misses = sum(core.misses for core in cores)
+    lateness = [core.max_lateness for core in cores if core.max_lateness is not None]
+    print "\n" + "{:-^78}".format(" Deadline Report ")
+    print "Bursts: {:<6} Missed: {:<6} Max Lateness: {:<6} Mean Tardiness: {:<8.2f}".format(
+        jobs, misses, max(lateness) if lateness else "-",
+        sum(core.tardiness_total for core in cores) / misses if misses else 0).center(78)
+    print "Bound Checks: {:<6} Overloaded: {:<6} Max Density: {:<8.2f}".format(
+        sum(core.bound_checks for core in cores), sum(core.overloads for core in cores),
+        max(core.max_density for core in cores)).center(78)
+
+class MultiCoreCPU:
+
+    def __init__(self, cores, tlb=None, new_core=CPU):
+        """
+        Initializes CPU with given number of cores, each with no active
+        process and its own empty ready queue. Cores are made by calling
+        new_core(tlb), and share the TLB, if any.
+        """
+        self._dev_name = "CPU"
+        self.tlb = tlb
+        self.cores = [new_core(tlb) for i in xrange(cores)]
+
+        # Core whose active process the next interrupt or system call is
+        # for. Moves on to the next busy core after each one
+        self.current = 0
+
+        # Core each process was last placed on, number of times processes
+        # were placed on a different core, and how many of those were idle
+        # cores stealing from the busiest ready queue
+        self._last_core = {}
+        self.migrations = 0
+        self.steals = 0
+
+        # Time each core has had an active process, out of total time
+        self.busy_time = [0] * cores
+        self.total_time = 0
+
+    def set_registry(self, registry, owner=None):
+        """ Processes on every core are registered as in this CPU """
+        for core in self.cores:
+            core.set_registry(registry, self)
+
+    ## Choosing cores
+
+    def _load(self, core):
+        """ Number of processes on core, active & ready """
+        return core.length() + (1 if core.active else 0)
+
+    def _least_loaded(self):
+        return min(xrange(len(self.cores)), key=lambda i: self._load(self.cores[i]))
+
+    def _busiest(self):
+        """ Core with longest ready queue, or None if all ready queues are empty """
+        i = max(xrange(len(self.cores)), key=lambda i: self.cores[i].length())
+        return i if self.cores[i].length() else None
+
+    def _interrupted(self):
+        """ Returns index of next busy core, starting from current """
+        for k in xrange(len(self.cores)):
+            i = (self.current + k) % len(self.cores)
+            if self.cores[i].active:
+                self.current = i
+                return i
+        raise IndexError
+
+    def _place(self, proc, i):
+        """ Records that process is on core i, counting a migration if it has moved """
+        if self._last_core.get(proc.pid, i) != i:
+            self.migrations += 1
+        self._last_core[proc.pid] = i
+
+    def _refill(self, i):
+        """
+        Active process has left core i. Moves head of its ready queue to
+        core, or if its ready queue is empty, steals head of busiest ready
+        queue.
+        """
+        core = self.cores[i]
+        if core.active:
+            # Process was released onto core as its active process left
+            return
+        busiest = None if core.length() else self._busiest()
+        if busiest is None:
+            core.ready_to_CPU()
+        else:
+            proc = self.cores[busiest]._take_ready()
+            self.steals += 1
+            self._place(proc, i)
+            proc.set_proc_loc(self._dev_name)
+            core.switch_to(proc)
+
+    ## Time
+
+    def elapse(self, elapsed):
+        """
+        Time has passed since last interrupt: update burst time of active
+        process on every core
+        """
+        self.total_time += elapsed
+        for i, core in enumerate(self.cores):
+            if core.active:
+                self.busy_time[i] += elapsed
+            core.elapse(elapsed)
+
+    def busy(self):
+        return any(core.active for core in self.cores)
+
+    def held(self):
+        return sum(core.held() for core in self.cores)
+
+    def utilisation(self, i):
+        return self.busy_time[i] / self.total_time if self.total_time else 0
+
+    ## Methods to modify active processes
+
+    def contains(self, pid):
+        return any(core.contains(pid) for core in self.cores)
+
+    def enqueue(self, proc, elapsed=0):
+        """
+        Adds process to least loaded core and updates PCB status/location,
+        after elapsed time since last interrupt
+        """
+        if elapsed:
+            self.elapse(elapsed)
+
+        i = self._least_loaded()
+        self._place(proc, i)
+        self.cores[i]._add(proc)
+
+        print proc.status()
+
+    def _leave(self, i, elapsed):
+        """
+        Removes active process from core i, records its burst & time passed
+        (elapsed), then refills core. Returns process.
+        """
+        core = self.cores[i]
+        proc = core.active
+        core._removed(proc)
+        core.active = None
+
+        # Record burst time
+        proc.record_burst_time(elapsed)
+        core._used(proc, elapsed)
+        self.busy_time[i] += elapsed
+        self.elapse(elapsed)
+        self._refill(i)
+
+        # Next interrupt is for the next core
+        self.current = (i + 1) % len(self.cores)
+        return proc
+
+    def dequeue(self, elapsed=0):
+        """
+        Returns active process on current core, which has run for elapsed
+        time since last interrupt. Removes from core and moves next process
+        in core's ready queue to core.
+        """
+        i = self._interrupted()
+        print "{a!s} removed from CPU".format(a = str(self.cores[i].active).capitalize())
+        proc = self._leave(i, elapsed)
+
+        # Clear current burst time before exiting CPU
+        proc.clear_curr_burst()
+        return proc
+
+    def terminate(self, pid = None, elapsed = 0):
+        """
+        If no pid given, terminates active process on current core. Else,
+        terminates process with given pid, on whichever core it is. elapsed
+        is time since last interrupt.
+        """
+        actives = [i for i, core in enumerate(self.cores) if core.active and core.active.pid == pid]
+        if (not pid and self.busy()) or actives:
+            i = actives[0] if actives else self._interrupted()
+            proc = self._leave(i, elapsed)
+            self.cores[i]._finished(proc)
+
+        else: # Look for process in ready queues and remove
+            core = next((core for core in self.cores if pid and core._in_ready(pid)), None)
+            if not core:
+                raise IndexError
+            proc = core._pop_ready(pid)
+            self.elapse(elapsed)
+
+        self._last_core.pop(proc.pid, None)
+
+        # Print stats
+        print "\n" + "{:-^78}".format(" Terminated Process Report ")
+        print "PID: {:<4} Avg CPU Burst Time: {:<5} Total CPU Time: {:<5}".format(proc.pid, proc.avg_burst_time(), proc.tot_burst_time()).center(78," ")
+
+    def get_active_process(self):
+        """ Returns active process on current core """
+        return self.cores[self._interrupted()].active
+
+    ## Methods to print CPU in human readable form to console
+
+    def mean_response_time(self):
+        responses = sum(core.responses for core in self.cores)
+        return sum(core.response_total for core in self.cores) / responses if responses else 0
+
+    def mean_turnaround_time(self):
+        completions = sum(core.completions for core in self.cores)
+        return sum(core.turnaround_total for core in self.cores) / completions if completions else 0
+
+    def stats(self):
+        """ Prints utilisation of each core & migrations """
+        print "\n" + "{:-^78}".format(" CPU Cores Report ")
+        print "Migrations: {:<6} Steals: {:<6}".format(self.migrations, self.steals).center(78)
+        for i in xrange(len(self.cores)):
+            print "Core {:<3} Utilisation: {:<8.2%} Processes: {:<5}".format(
+                i + 1, self.utilisation(i), self._load(self.cores[i])).center(78)
+
+    def snapshot(self):
+        """ Prints ready queue & active process of each core """
+        for i, core in enumerate(self.cores):
+            print msg.snapshot_header("core " + str(i + 1))
+            core.snapshot()
+
+cpu_policies = {
+    "sjf": CPU,
+    "mlfq": MLFQ,
+    "cfs": CFS,
+    "edf": EDF,
+}
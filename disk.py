@@ -0,0 +1,364 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             disk.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Disk scheduling policies. Each policy holds the pending
+#                   requests for one disk drive and, given the position and
+#                   direction of the drive head, picks the next request and
+#                   works out how far the head moves (seek distance).
+#                       - FCFS: in order requested
+#                       - SSTF: closest cylinder to head
+#                       - SCAN: sweeps to edge of disk and back
+#                       - C-SCAN: sweeps up to edge, returns to cylinder 0
+#                       - LOOK: sweeps only as far as last request & back
+#                       - C-LOOK: sweeps up to last request, returns to lowest
+#                       - F-LOOK: LOOK over a frozen batch of requests, while
+#                         new requests wait for the next batch
+#                   Requests are indexed by cylinder, so finding the next
+#                   request in either direction is a bisect.
+
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+
+class CylinderIndex:
+    """
+    Pending requests indexed by cylinder. Keeps a sorted list of cylinders
+    with requests, and for each cylinder its requests in the order they were
+    made. A request's cylinder is read once, when it is added.
+    """
+
+    def __init__(self):
+        self._cyls = []
+        self._reqs = {}
+        self._pids = {}
+
+    def __len__(self):
+        return len(self._pids)
+
+    def __contains__(self, pid):
+        return pid in self._pids
+
+    def add(self, proc):
+        cyl = proc.params["cyl"]
+        if cyl not in self._reqs:
+            insort(self._cyls, cyl)
+            self._reqs[cyl] = OrderedDict()
+        self._reqs[cyl][proc.pid] = proc
+        self._pids[proc.pid] = cyl
+
+    def remove(self, pid):
+        """ Removes and returns request of given process, or None """
+        if pid not in self._pids:
+            return None
+        cyl = self._pids.pop(pid)
+        reqs = self._reqs[cyl]
+        proc = reqs.pop(pid)
+        if not reqs:
+            del self._reqs[cyl]
+            del self._cyls[bisect_left(self._cyls, cyl)]
+        return proc
+
+    def pop_at(self, cyl):
+        """ Removes and returns oldest request for given cylinder """
+        return self.remove(next(iter(self._reqs[cyl])))
+
+    ## Finding cylinders
+
+    def at_or_above(self, c):
+        """ Lowest cylinder with a request that is >= c, or None """
+        i = bisect_left(self._cyls, c)
+        return self._cyls[i] if i < len(self._cyls) else None
+
+    def at_or_below(self, c):
+        """ Highest cylinder with a request that is <= c, or None """
+        i = bisect_right(self._cyls, c)
+        return self._cyls[i-1] if i else None
+
+    def lowest(self):
+        return self._cyls[0] if self._cyls else None
+
+    def near(self, c, gap):
+        """
+        Oldest request on the closest cylinder within gap cylinders of c, or
+        None
+        """
+        up = self.at_or_above(c)
+        down = self.at_or_below(c)
+        if up is not None and up - c > gap:
+            up = None
+        if down is not None and c - down > gap:
+            down = None
+
+        if up is None and down is None:
+            return None
+        cyl = down if up is None or (down is not None and c - down <= up - c) else up
+        return next(self._reqs[cyl].itervalues())
+
+    ## Iterating over requests
+
+    def _requests(self, cyls):
+        for c in cyls:
+            for proc in self._reqs[c].itervalues():
+                yield proc
+
+    def ascending(self, lo=None, hi=None):
+        """ Yields requests for cylinders lo <= c < hi, lowest first """
+        i = bisect_left(self._cyls, lo) if lo is not None else 0
+        j = bisect_left(self._cyls, hi) if hi is not None else len(self._cyls)
+        return self._requests(self._cyls[i:j])
+
+    def descending(self, hi=None, lo=None):
+        """ Yields requests for cylinders lo < c <= hi, highest first """
+        j = bisect_right(self._cyls, hi) if hi is not None else len(self._cyls)
+        i = bisect_right(self._cyls, lo) if lo is not None else 0
+        return self._requests(reversed(self._cyls[i:j]))
+
+    def nearest(self, head):
+        """ Yields requests in order of distance from head, lower cylinder first on a tie """
+        i = bisect_left(self._cyls, head)
+        j = i - 1
+        while j >= 0 or i < len(self._cyls):
+            if i >= len(self._cyls) or (j >= 0 and head - self._cyls[j] <= self._cyls[i] - head):
+                c = self._cyls[j]
+                j -= 1
+            else:
+                c = self._cyls[i]
+                i += 1
+            for proc in self._reqs[c].itervalues():
+                yield proc
+
+class DiskScheduler:
+    """
+    Base class for disk scheduling policies. Requests are PCBs whose
+    cylinder param is set. Cylinders run from 0 to the number of cylinders.
+    Each policy defines:
+        next(head, direction)   removes next request to service given head
+                                position & direction (1 for up, -1 for
+                                down). Returns (request, new head position,
+                                new direction, seek distance)
+        order(head, direction)  yields pending requests in the order they
+                                would be serviced
+    """
+
+    def __init__(self, cylinders):
+        self._cylinders = cylinders
+        self._q = CylinderIndex()
+
+    def __len__(self):
+        return len(self._q)
+
+    def __contains__(self, pid):
+        return pid in self._q
+
+    def add(self, proc):
+        """ Adds request. Returns queue request was added to """
+        self._q.add(proc)
+        return self._q
+
+    def remove(self, pid):
+        """ Removes & returns request of given process, or None """
+        return self._q.remove(pid)
+
+    def near(self, cyl, gap):
+        """ Returns a pending request within gap cylinders of cyl, or None """
+        return self._q.near(cyl, gap)
+
+    def sections(self, head, direction):
+        """ Returns list of (title, requests) to show in a snapshot """
+        return [(None, self.order(head, direction))]
+
+class FCFS(DiskScheduler):
+
+    def __init__(self, cylinders):
+        DiskScheduler.__init__(self, cylinders)
+
+        # Requests in order made. Also indexed by cylinder, only to find
+        # nearby requests
+        self._q = OrderedDict()
+        self._cyls = CylinderIndex()
+
+    def __contains__(self, pid):
+        return pid in self._q
+
+    def add(self, proc):
+        self._q[proc.pid] = proc
+        self._cyls.add(proc)
+        return self._q
+
+    def remove(self, pid):
+        self._cyls.remove(pid)
+        return self._q.pop(pid, None)
+
+    def near(self, cyl, gap):
+        return self._cyls.near(cyl, gap)
+
+    def next(self, head, direction):
+        pid, proc = self._q.popitem(last=False)
+        self._cyls.remove(pid)
+        cyl = proc.params["cyl"]
+        if cyl != head:
+            direction = 1 if cyl > head else -1
+        return proc, cyl, direction, abs(cyl - head)
+
+    def order(self, head, direction):
+        return self._q.itervalues()
+
+class SSTF(DiskScheduler):
+
+    def next(self, head, direction):
+        up = self._q.at_or_above(head)
+        down = self._q.at_or_below(head)
+
+        if up is None or (down is not None and head - down <= up - head):
+            cyl = down
+        else:
+            cyl = up
+        if cyl != head:
+            direction = 1 if cyl > head else -1
+        return self._q.pop_at(cyl), cyl, direction, abs(cyl - head)
+
+    def order(self, head, direction):
+        # Only exact for the first request, as the head moves
+        return self._q.nearest(head)
+
+class LOOK(DiskScheduler):
+
+    def _sweep(self, q, head, direction):
+        """ Next request going in given direction, reversing if there are none """
+        cyl = q.at_or_above(head) if direction > 0 else q.at_or_below(head)
+        if cyl is None:
+            direction = -direction
+            cyl = q.at_or_above(head) if direction > 0 else q.at_or_below(head)
+        return q.pop_at(cyl), cyl, direction, abs(cyl - head)
+
+    def _order(self, q, head, direction):
+        if direction > 0:
+            for proc in q.ascending(head):
+                yield proc
+            for proc in q.descending(head - 1):
+                yield proc
+        else:
+            for proc in q.descending(head):
+                yield proc
+            for proc in q.ascending(head + 1):
+                yield proc
+
+    def next(self, head, direction):
+        return self._sweep(self._q, head, direction)
+
+    def order(self, head, direction):
+        return self._order(self._q, head, direction)
+
+class SCAN(LOOK):
+
+    def next(self, head, direction):
+        q = self._q
+        cyl = q.at_or_above(head) if direction > 0 else q.at_or_below(head)
+        if cyl is not None:
+            return q.pop_at(cyl), cyl, direction, abs(cyl - head)
+
+        # Nothing left this way: go to edge of disk, then sweep back
+        edge = self._cylinders if direction > 0 else 0
+        proc, cyl, direction, seek = self._sweep(q, edge, -direction)
+        return proc, cyl, direction, abs(edge - head) + seek
+
+class CSCAN(DiskScheduler):
+
+    def next(self, head, direction):
+        q = self._q
+        cyl = q.at_or_above(head)
+        if cyl is not None:
+            return q.pop_at(cyl), cyl, 1, cyl - head
+
+        # Nothing above head: go to top edge, return to cylinder 0 and
+        # sweep up again
+        cyl = q.lowest()
+        return q.pop_at(cyl), cyl, 1, (self._cylinders - head) + self._cylinders + cyl
+
+    def order(self, head, direction):
+        for proc in self._q.ascending(head):
+            yield proc
+        for proc in self._q.ascending(None, head):
+            yield proc
+
+class CLOOK(CSCAN):
+
+    def next(self, head, direction):
+        q = self._q
+        cyl = q.at_or_above(head)
+        if cyl is None:
+            # Nothing above head: jump back to lowest request
+            cyl = q.lowest()
+        return q.pop_at(cyl), cyl, 1, abs(cyl - head)
+
+class FLOOK(LOOK):
+    """
+    Two queues: requests in the frozen queue are serviced in LOOK order,
+    while new requests are added to the other queue. When the frozen queue
+    is empty the queues swap.
+    """
+
+    def __init__(self, cylinders):
+        LOOK.__init__(self, cylinders)
+        self._frozen = self._q
+        self._new = CylinderIndex()
+
+    def __len__(self):
+        return len(self._frozen) + len(self._new)
+
+    def __contains__(self, pid):
+        return pid in self._frozen or pid in self._new
+
+    def _swap_if_done(self):
+        if not self._frozen:
+            self._frozen, self._new = self._new, self._frozen
+
+    def add(self, proc):
+        self._new.add(proc)
+        self._swap_if_done()
+        return self._frozen if proc.pid in self._frozen else self._new
+
+    def remove(self, pid):
+        proc = self._frozen.remove(pid) or self._new.remove(pid)
+        self._swap_if_done()
+        return proc
+
+    def near(self, cyl, gap):
+        return self._frozen.near(cyl, gap) or self._new.near(cyl, gap)
+
+    def next(self, head, direction):
+        request = self._sweep(self._frozen, head, direction)
+        self._swap_if_done()
+        return request
+
+    def _end_of_sweep(self, head, direction):
+        """ Head position & direction once frozen requests are serviced """
+        for proc in self._order(self._frozen, head, direction):
+            cyl = proc.params["cyl"]
+            if cyl != head:
+                direction = 1 if cyl > head else -1
+            head = cyl
+        return head, direction
+
+    def order(self, head, direction):
+        for proc in self._order(self._frozen, head, direction):
+            yield proc
+        for proc in self._order(self._new, *self._end_of_sweep(head, direction)):
+            yield proc
+
+    def sections(self, head, direction):
+        return [("PROCESSING [FROZEN]", self._order(self._frozen, head, direction)),
+                ("NEW REQUESTS", self._order(self._new, *self._end_of_sweep(head, direction)))]
+
+disk_schedulers = {
+    "fcfs": FCFS,
+    "sstf": SSTF,
+    "scan": SCAN,
+    "cscan": CSCAN,
+    "look": LOOK,
+    "clook": CLOOK,
+    "flook": FLOOK,
+}
@@ -9,15 +9,116 @@
 # 						and process queues for the different devices in a 
 #						system
 # Run using: 		python main.py
+#					python main.py trace_file	(replay trace, see batch.py)
+#					python main.py -s	(simulate a synthetic workload)
+#					python main.py -c config_file [trace_file | -s]
+#						(set up system from config file, see config.py)
 
+import os
 import sys
+import timeit
 import commands
+import batch
+import msg
+import sys_gen
+import config
+from simulation import Simulator
 
 def main():
 
+	args = sys.argv[1:]
+
+	# Set up system from config file, rather than prompting in sys gen
+	settings = system = None
+	if args[:1] == ["-c"]:
+		if len(args) < 2:
+			print msg.err("Usage: python main.py -c config_file [trace_file | -s]")
+			sys.exit(2)
+		try:
+			start = timeit.default_timer()
+			settings = config.read(args[1])
+			system = config.build(settings)
+			elapsed = timeit.default_timer() - start
+		except (IOError, ValueError) as e:
+			print msg.err("{}: {}".format(args[1], e))
+			sys.exit(1)
+		print "System set up from {} in {:.3f}s".format(args[1], elapsed)
+		args = args[2:]
+
+	if args == ["-s"]:
+		simulate(system, settings)
+		return
+
+	if args:
+		replay(args[0], system)
+		return
+
 	# Call system command loop to generate system and prompt user for input
-	sys_comm = commands.SysCommand()
+	sys_comm = commands.SysCommand(system = system)
 	sys_comm.cmdloop()
 
+def replay(path, system=None):
+	"""
+	Generates system, unless given, then replays trace file at given path
+	without prompting. Output of each command is hidden, and only
+	throughput & final system stats are printed.
+	"""
+	system = system or commands.generate_system()
+
+	stdout = sys.stdout
+	sys.stdout = open(os.devnull, "w")
+	try:
+		with open(path) as trace:
+			start = timeit.default_timer()
+			ops, bad = batch.replay(system, trace)
+			elapsed = timeit.default_timer() - start
+	finally:
+		sys.stdout.close()
+		sys.stdout = stdout
+
+	print msg.sys_mode("Trace Replayed")
+	print "Commands: {:<10} Invalid: {:<8} Time: {:<8.2f} Ops/sec: {:<10}".format(
+		ops, bad, elapsed, int(ops / elapsed) if elapsed else 0).center(78)
+	system.print_stats()
+
+def simulate(system=None, settings=None):
+	"""
+	Generates system & a synthetic workload, unless given system & config
+	settings with a workload, then runs the workload through the system as
+	a discrete event simulation. Output of each event is hidden, and only
+	throughput & final system stats are printed.
+	"""
+	system = system or commands.generate_system()
+	workload = None
+	if settings:
+		try:
+			workload = config.workload(settings, system)
+		except (IOError, ValueError) as e:
+			print msg.err(str(e))
+			sys.exit(1)
+	workload = workload or sys_gen.workload(system.all_devices, system.max_proc_size)
+	sim = Simulator(system)
+
+	stdout = sys.stdout
+	sys.stdout = open(os.devnull, "w")
+	try:
+		start = timeit.default_timer()
+		events = sim.run(workload)
+		elapsed = timeit.default_timer() - start
+	except KeyboardInterrupt:
+		# Workloads with no limit run until stopped
+		elapsed = timeit.default_timer() - start
+		events = sim.events
+	finally:
+		sys.stdout.close()
+		sys.stdout = stdout
+
+	print msg.sys_mode("Simulation Complete")
+	print "Jobs: {:<10} Rejected: {:<8} Simulated Time: {:<12.1f}".format(
+		sim.arrived, sim.rejected, sim.calendar.now).center(78)
+	print "Events: {:<10} Time: {:<8.2f} Events/sec: {:<10}".format(
+		events, elapsed, int(events / elapsed) if elapsed else 0).center(78)
+	system.print_stats()
+
 if __name__ == '__main__':
-	main()
\ No newline at end of file
+	main()
@@ -9,19 +9,161 @@
 
 from __future__ import division
 import sys 
-from collections import deque
+from collections import deque, OrderedDict
+from array import array
 from math import ceil
-from bisect import insort
+from bisect import insort, bisect_left, bisect_right
 import heapq
-import io
-from pcb import PCB
+import msg
+from pcb import PCB, no_frame
 from queues import Queue
+from paging import replacement_policies
+
+# Memories with more frames than this use the compact frame table by default
+compact_threshold = 2**16
+
+# Max capacity (in frames) solved exactly by the knapsack admission policy.
+# Larger capacities are solved in units of several frames.
+knapsack_limit = 4096
+
+def pages_needed(size, pg_size):
+    """ Returns number of pages/frames a process of given size takes up """
+    return int(ceil(size / pg_size))
+
+## Admission policies
+## Each takes the job pool, amount of free memory and the page size, and
+## dequeues & returns a list of jobs that will all fit in free memory together
+
+def admit_largest_first(pool, free, pg_size):
+    """ Repeatedly admit the largest job that fits """
+    procs = []
+    while free > 0:
+        try:
+            p = pool.dequeue_largest(free)
+        except (InvalidProcess, IndexError):
+            break
+        procs.append(p)
+        free -= pages_needed(p.proc_size, pg_size) * pg_size
+    return procs
+
+def admit_smallest_first(pool, free, pg_size):
+    """ Admit smallest jobs first, to get as many jobs running as possible """
+    procs = []
+    while free > 0:
+        try:
+            p = pool.dequeue_smallest(free)
+        except (InvalidProcess, IndexError):
+            break
+        procs.append(p)
+        free -= pages_needed(p.proc_size, pg_size) * pg_size
+    return procs
+
+def admit_best_fit(pool, free, pg_size):
+    """
+    Repeatedly admit the job needing the most frames that still fit, leaving
+    the fewest free frames behind. Among jobs that need the same number of
+    frames, the one that has waited longest is admitted first.
+    """
+    procs = []
+    while free > 0:
+        size = pool.largest_size(free)
+        if size is None:
+            break
+        frames = pages_needed(size, pg_size)
+        procs.append(pool.dequeue_oldest((frames-1) * pg_size, size))
+        free -= frames * pg_size
+    return procs
+
+def admit_knapsack(pool, free, pg_size):
+    """
+    Admit the set of jobs that fills free frames as fully as possible.
+    Solved as a bounded subset sum over the number of frames each job needs,
+    using a bitset of reachable totals. If there are more than knapsack_limit
+    free frames, frame counts are rounded up to units of several frames so
+    the answer is approximate (but always fits). Any frames left over are
+    then filled largest first.
+    """
+    free_frames = free // pg_size
+    counts = pool.page_counts(pg_size, free)
+    if not counts:
+        return []
+
+    unit = max(1, int(ceil(free_frames / knapsack_limit)))
+    capacity = free_frames // unit
+    mask = (1 << (capacity + 1)) - 1
+
+    # Split each group of n jobs needing the same number of frames into
+    # chunks of 1, 2, 4... jobs so every count up to n can be made. Larger
+    # jobs go first so that walking back prefers them, saving small jobs for
+    # small gaps later
+    chunks = []
+    for frames in sorted(counts, reverse=True):
+        n = min(counts[frames], free_frames // frames)
+        c = 1
+        while n > 0:
+            c = min(c, n)
+            chunks.append((frames, c))
+            n -= c
+            c *= 2
+
+    reachable = 1
+    history = []
+    for frames, c in chunks:
+        history.append(reachable)
+        reachable = (reachable | (reachable << (int(ceil(frames / unit)) * c))) & mask
+
+    # Walk back from the fullest reachable total to find chunks used
+    total = reachable.bit_length() - 1
+    chosen = {}
+    for i in reversed(xrange(len(chunks))):
+        if not (history[i] >> total) & 1:
+            frames, c = chunks[i]
+            chosen[frames] = chosen.get(frames, 0) + c
+            total -= int(ceil(frames / unit)) * c
+
+    procs = []
+    for frames in sorted(chosen, reverse=True):
+        for i in xrange(chosen[frames]):
+            procs.append(pool.dequeue_oldest((frames-1) * pg_size, frames * pg_size))
+            free -= frames * pg_size
+
+    return procs + admit_largest_first(pool, free, pg_size)
+
+admission_policies = {
+    "largest": admit_largest_first,
+    "best": admit_best_fit,
+    "smallest": admit_smallest_first,
+    "knapsack": admit_knapsack,
+}
 
 class LongTermScheduler:
 
-    def __init__(self, mem_size, pg_size):
-        self.ram = Memory(mem_size, pg_size)
+    def __init__(self, mem_size, pg_size, compact=None, policy="largest", paging=None):
+        """
+        Sets up RAM & job pool. If compact is not given, the compact frame
+        table is used whenever memory has more than compact_threshold frames.
+        Policy is the name of the admission policy used to pick jobs from the
+        job pool when memory is freed.
+        If paging is the name of a page replacement policy, memory uses demand
+        paging with that policy instead of loading whole processes up front.
+        """
+        if compact is None:
+            compact = int(mem_size/pg_size) > compact_threshold
+
+        if paging:
+            self.ram = DemandPagedMemory(mem_size, pg_size, paging)
+        elif compact:
+            self.ram = CompactMemory(mem_size, pg_size)
+        else:
+            self.ram = Memory(mem_size, pg_size)
         self.job_pool = JobPool()
+        self.admit = admission_policies[policy]
+
+        # Admission stats
+        self.mem_size = mem_size
+        self.releases = 0
+        self.admitted = 0
+        self.utilisation = 0
 
     def schedule(self, proc):
         try: 
@@ -36,9 +178,9 @@ class LongTermScheduler:
 
         """
         Look for given process in memory or job pool and terminates process.
-        If process was in memory, allocates any freed memory to largest job
-        in job pool, until no more freed memory can be allocated. Returns list
-        of new processes allocated
+        If process was in memory, allocates any freed memory to jobs in job
+        pool chosen by the admission policy. Returns list of new processes
+        allocated
         Else, if process was in job pool, removes from job pool, terminates
         process and returns None.
         Precondition: pid is a valid integer
@@ -47,16 +189,16 @@ class LongTermScheduler:
             # Deallocate process
             self.ram.deallocate(pid)
 
-            procs  = []
-            # Try to allocate any processes in job queue
-            while self.ram.free_mem() > 0: 
-                try:
-                    procs.append(self.job_pool.dequeue_largest(self.ram.free_mem()))
-                    self.ram.allocate(procs[-1])
-                except (InsufficientMemory, InvalidProcess, IndexError): 
-                    # Either no more jobs or not enough free mem to allocate
-                    # any processes in queue
-                    break
+            # Allocate freed memory to processes in job queue
+            procs = self.admit(self.job_pool, self.ram.free_mem(), self.ram.page_size())
+            for p in procs:
+                self.ram.allocate(p)
+
+            # Update admission stats
+            self.releases += 1
+            self.admitted += len(procs)
+            self.utilisation += 1 - self.ram.free_mem() / self.mem_size
+
             return procs
 
         else:
@@ -78,6 +220,15 @@ class LongTermScheduler:
     def kill(self, proc):
         pass
 
+    def admission_stats(self):
+        """
+        Returns avg number of jobs admitted each time memory is freed, and avg
+        memory utilisation just after admitting them
+        """
+        if not self.releases:
+            return 0, 0
+        return self.admitted / self.releases, self.utilisation / self.releases
+
     def show_job_pool(self):
         self.job_pool.snapshot()
 
@@ -95,6 +246,13 @@ class Memory:
         self._frame_table = dict.fromkeys(range(int(s/p)))
         self._free_frames = deque(self._frame_table.keys())
 
+        # Reverse index of pid -> frames held by that process, kept in step
+        # with the frame table so lookups don't have to scan every frame
+        self._proc_frames = {}
+
+        # TLB to keep in step when pages are evicted
+        self.tlb = None
+
     def free_mem(self):
         return int(len(self._free_frames) * self._page_size)
 
@@ -102,12 +260,11 @@ class Memory:
         return self._page_size
 
     def is_in_mem(self, pid):
-        for f,p in self._frame_table.items(): 
-            if p:
-                if p[0] is pid: 
-                    return True
+        return pid in self._proc_frames
 
-        return False
+    def fits(self, size):
+        """ True if a process of given size can be allocated memory now """
+        return size <= self.free_mem()
 
     def allocate(self, proc):
         """
@@ -120,93 +277,372 @@ class Memory:
             
         # For every page needed for process, insert into first free frame from
         # free frames list and update free frames list
-        for p in proc.page_table.keys():
+        frames = self._proc_frames.setdefault(proc.pid, [])
+        for p in xrange(len(proc.page_table)):
             f = self._free_frames.popleft()
             self._frame_table[f] = (proc.pid, p)
+            frames.append(f)
             proc.allocate_memory(p,f)
 
     def deallocate(self, pid):
         """
-        Deallocates framesin mem for a given process and updates frame table & 
+        Deallocates frames in mem for a given process and updates frame table & 
         free frames list. If process not in memory, throws exception. 
         """
 
         if not self.is_in_mem(pid):
             raise InvalidProcess
 
-        for k,v in self._frame_table.iteritems(): 
-            if v:
-                if v[0] is pid: 
-                    self._frame_table[k] = None
-                    self._free_frames.append(k)
+        # Only visit the frames this process holds. Frames are freed in
+        # ascending order, same as walking the whole frame table would
+        for f in sorted(self._proc_frames.pop(pid)):
+            self._frame_table[f] = None
+            self._free_frames.append(f)
+
+    def frames(self):
+        """ Yields (frame, (pid, page)) for every frame, or (frame, None) if free """
+        return self._frame_table.iteritems()
+
+    def free_frames(self):
+        """ Yields free frames in the order they will be allocated """
+        return iter(self._free_frames)
 
     def snapshot(self):
-        print io.snapshot_header("Frame Table")
+        print msg.snapshot_header("Frame Table")
         print "{:^10}{:^10}{:^10}".format("FRAME", "PID", "PAGE")
-        print io.ruler()
-        for frame, proc in self._frame_table.iteritems():
+        print msg.ruler()
+        for frame, proc in self.frames():
             print "{:^10}".format(hex(frame)),
             if proc: 
                 print "{:^8}{:^12}".format(proc[0], hex(proc[1]))
             else: 
                 print "{:^8}".format("None")
 
-        print io.snapshot_header("Free Frames")
+        print msg.snapshot_header("Free Frames")
         n = 0
-        for f in self._free_frames:
+        for f in self.free_frames():
             n += 1
             if (n%6) is 0: # Print 6 frames per row
                 print "{:<10}".format(hex(f))
             else:    
                 print "{:<10}".format(hex(f)),
 
+class CompactMemory(Memory):
+    """
+    Memory for systems with very many frames. The frame table is stored as
+    two typed arrays (owner pid & page per frame) and the free frame list is
+    a ring buffer in a third, so it takes 4 bytes a frame instead of a deque
+    of ints.
+
+    Free frames are allocated in the same order as by Memory: freed frames
+    go to the back of the list, in ascending order, and are reused first in,
+    first out.
+    """
+
+    def __init__(self, s, p):
+        self._size = s
+        self._page_size = p
+
+        n = int(s/p)
+        self._frame_pid = array('i', [-1]) * n
+        self._frame_page = array('i', [0]) * n
+
+        # Free frame list starts at _free_head & wraps round the end
+        self._free_ring = array('i', xrange(n))
+        self._free_head = 0
+        self._num_free = n
+
+        self._proc_frames = {}
+
+    def free_mem(self):
+        return int(self._num_free * self._page_size)
+
+    def allocate(self, proc):
+        """
+        Allocates memory to a process if there is enough free memory (else
+        throws exception), assigning pages to frames from the front of the
+        free frame list
+        """
+        if proc.proc_size > self.free_mem():
+            raise InsufficientMemory(proc)
+
+        n = len(self._free_ring)
+        frames = self._proc_frames.setdefault(proc.pid, [])
+        for p in xrange(len(proc.page_table)):
+            f = self._free_ring[self._free_head]
+            self._free_head = (self._free_head + 1) % n
+            self._num_free -= 1
+            self._frame_pid[f] = proc.pid
+            self._frame_page[f] = p
+            frames.append(f)
+            proc.allocate_memory(p,f)
+
+    def deallocate(self, pid):
+        """
+        Deallocates frames in mem for a given process and adds them to the
+        back of the free frame list. If process not in memory, throws
+        exception.
+        """
+        if not self.is_in_mem(pid):
+            raise InvalidProcess
+
+        n = len(self._free_ring)
+        for f in sorted(self._proc_frames.pop(pid)):
+            self._frame_pid[f] = -1
+            self._free_ring[(self._free_head + self._num_free) % n] = f
+            self._num_free += 1
+
+    def frames(self):
+        for f in xrange(len(self._frame_pid)):
+            if self._frame_pid[f] == -1:
+                yield f, None
+            else:
+                yield f, (self._frame_pid[f], self._frame_page[f])
+
+    def free_frames(self):
+        n = len(self._free_ring)
+        for i in xrange(self._num_free):
+            yield self._free_ring[(self._free_head + i) % n]
+
+class DemandPagedMemory(Memory):
+    """
+    Memory using demand paging. Processes are admitted without any frames,
+    and each page is loaded into a frame the first time it is referenced. If
+    no frames are free, a victim frame is chosen by the page replacement
+    policy and its page is evicted.
+    """
+
+    def __init__(self, s, p, policy="lru"):
+        Memory.__init__(self, s, p)
+        self._policy = replacement_policies[policy](len(self._frame_table))
+        self._procs = {}
+
+        # Totals for all processes
+        self.page_faults = 0
+        self.evictions = 0
+
+    def fits(self, size):
+        """ Any process fits, as pages are only loaded when referenced """
+        return True
+
+    def allocate(self, proc):
+        """ Admits process to memory. No pages are loaded until referenced. """
+        self._procs[proc.pid] = proc
+        self._proc_frames[proc.pid] = set()
+        proc.pager = self
+
+    def deallocate(self, pid):
+        """
+        Frees all frames held by given process. If process not in memory,
+        throws exception.
+        """
+        if not self.is_in_mem(pid):
+            raise InvalidProcess
+
+        for f in sorted(self._proc_frames.pop(pid)):
+            self._policy.remove(f)
+            self._frame_table[f] = None
+            self._free_frames.append(f)
+
+        self._procs.pop(pid).pager = None
+
+    def _release(self, frame):
+        """ Unmaps page held in given frame from its process """
+        pid, page = self._frame_table[frame]
+        self._frame_table[frame] = None
+        self._proc_frames[pid].discard(frame)
+
+        proc = self._procs[pid]
+        proc.page_table[page] = no_frame
+        if self.tlb:
+            self.tlb.invalidate(pid, page)
+        proc.evictions += 1
+        self.evictions += 1
+
+    def reference(self, proc, page):
+        """
+        References given page of process, loading it into a frame on a page
+        fault. Returns frame page is in.
+        """
+        frame = proc.page_table[page]
+
+        if frame != no_frame:
+            self._policy.touch(frame)
+        else:
+            proc.page_faults += 1
+            self.page_faults += 1
+
+            if self._free_frames:
+                frame = self._free_frames.popleft()
+            else:
+                frame = self._policy.victim()
+                self._release(frame)
+
+            self._frame_table[frame] = (proc.pid, page)
+            self._proc_frames[proc.pid].add(frame)
+            proc.allocate_memory(page, frame)
+            self._policy.insert(frame)
+
+        for f in self._policy.expired():
+            self._release(f)
+            self._free_frames.append(f)
+
+        return frame
+
+    def snapshot(self):
+        Memory.snapshot(self)
+        print msg.snapshot_header("Demand Paging")
+        print "Page Faults: {:<8} Evictions: {:<8}".format(self.page_faults, self.evictions).center(78)
+
 class JobPool(Queue):
+    """
+    Job pool indexed by process size. Keeps a sorted list of the distinct
+    sizes of jobs waiting in the pool, and for each size the jobs of that
+    size in the order they were enqueued, so finding the largest job that
+    fits in memory is a bisect and removing a job by pid is a dict lookup.
+    """
 
     def __init__(self):
-        self._q = []
+        self._sizes = []
+        self._jobs = {}
+        self._pids = {}
         self._dev_name = "job pool"
 
+        # Order jobs arrived in
+        self._seq = {}
+        self._count = 0
+
+    def empty(self):
+        return not self._pids
+
+    def length(self):
+        return len(self._pids)
+
+    def contains(self, pid):
+        return pid in self._pids
+
     def enqueue(self, proc): 
         """ Add process to job pool, maintaining sorted order """
         proc.set_proc_loc(self._dev_name)
-        insort(self._q, proc)
+
+        size = proc.proc_size
+        if size not in self._jobs:
+            insort(self._sizes, size)
+            self._jobs[size] = OrderedDict()
+
+        self._jobs[size][proc.pid] = proc
+        self._pids[proc.pid] = size
+        self._count += 1
+        self._seq[proc.pid] = self._count
+        self._placed(proc)
         print proc.status()
 
+    def _remove(self, size, pid):
+        """ Remove and return process with given size & pid from index """
+        jobs = self._jobs[size]
+        proc = jobs.pop(pid)
+        del self._pids[pid]
+        del self._seq[pid]
+        self._removed(proc)
+
+        # No more jobs of this size
+        if not jobs:
+            del self._jobs[size]
+            del self._sizes[bisect_left(self._sizes, size)]
+
+        return proc
+
     def dequeue_largest(self, free_mem):
         """
         Dequeue and return largest job in job pool that will fit in given 
-        memory.
+        memory. If several jobs have that size, the one that has waited
+        longest is returned.
         """
         # Nothing to dequeue
-        if not self._q: 
+        if not self._pids: 
             raise IndexError
 
-        # Traverse list from largest first
-        # Pop & return process that is the largest that will fit in given memory
-        for p in reversed(self._q):
-            if p.proc_size <= free_mem:
-                return self._q.pop(self._q.index(p))
+        # Largest size that will fit in given memory
+        i = bisect_right(self._sizes, free_mem)
 
         # No process in queue will fit in given memory
-        raise InvalidProcess
+        if i == 0:
+            raise InvalidProcess
+
+        size = self._sizes[i-1]
+        return self._remove(size, next(iter(self._jobs[size])))
+
+    def dequeue_smallest(self, free_mem):
+        """
+        Dequeue and return smallest job in job pool, if it will fit in given
+        memory. If several jobs have that size, the one that has waited
+        longest is returned.
+        """
+        if not self._pids:
+            raise IndexError
+
+        if self._sizes[0] > free_mem:
+            raise InvalidProcess
+
+        size = self._sizes[0]
+        return self._remove(size, next(iter(self._jobs[size])))
+
+    def dequeue_oldest(self, lo, hi):
+        """
+        Dequeue and return the job that has waited longest, out of jobs with
+        size greater than lo and at most hi
+        """
+        oldest = None
+        for i in xrange(bisect_right(self._sizes, lo), bisect_right(self._sizes, hi)):
+            pid = next(iter(self._jobs[self._sizes[i]]))
+            if oldest is None or self._seq[pid] < self._seq[oldest]:
+                oldest = pid
+
+        if oldest is None:
+            raise InvalidProcess
+
+        return self._remove(self._pids[oldest], oldest)
+
+    def largest_size(self, free_mem):
+        """ Returns size of largest job that fits in given memory, or None """
+        i = bisect_right(self._sizes, free_mem)
+        return self._sizes[i-1] if i else None
+
+    def page_counts(self, pg_size, free_mem):
+        """
+        Returns dict of number of pages -> number of jobs needing that many
+        pages, for jobs that fit in given memory
+        """
+        counts = {}
+        for i in xrange(bisect_right(self._sizes, free_mem)):
+            size = self._sizes[i]
+            pages = pages_needed(size, pg_size)
+            counts[pages] = counts.get(pages, 0) + len(self._jobs[size])
+        return counts
 
     def dequeue(self, pid):
         """ Dequeue and return given process from job pool """
         # Nothing to dequeue
-        if not self._q: 
+        if not self._pids: 
             raise IndexError
 
-        for p in self._q:
-                if p.pid == pid:
-                    return self._q.pop(self._q.index(p))
         # Process not in queue
-        raise InvalidProcess
+        if pid not in self._pids:
+            raise InvalidProcess
+
+        return self._remove(self._pids[pid], pid)
+
+    def __iter__(self):
+        """ Iterates over jobs in pool from smallest to largest """
+        for size in self._sizes:
+            for p in self._jobs[size].itervalues():
+                yield p
 
     def snapshot(self):
         print " JOB POOL ".center(78, "-")
-        if self._q:
+        if self._pids:
             n=0
-            for p in self._q: 
+            for p in self: 
                 n += 1
                 if (n%5) is 0: # Print 5 jobs per row
                     print "P#" + str(p.pid) + " [Size: " + str(p.proc_size) + "] "
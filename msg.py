@@ -88,6 +88,73 @@ def get_pow_two(prompt, err_msg="Please enter a valid power of two"):
 		except:
 			print err(err_msg)
 
+def get_valid_choice(prompt, choices, default=None, err_msg="Please enter one of: "):
+	"""
+	Prompts until user enters one of the given choices (case insensitive).
+	Empty input returns default, if there is one.
+	"""
+	choices = [c.lower() for c in choices]
+	hint = "/".join(choices) + (", default " + default if default else "")
+	while True:
+		try:
+			choice = raw_input("{} ({}) >>> ".format(prompt, hint)).strip().lower()
+		except EOFError:
+			print "Goodbye"
+			raise SystemExit
+		if not choice and default:
+			return default
+		if choice in choices:
+			return choice
+		print err(err_msg + ", ".join(choices))
+
+def get_int_in_range(prompt, lo, hi=None, default=None):
+	"""
+	Prompts until user enters a whole number from lo to hi (inclusive), or
+	any number from lo up if hi is None. Empty input returns default, if
+	there is one.
+	"""
+	bounds = "{} to {}".format(lo, hi) if hi is not None else "{} or more".format(lo)
+	hint = bounds + (", default " + str(default) if default is not None else "")
+	while True:
+		try:
+			num = raw_input("{} ({}) >>> ".format(prompt, hint)).strip()
+		except EOFError:
+			print "Goodbye"
+			raise SystemExit
+		if not num and default is not None:
+			return default
+		try:
+			num = int(num)
+			if lo <= num and (hi is None or num <= hi):
+				return num
+		except ValueError:
+			pass
+		print err("Please enter a whole number from " + bounds)
+
+def get_float_in_range(prompt, lo, hi=None, default=None):
+	"""
+	Prompts until user enters a number from lo to hi (inclusive), or any
+	number from lo up if hi is None. Empty input returns default, if there
+	is one.
+	"""
+	bounds = "{} to {}".format(lo, hi) if hi is not None else "{} or more".format(lo)
+	hint = bounds + (", default " + str(default) if default is not None else "")
+	while True:
+		try:
+			num = raw_input("{} ({}) >>> ".format(prompt, hint)).strip()
+		except EOFError:
+			print "Goodbye"
+			raise SystemExit
+		if not num and default is not None:
+			return default
+		try:
+			num = float(num)
+			if lo <= num and (hi is None or num <= hi):
+				return num
+		except (ValueError, OverflowError):
+			pass
+		print err("Please enter a number from " + bounds)
+
 
 
 ## System messages
@@ -97,7 +164,8 @@ def command_list():
     T or t   -- Terminates active process in the CPU
     S or s   -- Enters snapshot mode.
                 View processes in the queues of devices
-                of a specified type
+                of a specified type, or a single process
+                by PID
     H or h   -- Displays list of valid commands.
     Q or q   -- Terminates the program.
     K# or k# -- Kill Process with pid number '#'.
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             paging.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Page replacement policies for demand paging.
+#                   Each policy tracks which frames are resident and picks a
+#                   victim frame to evict when memory is full. All operations
+#                   are O(1) amortised per memory reference.
+#                       - FIFO: evicts frame loaded longest ago
+#                       - LRU: evicts frame referenced longest ago
+#                       - Clock: sweeps a hand over all frames, giving frames
+#                         with their reference bit set another chance
+#                       - Second Chance: FIFO queue, giving frames with their
+#                         reference bit set another chance
+#                       - Working Set: releases frames not referenced in the
+#                         last `window` references, else evicts LRU frame
+
+from collections import deque
+
+class ReplacementPolicy:
+    """
+    Base class for page replacement policies, which track frames by number.
+    Each policy defines:
+        insert(frame)   frame has just been loaded with a page
+        remove(frame)   frame has been freed (i.e. its process terminated)
+        victim()        choose, stop tracking & return frame to evict
+    and may override touch & expired, which do nothing by default.
+    """
+
+    def __init__(self, num_frames):
+        self._num_frames = num_frames
+
+    def touch(self, frame):
+        """ Page in resident frame has been referenced """
+        pass
+
+    def expired(self):
+        """ Returns frames that should be released without a page fault """
+        return ()
+
+class QueuedPolicy(ReplacementPolicy):
+    """
+    Base for policies that evict from the head of a queue of frames. Frames
+    are queued with a stamp. Requeuing or removing a frame changes its stamp,
+    so old queue entries are skipped lazily instead of searched for.
+    """
+
+    def __init__(self, num_frames):
+        ReplacementPolicy.__init__(self, num_frames)
+        self._q = deque()
+        self._stamp = [0] * num_frames
+        self._time = 0
+
+    def _push(self, frame):
+        self._time += 1
+        self._stamp[frame] = self._time
+        self._q.append((self._time, frame))
+
+        # Drop old entries once they outnumber live ones
+        if len(self._q) > 2 * self._num_frames + 16:
+            self._q = deque(e for e in self._q if self._stamp[e[1]] == e[0])
+
+    def insert(self, frame):
+        self._push(frame)
+
+    def remove(self, frame):
+        self._stamp[frame] = 0
+
+    def victim(self):
+        while True:
+            t, f = self._q.popleft()
+            if self._stamp[f] == t:
+                self._stamp[f] = 0
+                return f
+
+class FIFO(QueuedPolicy):
+    pass
+
+class LRU(QueuedPolicy):
+
+    def touch(self, frame):
+        # Requeue frame at most recently used end
+        self._push(frame)
+
+class Clock(ReplacementPolicy):
+
+    def __init__(self, num_frames):
+        ReplacementPolicy.__init__(self, num_frames)
+        self._resident = bytearray(num_frames)
+        self._ref = bytearray(num_frames)
+        self._hand = 0
+
+    def insert(self, frame):
+        self._resident[frame] = 1
+        self._ref[frame] = 1
+
+    def touch(self, frame):
+        self._ref[frame] = 1
+
+    def remove(self, frame):
+        self._resident[frame] = 0
+        self._ref[frame] = 0
+
+    def victim(self):
+        # Each frame passed over has its reference bit cleared, so the hand
+        # goes round at most once more than there were references
+        while True:
+            f = self._hand
+            self._hand = (f + 1) % self._num_frames
+            if self._resident[f]:
+                if self._ref[f]:
+                    self._ref[f] = 0
+                else:
+                    self._resident[f] = 0
+                    return f
+
+class SecondChance(ReplacementPolicy):
+
+    def __init__(self, num_frames):
+        ReplacementPolicy.__init__(self, num_frames)
+        self._q = deque()
+        self._ref = bytearray(num_frames)
+
+        # Frames are queued with the number of times they've been loaded, so
+        # queue entries for frames since removed can be skipped
+        self._loads = [0] * num_frames
+        self._resident = bytearray(num_frames)
+
+    def insert(self, frame):
+        self._loads[frame] += 1
+        self._resident[frame] = 1
+        self._ref[frame] = 0
+        self._q.append((frame, self._loads[frame]))
+
+    def touch(self, frame):
+        self._ref[frame] = 1
+
+    def remove(self, frame):
+        self._resident[frame] = 0
+
+    def victim(self):
+        while True:
+            f, n = self._q.popleft()
+            if not self._resident[f] or n != self._loads[f]:
+                continue
+            if self._ref[f]:
+                self._ref[f] = 0
+                self._q.append((f, n))
+            else:
+                self._resident[f] = 0
+                return f
+
+class WorkingSet(LRU):
+    """
+    Time is counted in memory references. A frame leaves the working set
+    once it hasn't been referenced in the last `window` references.
+    """
+
+    def __init__(self, num_frames, window=1000):
+        LRU.__init__(self, num_frames)
+        self._window = window
+
+    def expired(self):
+        """ Release frames that have left the working set """
+        oldest = self._time - self._window
+        frames = []
+        while self._q and self._q[0][0] <= oldest:
+            t, f = self._q.popleft()
+            if self._stamp[f] == t:
+                self._stamp[f] = 0
+                frames.append(f)
+        return frames
+
+replacement_policies = {
+    "fifo": FIFO,
+    "lru": LRU,
+    "clock": Clock,
+    "second": SecondChance,
+    "ws": WorkingSet,
+}
@@ -11,14 +11,37 @@
 
 from __future__ import division
 import sys
-from functools import total_ordering
+from array import array
 from math import floor, ceil
-import io
+
+# NumPy is only needed for batch address translation
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 param_fields = ["file","log", "phys" ,"rw","len", "cyl"]
 
-@total_ordering
-class PCB:
+# CFS weight of each nice value from -20 to 19, as in Linux. Each step in nice
+# value is about a 10% change in share of the CPU. A process's virtual runtime
+# goes up by its CPU time scaled by nice_0_weight / weight
+nice_weights = [
+    88761, 71755, 56483, 46273, 36291, 29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906, 3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423, 335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45, 36, 29, 23, 18, 15]
+nice_0_weight = 1024
+
+# Page table entry for a page that is not in a frame
+no_frame = -1
+
+class PCB(object):
+
+    __slots__ = ["pid", "proc_loc", "proc_size", "pg_size", "_params", "alpha",
+        "burst_count", "burst_total", "last_burst", "last_est_burst",
+        "next_est_burst", "curr_burst", "page_table", "pager", "page_faults",
+        "evictions", "arrival", "first_run", "level", "level_time", "vruntime",
+        "weight", "rel_deadline", "period", "release", "deadline"]
 
     def __init__(self, id_num, size, pages, page_size, alpha, tau, loc="ready"): 
         """
@@ -31,16 +54,49 @@ class PCB:
         self.proc_size = size
         self.pg_size = page_size
 
-        # Set params & burst history
-        self.params = dict.fromkeys(param_fields)
+        # Set params & burst history. Only running totals of bursts are kept.
+        # Params are only set up when a system call needs them
+        self._params = None
         self.alpha = alpha
-        self.burst_history = []
+        self.burst_count = 0
+        self.burst_total = 0
+        self.last_burst = 0
         self.last_est_burst = tau
         self.next_est_burst = tau
         self.curr_burst = 0
 
-        # Set up empty page table
-        self.page_table = dict.fromkeys(range(pages))
+        # Set up empty page table, as an array of frame numbers
+        self.page_table = array('i', [no_frame]) * pages
+
+        # Memory that loads pages on reference, if demand paged
+        self.pager = None
+        self.page_faults = 0
+        self.evictions = 0
+
+        # CPU clock time process first arrived in & first ran in the CPU,
+        # and its MLFQ level & time used at that level
+        self.arrival = None
+        self.first_run = None
+        self.level = 0
+        self.level_time = 0
+
+        # CFS virtual runtime & weight (nice value 0 unless set)
+        self.vruntime = 0
+        self.weight = nice_0_weight
+
+        # EDF relative deadline & period, if process has them, and release
+        # time & absolute deadline of its current CPU burst
+        self.rel_deadline = None
+        self.period = None
+        self.release = None
+        self.deadline = None
+
+    @property
+    def params(self):
+        """ System call params, empty unless a system call has set them """
+        if self._params is None:
+            self._params = dict.fromkeys(param_fields)
+        return self._params
 
     def set_proc_loc(self, p_loc):
         """ Sets location of process, i.e. which queue/device it is in"""
@@ -79,19 +135,19 @@ class PCB:
                 print"{:^{w}}".format(str(val)[:6] if val else "--", w=len(key)+2),
 
         print "{:^5}".format(str(int(self.avg_burst_time()))),
-        print "{:^5}".format(str(sum(self.burst_history))),
+        print "{:^5}".format(str(self.tot_burst_time())),
         print "{:^6}".format(str(self.proc_size)),
 
         self.display_page_table()
 
     def display_page_table(self):
         l = 0
-        for page,frame in self.page_table.iteritems(): 
+        for page,frame in enumerate(self.page_table): 
             l += 1
             if l > 1: 
-                print "{:^8}{:^8}".format(hex(page),hex(frame)).rjust(76)
+                print "{:^8}{:^8}".format(hex(page),hex(frame) if frame != no_frame else "--").rjust(76)
             else: 
-                print "{:^8}{:^8}".format(hex(page),hex(frame))
+                print "{:^8}{:^8}".format(hex(page),hex(frame) if frame != no_frame else "--")
         print ""
 
 
@@ -107,58 +163,6 @@ class PCB:
 
         print "{:^4}|{:^5}|{:^6}|{:^8}|{:^8}".format("Avg", "Tot", "Size","Page", "Frame")
 
-    ## Methods to compare PCBs
-
-    def __eq__(self, other):
-        """
-        Compares equality based on different parameters that depend on which
-        queue PCB is in.
-
-        If in ready queue, compare based on next estimated burst time.
-        If in disk drive queue, compare based on requested cylinder.
-        Else, compare by PID.
-        """
-        # If process is in ready queue or CPU, compare using next est burst
-        if self.proc_loc.lower()[0] == "r" or self.proc_loc.lower() == "cpu":
-            return self.next_est_burst == other.next_est_burst
-
-        # If process is in disk drive, compare using cylinder number
-        elif self.proc_loc.lower()[0] is "d":
-            return self.params["cyl"] == other.params["cyl"]
-
-        # If process is in job pool, compare using process size
-        elif self.proc_loc.lower()[0] is "j":
-            return self.proc_size == other.proc_size
-
-        # All other locations, compare using PID
-        else:
-            return self.pid == other.pid
-
-    def __lt__(self, other):
-        """
-        Compares PCBs based on different parameters depending on which queue PCB
-        is in.
-
-        All other comparisons (>, <= and >=) are generated by
-        functools/total_ordering
-        """
-        # If process is in ready queue or CPU, compare using next est burst
-        if self.proc_loc.lower()[0] == "r" or self.proc_loc.lower() == "cpu":
-            return self.next_est_burst < other.next_est_burst
-        
-        # If process is in disk drive, compare using cylinder number
-        elif self.proc_loc.lower()[0] is "d":
-            return self.params["cyl"] < other.params["cyl"]
-
-        # If process is in job pool, compare using process size
-        elif self.proc_loc.lower()[0] is "j":
-            return self.proc_size < other.proc_size
-
-        # All other locations, compare using PID
-        else:
-            return self.pid < other.pid
-
-
     ## Calculating burst times
 
     def calc_next_est_burst (self):
@@ -166,7 +170,7 @@ class PCB:
         Calculates next estimated burst time based on previous estimated burst
         time, last recorded burst time, and history parameter alpha
         """
-        self.next_est_burst = (self.burst_history[-1] * (1-self.alpha)) + (self.last_est_burst * self.alpha)
+        self.next_est_burst = (self.last_burst * (1-self.alpha)) + (self.last_est_burst * self.alpha)
         self.last_est_burst = self.next_est_burst
 
     def record_burst_time(self, burst): 
@@ -175,7 +179,10 @@ class PCB:
         burst time with given input
         """
         self.curr_burst += burst
-        self.burst_history.append(self.curr_burst)
+        self.vruntime += burst * nice_0_weight / self.weight
+        self.burst_count += 1
+        self.burst_total += self.curr_burst
+        self.last_burst = self.curr_burst
         self.calc_next_est_burst()
 
     def update_burst_time(self, elapsed):
@@ -185,6 +192,7 @@ class PCB:
         """
         # Update current burst record with elapsed CPU time
         self.curr_burst += elapsed
+        self.vruntime += elapsed * nice_0_weight / self.weight
 
         # Next est burst cannot be less than 0
         if self.next_est_burst - elapsed >= 0: 
@@ -196,13 +204,17 @@ class PCB:
         """
         Returns average burst time for each CPU burst
         """
-        return sum(self.burst_history) / len(self.burst_history) if self.burst_history else 0
+        return self.burst_total / self.burst_count if self.burst_count else 0
 
     def tot_burst_time(self):
         """ 
         Returns total of all CPU bursts
         """
-        return sum(self.burst_history)
+        return self.burst_total
+
+    def set_nice(self, nice):
+        """ Sets CFS weight from nice value, -20 (highest priority) to 19 """
+        self.weight = nice_weights[nice + 20]
 
     def clear_curr_burst (self):
         """
@@ -212,75 +224,138 @@ class PCB:
 
     ## Allocating Memory
     def allocate_memory(self, page, frame): 
-        if page in self.page_table:
+        if 0 <= page < len(self.page_table):
             self.page_table[page] = frame
         else: 
             raise IndexError
 
 
+    def translate(self, l, tlb=None):
+        """
+        Returns physical address for given logical address, looking up the
+        page in the TLB first if one is given. If demand paged, the page is
+        referenced through memory, loading it on a page fault.
+        Precondition: l < proc_size
+        """
+        offset = int(l % self.pg_size)
+        pg = int(floor(l / self.pg_size))
+
+        if tlb is None:
+            frame = self.lookup_frame(pg)
+        else:
+            frame = tlb.lookup(self.pid, pg)
+            if frame is None:
+                frame = self.lookup_frame(pg)
+                tlb.insert(self.pid, pg, frame)
+            elif self.pager:
+                # TLB hits still count as a reference for page replacement
+                self.pager.reference(self, pg)
+
+        return (self.pg_size * frame) + offset
+
+    def translate_batch(self, addrs):
+        """
+        Translates an array of logical addresses in one go, using NumPy.
+        Returns an array of physical addresses and a boolean mask of entries
+        whose page is not in a frame (only possible if demand paged). Masked
+        entries have a physical address of -1. Pages are not loaded or
+        referenced, so demand paging & TLB stats are not affected.
+        Raises InvalidAddress if any address is negative or at or beyond the
+        end of the process.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for batch address translation")
+
+        addrs = np.asarray(addrs, dtype=np.int64)
+        out_of_range = (addrs < 0) | (addrs >= self.proc_size)
+        if out_of_range.any():
+            raise InvalidAddress(int(addrs[out_of_range][0]))
+
+        frames = self.frame_array()[addrs // self.pg_size]
+        invalid = frames < 0
+        phys = np.where(invalid, -1, frames * self.pg_size + addrs % self.pg_size)
+        return phys, invalid
+
+    def frame_array(self):
+        """ Returns page table as a NumPy array of frames, no_frame if not in a frame """
+        return np.frombuffer(self.page_table, dtype=np.intc).astype(np.int64)
+
+    def lookup_frame(self, pg):
+        """ Returns frame given page is in, from the page table """
+        return self.pager.reference(self, pg) if self.pager else self.page_table[pg]
+
     ## Setting/clearing system call params for pcb
-    def set_syst_call_params(self):
+
+    def valid_address(self, l):
+        """ True if l is a logical address inside process """
+        return 0 <= l < self.proc_size
+
+    def valid_length(self, l):
+        """ True if a file of length l fits in process after its starting location """
+        return 0 < l and l + self.params["log"] <= self.proc_size
+
+    def set_syst_call_params(self, file_name, l, tlb=None):
         """
-        Sets system call params for file name & starting memory location
+        Sets system call params for file name & starting memory location l,
+        translating through given TLB if there is one. Raises InvalidAddress
+        if l is not inside process.
         """
-        self.params["file"] = raw_input("File Name >>> ")
-
-        set_loc = False
-        while not set_loc: 
-            l = io.get_valid_hex("Starting Memory Location in Hex")
-            if l < self.proc_size: 
-                set_loc = True
-                offset = int(l % self.pg_size)
-                pg = int(floor(l / self.pg_size))
-                self.params["log"] = l
-                self.params["phys"] = (self.pg_size * self.page_table[pg]) + offset
-            else: 
-                print io.err("Invalid starting memory location")
+        if not self.valid_address(l):
+            raise InvalidAddress(l)
 
-    def set_read_write_params(self, dev_type):
+        self.params["file"] = file_name
+        self.params["log"] = l
+        self.params["phys"] = self.translate(l, tlb)
+
+    def set_read_write_params(self, dev_type, rw=None, length=None):
         """
-        Sets system call params for read/write and file length (if write)
+        Sets system call params for read/write and file length (if write).
+        Printers are always written to. Raises ValueError for invalid params.
+        Precondition: starting memory location is set
         """
-        if (dev_type.lower() == "printer"):
-            self.params["rw"] = "w"
-        else: 
-            while self.params["rw"] == None:
-                rw = raw_input("Read or Write? >>> ")
-                if rw.lower() in ["r", "read"]:
-                    self.params["rw"] = "r"
-                elif rw.lower() in ["w", "write"]:
-                    self.params["rw"] = "w"
-                else: 
-                    print io.err("Invalid read/write parameters")
-                    print "Please enter either 'r', 'read', 'w' or 'write'"
-
-        if self.params["rw"] == "w":
-            set_len = False
-            while not set_len:
-                l = io.get_valid_int("File Length")
-
-                if l + self.params["log"] <= self.proc_size: 
-                    self.params["len"] = l
-                    set_len = True
-                else: 
-                    print io.err("Invalid length (too long)")
-
-
-    def set_cylinder_params(self, max_num_cylinders):
+        if dev_type.lower() == "printer":
+            rw = "w"
+        else:
+            rw = parse_rw(rw)
+            if rw is None:
+                raise ValueError("Invalid read/write parameters")
+
+        if rw == "w" and not self.valid_length(length):
+            raise ValueError("Invalid length (too long)")
+
+        self.params["rw"] = rw
+        if rw == "w":
+            self.params["len"] = length
+
+    def set_cylinder_params(self, cyl, max_num_cylinders):
         """
-        Prompts user for which disk drive cylinder to access, validates 
-        input and sets appropriate system call parameter.
+        Sets which disk drive cylinder to access. Raises ValueError if it is
+        not on the disk.
 
         Precondition: Process is in disk drive
         """
-        while self.params["cyl"] == None:
-            c = io.get_valid_int("Cylinder")
-            if c > max_num_cylinders: 
-                print "Invalid cylinder number. Please try again."
-            else: 
-                self.params["cyl"] = c
+        if not 0 <= cyl <= max_num_cylinders:
+            raise ValueError("Invalid cylinder number")
+        self.params["cyl"] = cyl
 
     def clear_params(self):
         """ Clears all system call & read/write params """
-        for p in self.params:
-            self.params[p] = None
+        self._params = None
+
+def parse_rw(rw):
+    """ Returns "r" or "w" for read or write given as 'r', 'read', 'w' or 'write', else None """
+    rw = (rw or "").lower()
+    if rw in ["r", "read"]:
+        return "r"
+    if rw in ["w", "write"]:
+        return "w"
+    return None
+
+class InvalidAddress(Exception):
+    """
+    Exception raised for logical address outside of process
+    """
+    def __init__(self,value):
+        self.value = value
+    def __str__(self):
+        return repr(self.value)
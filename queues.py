@@ -6,25 +6,76 @@
 # Created:          February 27, 2015
 # Last Updated:     May 9, 2015
 # Description:      Classes for different types of queues in the system.
-#                       - FIFO Queue implemented with deque
-#                       - Priority Queue implemented with min heap
+#                       - FIFO Queue implemented with ordered dict of
+#                           pid -> process, in order enqueued
+#                       - Priority Queue implemented with indexed min heap
+#                           Entries are ordered by a key computed once when
+#                           they are enqueued, then by order enqueued
+#                           Processes can be removed or reprioritized by pid
 #                           Priority can be frozen or unfrozen
 #                           Raises FrozenQueueError if enqueing to frozen queue
 #                   Contains methods allowing user to view what is in the
 #                   queue and enqueue or dequeue a process.
 
 import sys 
-from collections import deque
+from collections import OrderedDict
+from itertools import count, islice
 import heapq
-import io
+import msg
 from pcb import PCB
 
+## Sort keys for priority queues
+
+def by_pid(proc):
+    return proc.pid
+
+def by_est_burst(proc):
+    return proc.next_est_burst
+
+def by_vruntime(proc):
+    return proc.vruntime
+
+def by_deadline(proc):
+    # Processes without a deadline run after all those with one
+    return proc.deadline if proc.deadline is not None else float("inf")
+
+def by_release(proc):
+    return proc.release
+
+def by_cylinder(proc):
+    return proc.params["cyl"]
+
 class Queue:
 
+    # Registry of where every process is, and the device this queue is part
+    # of (if not a device itself). Set by set_registry
+    _registry = None
+    _owner = None
+
     def __init__(self):
         self._q = None
         self._dev_name = None
 
+    ## Keeping registry up to date
+
+    def set_registry(self, registry, owner=None):
+        """
+        Registry to update whenever a process enters or leaves queue. Owner is
+        the device this queue belongs to, if queue isn't a device itself.
+        """
+        self._registry = registry
+        self._owner = owner
+
+    def _placed(self, proc):
+        """ Records that process has been added to this queue """
+        if self._registry is not None:
+            self._registry.place(proc, self._owner or self, self)
+
+    def _removed(self, proc):
+        """ Records that process has been taken out of this queue """
+        if self._registry is not None:
+            self._registry.remove(proc.pid)
+
     def empty(self):
         return True if not self._q else False
     
@@ -37,11 +88,10 @@ class Queue:
         return any(p.pid == pid for p in self._q) if self._q else False
 
     ## Set PCB attributes
-    def record_burst(self, proc):
+    def record_burst(self, proc, burst):
         """
-        Get and update burst time for process proc
+        Update burst time for process proc
         """
-        burst = io.get_valid_int("Time since last interrupt")
         proc.record_burst_time(burst)
 
     ## Terminate a given process
@@ -63,33 +113,36 @@ class Queue:
 
 
     ## View what's in the queue
-    def snapshot(self):
+    def snapshot(self, procs=None):
         """
         Prints a paginated view of processes & process parameters in 
-        queue.
+        queue, or of given processes. Processes are read from procs one page
+        at a time, so it may be a lazy iterator.
         """
-        if self._q: 
-            
-            # max number of lines to show
-            max_height = 18
-            start = 0
-            end = max_height
+        if procs is None:
+            procs = self._q
+        procs = iter(procs)
 
-            while start < len(self._q):
+        # max number of lines to show
+        max_height = 18
+        page = list(islice(procs, max_height))
 
-                if end > len(self._q):
-                    end = len(self._q)
+        if page: 
+
+            while page:
 
                 # Parameter field headers
-                self._q[0].headers()
+                page[0].headers()
 
-                print io.ruler()
+                print msg.ruler()
                 
-                for p in range(start, end):
+                for p in page:
                     # Print single process in queue
-                    self._q[p].snapshot()
+                    p.snapshot()
+
+                page = list(islice(procs, max_height))
 
-                if end < len(self._q): 
+                if page: 
                     try: 
                         print ""
                         raw_input("\t" + "... press any key to view next items in queue ...")
@@ -97,9 +150,6 @@ class Queue:
                     except EOFError: 
                         print "Goodbye"
                         raise SystemExit
-
-                start += max_height
-                end += max_height
         else:
 
             print '{:^78}'.format("EMPTY: No processes in queue") + "\n"
@@ -107,40 +157,65 @@ class Queue:
 class FIFOQueue(Queue): 
 
     def __init__(self): 
-    	""" Initialize class with empty queue """
-    	self._q = deque()
+    	"""
+    	Initialize class with empty queue. Processes are kept by pid in the
+    	order they were enqueued, so they can be found or removed by pid
+    	without searching the queue
+    	"""
+    	self._q = OrderedDict()
+
+    def contains(self, pid):
+        return pid in self._q
 
     def enqueue(self, proc):
         """ Add process to end of queue """
-        self._q.append(proc)
+        self._q[proc.pid] = proc
+        self._placed(proc)
 
     def dequeue(self):
         """ Removes & returns process at head of queue """
         try: 
-            head = self._q.popleft()
-        except IndexError: 
-            raise
+            pid, head = self._q.popitem(last=False)
+        except KeyError: 
+            raise IndexError
         else: 
+            self._removed(head)
             return head
 
     def pop(self,pid):
         """
-        Remove and return task with given pid
+        Remove and return task with given pid, or None if not in queue
         """
-        for p in self._q:
-            if p.pid == pid:
-                proc = p 
-                self._q.remove(p)
-                return proc
+        proc = self._q.pop(pid, None)
+        if proc is not None:
+            self._removed(proc)
+        return proc
+
+    def snapshot(self):
+        """ Prints paginated view of processes in queue, in order """
+        Queue.snapshot(self, self._q.itervalues())
 
 class PriorityQueue(Queue):
 
-    def __init__(self, f = False):
+    def __init__(self, f = False, key = by_pid):
         """
-        Initialize with empty min heap, and an unfrozen queue
+        Initialize with empty min heap, and an unfrozen queue. Processes are
+        ordered by key(proc), worked out when they are enqueued, and then in
+        the order they were enqueued. Heap entries are (key, seq, proc)
+        tuples, so processes themselves are never compared.
+
+        The heap is indexed: the position of each pid in the heap is kept up
+        to date as entries move, so a process can be found, removed or have
+        its priority changed in O(log n).
         """
         self._q = []
+        self._pos = {}
         self._frozen = f
+        self._key = key
+        self._seq = count()
+
+    def contains(self, pid):
+        return pid in self._pos
 
     ## Methods to freeze/unfreeze queue
     def is_frozen(self):
@@ -152,6 +227,58 @@ class PriorityQueue(Queue):
     def unfreeze(self):
         self._frozen = False
 
+    ## Keeping heap in order
+
+    def _sift_up(self, i):
+        """ Moves entry at i towards root until its parent is smaller """
+        q, pos = self._q, self._pos
+        e = q[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if e < q[parent]:
+                q[i] = q[parent]
+                pos[q[i][-1].pid] = i
+                i = parent
+            else:
+                break
+        q[i] = e
+        pos[e[-1].pid] = i
+
+    def _sift_down(self, i):
+        """ Moves entry at i towards leaves until its children are larger """
+        q, pos = self._q, self._pos
+        n = len(q)
+        e = q[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and q[child + 1] < q[child]:
+                child += 1
+            if q[child] < e:
+                q[i] = q[child]
+                pos[q[i][-1].pid] = i
+                i = child
+            else:
+                break
+        q[i] = e
+        pos[e[-1].pid] = i
+
+    def _remove_at(self, i):
+        """ Removes and returns process at position i in heap """
+        q = self._q
+        last = q.pop()
+        if i < len(q):
+            removed = q[i]
+            q[i] = last
+            self._sift_down(i)
+            self._sift_up(self._pos[last[-1].pid])
+        else:
+            removed = last
+        del self._pos[removed[-1].pid]
+        self._removed(removed[-1])
+        return removed[-1]
+
     ## Enqueue/Dequeue methods
     def enqueue(self, proc):
         """
@@ -159,7 +286,9 @@ class PriorityQueue(Queue):
         is not frozen.
         """
         if not self._frozen:
-            heapq.heappush(self._q,proc)
+            self._q.append((self._key(proc), next(self._seq), proc))
+            self._sift_up(len(self._q) - 1)
+            self._placed(proc)
         else: 
             raise FrozenQueueError("Cannot enqueue to frozen queue")
 
@@ -167,32 +296,63 @@ class PriorityQueue(Queue):
         """
         Remove and return task with lowest priority
         """
-        return heapq.heappop(self._q)
+        if not self._q:
+            raise IndexError
+        return self._remove_at(0)
 
     def pop(self,pid):
         """
-        Remove and return task with given pid
+        Remove and return task with given pid, or None if not in queue
+        """
+        if pid in self._pos:
+            return self._remove_at(self._pos[pid])
+
+    def update(self, pid):
+        """
+        Recomputes key of process with given pid after its priority has
+        changed, and moves it to its new place in the heap. It keeps its
+        place among processes with the same key.
         """
-        for p in self._q:
-            if p.pid == pid:
-                return self._q.pop(self._q.index(p))
+        i = self._pos[pid]
+        key, seq, proc = self._q[i]
+        self._q[i] = (self._key(proc), seq, proc)
+        self._sift_down(i)
+        self._sift_up(self._pos[pid])
 
     ## Methods to see what's in the queue
+    def ordered(self):
+        """
+        Yields processes in the order they will be processed, without
+        changing the heap. A second heap holds the heap entries that could be
+        next, starting from the root: each time the smallest is taken, its
+        children join. So the first k processes take O(k log k), not a
+        full sort.
+        """
+        q = self._q
+        if not q:
+            return
+
+        frontier = [(q[0], 0)]
+        while frontier:
+            e, i = heapq.heappop(frontier)
+            yield e[-1]
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(q):
+                    heapq.heappush(frontier, (q[child], child))
+
     def snapshot(self):
         """
         Prints a paginated view of processes & process parameters in 
-        queue, in the order they will be processed
+        queue, in the order they will be processed. Only as many processes
+        as are shown are taken from the heap, and the heap is not changed
         """
-        # Must sort heap first to display processes in order
-        # Python's sort is O(n logn)... is there a better way to do this?
-        self._q.sort()
-        Queue.snapshot(self)
+        Queue.snapshot(self, self.ordered())
 
     def head(self):
         """
         Return process at head of queue, but do not dequeue
         """
-        return self._q[0]
+        return self._q[0][-1]
 
 
 class FrozenQueueError(Exception):
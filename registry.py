@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             registry.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Registry of every live process in the system, and where
+#                   it currently is. Queues & devices keep it up to date as
+#                   they enqueue & dequeue processes, so any process can be
+#                   found by pid in constant time.
+
+import msg
+
+class Registry:
+
+    def __init__(self):
+        """ Initialize empty registry of pid -> (PCB, device, queue) """
+        self._procs = {}
+
+    def place(self, proc, device, queue=None):
+        """
+        Records that process is now in given device (the CPU, a device or the
+        job pool), in the given queue of that device. If queue is None, the
+        process is active in the device rather than waiting in a queue.
+        """
+        self._procs[proc.pid] = (proc, device, queue)
+
+    def remove(self, pid):
+        """ Process is no longer in any device, i.e. it is being moved or has terminated """
+        self._procs.pop(pid, None)
+
+    ## Looking up processes
+
+    def __contains__(self, pid):
+        return pid in self._procs
+
+    def __len__(self):
+        return len(self._procs)
+
+    def lookup(self, pid):
+        """ Returns (PCB, device, queue) for given pid, or None if not found """
+        return self._procs.get(pid)
+
+    def get_proc(self, pid):
+        entry = self._procs.get(pid)
+        return entry[0] if entry else None
+
+    def get_device(self, pid):
+        entry = self._procs.get(pid)
+        return entry[1] if entry else None
+
+    def status(self, pid):
+        """ Returns which queue/device process is in """
+        entry = self._procs.get(pid)
+        return entry[0].status() if entry else msg.err("Process does not exist")
+
+    def snapshot(self, pid):
+        """ Prints PCB of given process """
+        entry = self._procs.get(pid)
+        if entry:
+            print msg.snapshot_header(entry[0].status())
+            entry[0].headers()
+            print msg.ruler()
+            entry[0].snapshot()
+        else:
+            print msg.err("Process does not exist")
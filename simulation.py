@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             simulation.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Discrete event simulation of a system. Instead of a user
+#                   entering the time since the last interrupt, time is kept
+#                   by a virtual clock, and everything that happens is an
+#                   event on a calendar ordered by time:
+#                       - a job arriving & becoming a new process
+#                       - a CPU burst finishing, after which the process
+#                         requests its next device, or terminates
+#                       - the CPU scheduling policy preempting the active
+#                         process at the end of its quantum or slice
+#                       - a device finishing the request at its head
+#                   The calendar is a heap, so scheduling & taking the next
+#                   event are O(log n) in the number of pending events. Jobs
+#                   are read from any iterable (such as a generator) only as
+#                   each one arrives, so runs of any length use memory only
+#                   for the processes alive at once.
+
+from __future__ import division
+import heapq
+from collections import namedtuple
+from itertools import count
+
+from pcb import InvalidAddress
+
+# A job arriving at given time, as a process of given size. It runs for each
+# CPU burst in turn, requesting a device in between: io has one system call
+# per burst but the last, each (device name, file name, address, rw, length,
+# cylinder). After the last burst it terminates. nice, deadline & period are
+# as for System.new_process.
+Job = namedtuple("Job", "time size bursts io nice deadline period")
+Job.__new__.__defaults__ = ((), None, None, None)
+
+# Time each type of device takes to complete a request, unless given
+service_times = {
+    "Disk Drive": 8,
+    "Printer": 20,
+    "CD/RW": 12,
+}
+
+# Kinds of event
+ARRIVAL, BURST_DONE, PREEMPT, SERVICE_DONE = range(4)
+
+class EventCalendar:
+    """
+    Pending events ordered by time, and the virtual clock. Events at the
+    same time are taken in the order they were scheduled. Taking an event
+    moves the clock on to its time.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self._events = []
+        self._seq = count()
+
+    def __len__(self):
+        return len(self._events)
+
+    def peek(self):
+        """ Time of next event. Raises IndexError if there are none """
+        return self._events[0][0]
+
+    def schedule(self, delay, kind, target=None, token=None):
+        """ Schedules event of given kind, for target, delay after now """
+        heapq.heappush(self._events, (self.now + delay, next(self._seq), kind, target, token))
+
+    def next(self):
+        """
+        Removes next event, returning (kind, target, token) and time passed
+        since the last one. Raises IndexError if there are none.
+        """
+        time, seq, kind, target, token = heapq.heappop(self._events)
+        elapsed = time - self.now
+        self.now = time
+        return kind, target, token, elapsed
+
+class Simulator:
+
+    def __init__(self, system, service=None):
+        """
+        Sets up simulation of given system. service maps device type to
+        the time its devices take to complete a request, either a number
+        or a function of the device (by default service_times).
+        """
+        self.system = system
+        self.calendar = EventCalendar()
+        self._service = dict(service_times, **(service or {}))
+
+        # Single CPU is treated as a multi-core CPU with one core
+        self._multicore = system.cores > 1
+        self._cores = system.cpu.cores if self._multicore else [system.cpu]
+
+        # Active process each core's events are for, as (pid, token, time of
+        # preemption event). Events with an old token are out of date, as
+        # the core has since switched process, and are ignored
+        self._running = [None] * len(self._cores)
+        self._tokens = count(1)
+
+        # Each process's job & which of its bursts it is on, devices with a
+        # request being serviced, and jobs yet to arrive
+        self._jobs = {}
+        self._burst = {}
+        self._busy = set()
+        self._arrivals = iter(())
+
+        # Stats
+        self.events = 0
+        self.arrived = 0
+        self.rejected = 0
+        self.io_errors = 0
+
+    ## Running
+
+    def run(self, jobs, until=None, max_events=None):
+        """
+        Runs jobs (any iterable of Job, in order of arrival time) through
+        the system until no events are left, the clock passes until, or
+        max_events have been handled. Returns number of events handled.
+        """
+        self._arrivals = iter(jobs)
+        self._next_arrival()
+
+        handlers = (self._arrive, None, self._preempt, self._service_done)
+        calendar = self.calendar
+        elapse = self.system.cpu.elapse
+        handled = 0
+
+        try:
+            while calendar and (max_events is None or handled < max_events):
+                if until is not None and calendar.peek() > until:
+                    break
+                kind, target, token, elapsed = calendar.next()
+
+                if kind == BURST_DONE and self._current(target, token):
+                    # Time passed is given to the system call or termination
+                    # of the finishing process, so its burst is recorded
+                    # before the CPU policy can switch it out
+                    self._burst_done(target, elapsed)
+                else:
+                    # Active processes have run until now
+                    if elapsed:
+                        elapse(elapsed)
+                    if kind != BURST_DONE:
+                        handlers[kind](target, token)
+
+                self._dispatch()
+                handled += 1
+        finally:
+            # Counted even if run is stopped part way
+            self.events += handled
+        return handled
+
+    def _next_arrival(self):
+        """ Schedules arrival of next job, if there is one """
+        for job in self._arrivals:
+            self.calendar.schedule(max(job.time - self.calendar.now, 0), ARRIVAL, job)
+            return
+
+    def _dispatch(self):
+        """
+        Schedules the end of the current burst (and any preemption before
+        it) of each core's active process, if it has changed. Preemption is
+        brought forward if the policy now wants to preempt sooner. An idle
+        core holding processes until their release is woken up then.
+        """
+        for i, core in enumerate(self._cores):
+            proc = core.active
+            pid = proc.pid if proc else None
+            running = self._running[i]
+
+            # Time of next preemption, unless it is too soon to move the
+            # clock on, in which case it is left for the next event
+            now = self.calendar.now
+            preempt_at = core.time_to_preempt()
+            if preempt_at is not None:
+                preempt_at = now + preempt_at
+                if preempt_at <= now:
+                    preempt_at = None
+
+            if proc is None and preempt_at is None:
+                self._running[i] = None
+                continue
+            if running is not None and running[0] == pid:
+                if preempt_at is None or preempt_at >= running[2]:
+                    continue
+
+            token = next(self._tokens)
+            if proc is None:
+                # Nothing to finish, only a wake up
+                self.calendar.schedule(preempt_at - now, PREEMPT, i, token)
+                self._running[i] = (None, token, preempt_at)
+                continue
+
+            left = max(self._jobs[pid].bursts[self._burst[pid]] - proc.curr_burst, 0)
+            self.calendar.schedule(left, BURST_DONE, i, token)
+
+            # Preempting at or after the end of the burst makes no
+            # difference, as the CPU acts on it as the burst is recorded
+            if preempt_at is not None and preempt_at < now + left:
+                self.calendar.schedule(preempt_at - now, PREEMPT, i, token)
+            else:
+                preempt_at = now + left
+            self._running[i] = (pid, token, preempt_at)
+
+    def _current(self, i, token):
+        """ True if event for core i with given token is still up to date """
+        running = self._running[i]
+        return running is not None and running[1] == token
+
+    def _on_core(self, i):
+        """ Next system call or termination is for core i """
+        if self._multicore:
+            self.system.cpu.current = i
+
+    def _start(self, dev):
+        """ Device starts servicing its next request, if it has one and is idle """
+        name = dev.get_dev_name()
+        if name in self._busy or not dev.length():
+            return
+        service = self._service[dev.get_dev_type()]
+        self.calendar.schedule(service(dev) if callable(service) else service, SERVICE_DONE, name)
+        self._busy.add(name)
+
+    ## Events
+
+    def _arrive(self, job, token):
+        """ Job becomes a new process, in the CPU or the job pool """
+        self.arrived += 1
+        try:
+            proc = self.system.new_process(job.size, 0, job.nice, job.deadline, job.period)
+        except ValueError:
+            self.rejected += 1
+        else:
+            self._jobs[proc.pid] = job
+            self._burst[proc.pid] = 0
+        self._next_arrival()
+
+    def _burst_done(self, i, elapsed):
+        """
+        Active process on core i has finished its burst, elapsed after the
+        last event. Out of date burst events are skipped by run.
+        """
+        self._running[i] = None
+        self._on_core(i)
+
+        pid = self._cores[i].active.pid
+        job = self._jobs[pid]
+        n = self._burst[pid]
+        if n < len(job.io):
+            self._burst[pid] = n + 1
+            try:
+                self.system.syscall(job.io[n][0], elapsed, *job.io[n][1:])
+                self._start(self.system.device(job.io[n][0]))
+                return
+            except (ValueError, KeyError, InvalidAddress):
+                # Process stays in CPU, but can't carry on with its job. Its
+                # params are checked before time is passed to the CPU
+                self.io_errors += 1
+
+        self.system.terminate(elapsed)
+        del self._jobs[pid]
+        del self._burst[pid]
+
+    def _preempt(self, i, token):
+        """
+        Active process on core i has used up its quantum or slice, or a
+        held process is released, which the CPU has already acted on as
+        time passed. Reschedule its events.
+        """
+        if self._current(i, token):
+            self._running[i] = None
+
+    def _service_done(self, name, token):
+        """ Device has completed the request at its head """
+        self._busy.discard(name)
+        self.system.interrupt(name, 0)
+        self._start(self.system.device(name))
+
+    ## Stats
+
+    def live(self):
+        """ Number of processes in the system """
+        return len(self._jobs)
+
+    def pending(self):
+        """ Number of events on the calendar, including out of date ones """
+        return len(self.calendar)
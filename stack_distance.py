@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             stack_distance.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Offline analysis of page reference strings using Mattson's
+#                   LRU stack distance algorithm. A single pass over a
+#                   reference string gives the number of LRU page faults for
+#                   every possible number of frames, so memory & page sizes
+#                   can be chosen without simulating each one.
+#
+#                   The stack distance of a reference is the number of
+#                   distinct pages referenced since the last reference to
+#                   the same page, plus one. With F frames, LRU faults on
+#                   exactly the references with distance > F (and on the
+#                   first reference to each page). Distances are counted with
+#                   a Fenwick tree over the time of each page's last
+#                   reference, so each reference is O(log n).
+
+from __future__ import division
+
+class FenwickTree:
+    """ Binary indexed tree of counts, supporting prefix sums & updates """
+
+    def __init__(self, size):
+        self._size = size
+        self._tree = [0] * (size + 1)
+
+    def add(self, i, n):
+        """ Adds n to count at position i (0 based) """
+        i += 1
+        while i <= self._size:
+            self._tree[i] += n
+            i += i & -i
+
+    def prefix_sum(self, i):
+        """ Returns total of counts at positions 0 to i-1 """
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+def stack_distances(refs):
+    """
+    Yields LRU stack distance of each reference in refs, or None for the
+    first reference to a page. refs may be any iterable (including a
+    generator) of pages, or of (pid, page) pairs to analyse several
+    processes sharing memory.
+    """
+    # Each page in the tree is marked at the position of its last reference.
+    # Tree operations are inlined as this loop runs once per reference.
+    last = {}
+    size = 1024
+    tree = [0] * (size + 1)
+    t = 0
+
+    for page in refs:
+        if t == size:
+            # Out of positions. Renumber pages in order of last reference
+            # and grow the tree
+            order = sorted(last, key=last.get)
+            size = max(size, 2 * len(order))
+            fenwick = FenwickTree(size)
+            for i, p in enumerate(order):
+                last[p] = i
+                fenwick.add(i, 1)
+            tree = fenwick._tree
+            t = len(order)
+
+        prev = last.get(page)
+        if prev is None:
+            yield None
+        else:
+            # Every marked position is before t, so the number of distinct
+            # pages referenced since prev is those marked after prev
+            i = prev + 1
+            before = 0
+            while i > 0:
+                before += tree[i]
+                i -= i & -i
+            yield len(last) - before + 1
+
+            i = prev + 1
+            while i <= size:
+                tree[i] -= 1
+                i += i & -i
+
+        i = t + 1
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+
+        last[page] = t
+        t += 1
+
+def fault_curve(refs, max_frames=None):
+    """
+    Returns list of number of LRU page faults for the given reference string
+    with 0, 1, 2 ... max_frames frames. If max_frames is not given, the
+    curve goes up to the largest stack distance seen, after which only the
+    first reference to each page faults.
+    """
+    hist = {}
+    total = 0
+    for d in stack_distances(refs):
+        total += 1
+        if d is not None:
+            hist[d] = hist.get(d, 0) + 1
+
+    if max_frames is None:
+        max_frames = max(hist) if hist else 0
+
+    # faults(F) = cold misses + references with distance > F
+    curve = [total]
+    faults = total
+    for f in xrange(1, max_frames + 1):
+        faults -= hist.get(f, 0)
+        curve.append(faults)
+    return curve
+
+def address_refs(refs, page_size):
+    """ Converts (pid, logical address) references to (pid, page) references """
+    for pid, addr in refs:
+        yield pid, addr // page_size
+
+def frames_needed(curve, max_fault_rate, num_refs=None):
+    """
+    Returns smallest number of frames whose fault rate is at most given rate,
+    or None if curve doesn't go far enough. Multiply by page size to get a
+    total memory size for sys gen.
+    """
+    num_refs = num_refs or curve[0]
+    for frames, faults in enumerate(curve):
+        if faults <= max_fault_rate * num_refs:
+            return frames
+    return None
@@ -9,7 +9,9 @@
 
 import sys
 import devices
-import io
+import msg
+from disk import disk_schedulers
+from workload import Workload, arrival_processes, burst_distributions, read_bursts
 
 valid_device_types = frozenset(["Disk Drive", "Printer", "CD/RW"])
 
@@ -20,7 +22,7 @@ def generate():
 
 	"""
 
-	print io.sys_mode("System Setup")
+	print msg.sys_mode("System Setup")
 
 	# Dictionary of type of devices and how many devices of each type
 	system_device_types = {}
@@ -30,14 +32,37 @@ def generate():
 	for d in valid_device_types: 	
 		# Add device type & how many of each type 
 		system_device_types[d] = None
-		system_device_types[d] = io.get_valid_int(d)
+		system_device_types[d] = msg.get_valid_int(d)
 
-	print io.sys_mode("Initialize Disk Drive",'-')
+	print msg.sys_mode("Initialize Disk Drive",'-')
 
-    # List of all individual devices in system
+	# One disk scheduling policy for all disk drives
+	policy = "flook"
+	merge = False
+	if system_device_types["Disk Drive"]:
+		policy = msg.get_valid_choice("Disk Scheduling Policy", sorted(disk_schedulers), "flook")
+		merge = msg.get_valid_choice("Merge Requests on Adjacent Cylinders", ["y", "n"], "n") == "y"
+
+	# Number of cylinders of each disk drive
+	cylinders = []
+	for i in range(system_device_types["Disk Drive"]):
+		cylinders.append(msg.get_valid_int("Num of cylinders for d" + str(i+1)))
+
+	return make_devices(system_device_types, cylinders, policy, merge)
+
+def make_devices(device_types, cylinders, policy="flook", merge=False):
+	"""
+	Creates devices, given how many devices there are of each type and the
+	number of cylinders of each disk drive. Disk drives use given disk
+	scheduling policy, merging requests if merge is set.
+	Returns list of all system devices.
+
+	"""
+
+	# List of all individual devices in system
 	system_devices = []
 
-	for dev_type, num_of_dev in system_device_types.iteritems(): 
+	for dev_type, num_of_dev in device_types.iteritems(): 
 		name_prefix = dev_type[0].lower()
 
 		# Create new device, add to list of system_devices
@@ -45,10 +70,55 @@ def generate():
 			name = name_prefix + str(i+1)
 
 			if (dev_type == "Disk Drive"):
-				cyl = io.get_valid_int("Num of cylinders for " + name)
-				system_devices.append(devices.DiskDrive(name,cyl))
+				system_devices.append(devices.DiskDrive(name, cylinders[i], policy, merge))
 			else:
 				system_devices.append(devices.Device(name, dev_type))
 
 	return system_devices
-	
\ No newline at end of file
+
+def workload(all_devices, max_proc_size):
+	"""
+	Generates a synthetic workload for given devices, based on user input.
+	Returns Workload, which yields its jobs as they are needed.
+
+	"""
+
+	print msg.sys_mode("Workload Setup")
+
+	seed = msg.get_int_in_range("Random Seed", 0, default=1)
+	jobs = msg.get_int_in_range("Number of Jobs (0 for no limit)", 0, default=0) or None
+
+	# How far apart jobs arrive
+	arrivals = msg.get_valid_choice("Arrival Process", sorted(arrival_processes), "poisson")
+	mean_gap = msg.get_float_in_range("Mean Time Between Arrivals", 0.001, default=40)
+	arrival_options = {}
+	if arrivals == "bursty":
+		arrival_options["burstiness"] = msg.get_float_in_range("Times Faster in Bursts", 1, default=10)
+		arrival_options["mean_run"] = msg.get_float_in_range("Mean Jobs per Burst", 1, default=20)
+
+	# How long CPU bursts are
+	bursts = msg.get_valid_choice("CPU Burst Distribution", sorted(burst_distributions), "exponential")
+	burst_options = {}
+	mean_burst = None
+	if bursts == "trace":
+		while "samples" not in burst_options:
+			try:
+				with open(raw_input("File of Burst Lengths >>> ").strip()) as f:
+					burst_options["samples"] = read_bursts(f)
+				burst_distributions[bursts](None, None, **burst_options)
+			except (IOError, ValueError) as e:
+				print msg.err(str(e))
+				burst_options.pop("samples", None)
+	else:
+		mean_burst = msg.get_float_in_range("Mean CPU Burst", 0.001, default=10)
+		if bursts == "hyperexponential":
+			burst_options["cv"] = msg.get_float_in_range("Coefficient of Variation", 1, default=2)
+
+	# Which devices processes make system calls to
+	mean_io = msg.get_float_in_range("Mean System Calls per Job", 0, default=2)
+	mix = {}
+	for dev_type in sorted(set(dev.get_dev_type() for dev in all_devices)):
+		mix[dev_type] = msg.get_float_in_range("Weight of each " + dev_type, 0, default=1)
+
+	return Workload(all_devices, max_proc_size, seed, jobs, arrivals, mean_gap, arrival_options,
+		bursts, mean_burst, burst_options, mean_io, mix)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             system.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      The simulated system: its devices, CPU, memory & job pool,
+#                   and the operations that change them. Operations take
+#                   everything they need as arguments (time since last
+#                   interrupt, system call params) rather than prompting, so
+#                   the system can be driven from code. SysCommand prompts
+#                   the user for these and calls the operations here.
+
+from __future__ import division
+from math import ceil
+from functools import partial
+
+import devices
+from pcb import PCB
+from memory import LongTermScheduler
+from registry import Registry
+
+class System:
+
+    def __init__(self, all_devices, alpha, tau, total_mem_size, page_size, max_proc_size,
+                 cores=1, cpu_policy="sjf", cpu_options=None, admission="largest", paging=None,
+                 tlb=None):
+        """
+        Sets up system with given devices, CPU scheduling history parameter
+        alpha & initial burst estimate tau, and memory, page & maximum process
+        sizes. The CPU has the given number of cores, each scheduled by
+        cpu_policy (one of devices.cpu_policies), made with cpu_options as
+        keyword arguments. Admission is the job pool admission policy, paging
+        the page replacement policy (None to load whole processes), and tlb
+        the TLB in front of memory, if any.
+        """
+        self.all_devices = all_devices
+        self._devices = dict((dev.get_dev_name(), dev) for dev in all_devices)
+
+        self.alpha = alpha
+        self.tau = tau
+        self.total_mem_size = total_mem_size
+        self.page_size = page_size
+        self.max_proc_size = max_proc_size
+
+        # Set up long term scheduler. This will also set up RAM & job pool
+        self.lts = LongTermScheduler(total_mem_size, page_size, policy=admission, paging=paging)
+        if tlb:
+            self.lts.ram.tlb = tlb
+
+        # Set up CPU & PID
+        self.cores = cores
+        self.cpu_policy = cpu_policy
+        new_core = partial(devices.cpu_policies[cpu_policy], **(cpu_options or {}))
+        if cores == 1:
+            self.cpu = new_core(tlb)
+        else:
+            self.cpu = devices.MultiCoreCPU(cores, tlb, new_core)
+        self.pid_count = 0
+
+        # Registry of where every live process is, kept up to date by every
+        # queue & device in the system
+        self.registry = Registry()
+        for container in self.all_devices + [self.cpu, self.lts.job_pool]:
+            container.set_registry(self.registry)
+
+        # Set up system stats
+        self.completed = 0
+        self.total_cpu_time = 0
+        self.avg_cpu_time = 0
+
+    def device(self, name):
+        """ Returns device with given name, or None """
+        return self._devices.get(name)
+
+    ## Operations. elapsed is the time since the last interrupt, which the
+    ## active process(es) in the CPU have run for
+
+    def check_process_size(self, size):
+        """ Raises ValueError if a process of given size can't be created """
+        if size <= 0:
+            raise ValueError("Process size must be a positive integer")
+        if size > self.total_mem_size:
+            raise ValueError("Proccess cannot be larger than total memory")
+        if size > self.max_proc_size:
+            raise ValueError("Proccess cannot be larger than maximum process size of " + str(self.max_proc_size))
+
+    def new_process(self, size, elapsed=0, nice=None, deadline=None, period=None):
+        """
+        Creates a new process of given size, with a nice value (for CFS) or
+        a relative deadline & period (for EDF) if given. If enough memory,
+        it goes to the CPU, else to the job pool. elapsed only counts if it
+        goes to the CPU, as the CPU isn't interrupted by a process going
+        to the job pool. Returns new process.
+        Raises ValueError if process can't be created.
+        """
+        self.check_process_size(size)
+        if nice is not None and not -20 <= nice <= 19:
+            raise ValueError("Nice value must be from -20 to 19")
+
+        self.pid_count += 1
+        pages = int(ceil(size / self.page_size))
+        proc = PCB(self.pid_count, size, pages, self.page_size, self.alpha, self.tau)
+        if nice is not None:
+            proc.set_nice(nice)
+        if deadline:
+            proc.rel_deadline = deadline
+            proc.period = period or None
+
+        # If enough memory, new process can run, else goes to job pool
+        if self.lts.schedule(proc):
+            self.cpu.enqueue(proc, elapsed)
+        return proc
+
+    def terminate(self, elapsed=0):
+        """
+        Terminates active process in CPU (on the current core), replacing it
+        with the head of the ready queue. Its memory is given to processes
+        in the job pool. Returns terminated process.
+        Raises IndexError if CPU is idle.
+        """
+        proc = self.cpu.get_active_process()
+
+        # Deallocate memory with long term scheduler
+        # This will also allocate any freed memory to anything in job pool
+        # and return a list of processes that it has allocated memory too
+        new_procs = self.lts.terminate(proc.pid)
+        self.cpu.terminate(elapsed=elapsed)
+        self._admitted(new_procs)
+
+        # Update system stats with total CPU time for terminated process
+        self.total_cpu_time += proc.tot_burst_time()
+        self.completed += 1
+        self.avg_cpu_time = self.total_cpu_time / self.completed
+        return proc
+
+    def kill(self, pid, elapsed=0):
+        """
+        Terminates process with given pid, wherever it is. Its memory is
+        given to processes in the job pool.
+        Raises InvalidProcess if there is no such process.
+        """
+        # Look up which device process is in and terminate it there.
+        # Processes in the job pool are terminated by the long term
+        # scheduler
+        dev = self.registry.get_device(pid)
+        if dev is self.cpu:
+            self.cpu.terminate(pid, elapsed)
+        else:
+            if dev is not None and dev is not self.lts.job_pool:
+                dev.terminate(pid)
+            if elapsed:
+                self.cpu.elapse(elapsed)
+
+        self._admitted(self.lts.terminate(pid))
+
+    def syscall(self, dev_name, elapsed=0, file_name="", address=0, rw=None, length=None, cyl=None):
+        """
+        Active process in CPU (on the current core) requests device with
+        given name, with given system call params, and goes to the back of
+        the device's queue. Returns process.
+        Raises KeyError if there is no such device, IndexError if CPU is
+        idle, and InvalidAddress or ValueError if params are invalid, in
+        which case process stays in CPU.
+        """
+        dev = self._devices[dev_name]
+        proc = self.cpu.get_active_process()
+
+        try:
+            proc.set_syst_call_params(file_name, address, self.cpu.tlb)
+            proc.set_read_write_params(dev.get_dev_type(), rw, length)
+            if dev.get_dev_type().lower() == "disk drive":
+                proc.set_cylinder_params(cyl, dev.get_num_cylinders())
+        except:
+            proc.clear_params()
+            raise
+
+        # Replace with head of ready queue, and add to back of device queue
+        self.cpu.dequeue(elapsed)
+        dev.enqueue(proc)
+        return proc
+
+    def interrupt(self, dev_name, elapsed=0):
+        """
+        Device with given name has completed the request at the head of its
+        queue (disk drives may complete several merged requests at once).
+        Completed processes go back to the CPU. Returns list of them.
+        Raises KeyError if there is no such device, and IndexError if its
+        queue is empty.
+        """
+        dev = self._devices[dev_name]
+        procs = dev.dequeue_all()
+        for i, proc in enumerate(procs):
+            print "%s completed %s" %(dev, proc)
+            self.cpu.enqueue(proc, elapsed if i == 0 else 0)
+        return procs
+
+    def _admitted(self, procs):
+        """ Processes from the job pool now in memory go to the CPU """
+        if procs:
+            for p in procs:
+                self.cpu.enqueue(p)
+
+    ## Stats
+
+    def print_stats(self):
+        print "\n" + "{:-^78}".format(" Completed Processes Report ")
+        print "Total Completed: {:<5} Avg Total CPU Time: {:<5}".format(self.completed, self.avg_cpu_time).center(78, ' ')
+        print "Mean Response Time: {:<8.2f} Mean Turnaround Time: {:<8.2f}".format(self.cpu.mean_response_time(), self.cpu.mean_turnaround_time()).center(78, ' ')
+        if self.cores > 1:
+            self.cpu.stats()
+        if self.cpu_policy == "edf":
+            devices.deadline_report(self.cpu.cores if self.cores > 1 else [self.cpu])
+        if self.cpu.tlb:
+            self.cpu.tlb.snapshot()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_batch.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of batch mode: parsing trace lines, and replaying
+#                   a trace on a system, skipping invalid commands.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import os
+import sys
+import unittest
+from StringIO import StringIO
+
+import batch
+from devices import Device, DiskDrive
+from system import System
+
+trace = """
+# Two processes, one of them prints
+a size=32
+a size=32 t=1
+p1 t=3 file=f1 addr=10 rw=w len=8
+a size=300
+x1 t=1
+P1 t=2
+k9
+t t=4
+
+q
+a size=16
+"""
+
+class ParseTest(unittest.TestCase):
+
+    def test_parse(self):
+        self.assertEqual(batch.parse("d1 t=4 file=f1 Addr=1a"), ("d1", {"t": "4", "file": "f1", "addr": "1a"}))
+        self.assertEqual(batch.parse("t"), ("t", {}))
+        self.assertIs(batch.parse("  # comment"), None)
+        self.assertIs(batch.parse(""), None)
+        self.assertRaises(ValueError, batch.parse, "a size 12")
+
+class ReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        # Hide console output of the system
+        self._stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+        all_devices = [Device("p1", "Printer"), DiskDrive("d1", 100)]
+        self.system = System(all_devices, 0.5, 5, 64, 16, 64)
+
+    def tearDown(self):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+    def test_replay(self):
+        """ Trace runs up to q, reporting invalid lines & carrying on """
+        system = self.system
+        errors = StringIO()
+        ops, bad = batch.replay(system, StringIO(trace), errors)
+        self.assertEqual((ops, bad), (8, 3))
+
+        # Process too large, no device x1, no process 9
+        lines = [line.split(":")[0] for line in errors.getvalue().splitlines()]
+        self.assertEqual(lines, ["Line 6", "Line 7", "Line 9"])
+
+        # Process 1 printed & came back, then process 2 terminated
+        self.assertEqual(system.completed, 1)
+        self.assertEqual(system.total_cpu_time, 6)
+        self.assertEqual(system.cpu.get_active_process().pid, 1)
+        self.assertEqual(len(system.registry), 1)
+        self.assertEqual(system.device("p1").length(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_config.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of config files: JSON & INI files with the same
+#                   settings build the same system, and invalid settings are
+#                   reported by name.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import config
+from devices import MultiCoreCPU, MLFQ
+
+ini = """
+[devices]
+printers = 1
+disk_drives = 2
+cd_drives = 1
+cylinders = 100, 200
+disk_policy = clook
+merge = yes
+
+[cpu]
+alpha = 0.5
+tau = 5
+cores = 2
+policy = mlfq
+quanta = 2, 4
+boost = 50
+
+[memory]
+size = 1024
+page_size = 16
+max_proc_size = 512
+paging = lru
+
+[tlb]
+entries = 8
+ways = 2
+
+[workload]
+seed = 3
+jobs = 20
+arrivals = bursty
+bursts = trace
+burst_file = bursts.txt
+"""
+
+settings = {
+    "devices": {"printers": 1, "disk_drives": 2, "cd_drives": 1, "cylinders": [100, 200],
+                "disk_policy": "clook", "merge": True},
+    "cpu": {"alpha": 0.5, "tau": 5, "cores": 2, "policy": "mlfq", "quanta": [2, 4], "boost": 50},
+    "memory": {"size": 1024, "page_size": 16, "max_proc_size": 512, "paging": "lru"},
+    "tlb": {"entries": 8, "ways": 2},
+    "workload": {"seed": 3, "jobs": 20, "arrivals": "bursty", "bursts": "trace",
+                 "burst_file": "bursts.txt"},
+}
+
+class ConfigTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.write("bursts.txt", "3 5 8\n4 6\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, name, text):
+        path = os.path.join(self.dir, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def build(self, changes):
+        """ Builds system from settings with changes, given as (section, key, value) """
+        s = json.loads(json.dumps(settings))
+        for section, key, value in changes:
+            if value is None:
+                del s[section][key]
+            else:
+                s[section][key] = value
+        return config.build(s)
+
+    def assertInvalid(self, message, *changes):
+        with self.assertRaises(ValueError) as e:
+            self.build(changes)
+        self.assertEqual(str(e.exception), message)
+
+    def test_json_and_ini(self):
+        """ JSON & INI files with the same settings build the same system """
+        systems = []
+        workloads = []
+        for path in (self.write("sys.json", json.dumps(settings)), self.write("sys.ini", ini)):
+            s = config.read(path)
+            system = config.build(s)
+            systems.append(system)
+            workloads.append(list(config.workload(s, system)))
+
+            self.assertEqual([d.get_dev_name() for d in system.all_devices], ["p1", "c1", "d1", "d2"])
+            self.assertEqual([system.device(d).get_num_cylinders() for d in ("d1", "d2")], [100, 200])
+            self.assertEqual(system.device("d2")._policy, "clook")
+            self.assertTrue(system.device("d2")._merge)
+            self.assertIsInstance(system.cpu, MultiCoreCPU)
+            self.assertIsInstance(system.cpu.cores[1], MLFQ)
+            self.assertEqual(system.cpu.cores[0]._quanta, [2, 4])
+            self.assertEqual((system.alpha, system.tau, system.total_mem_size, system.page_size),
+                             (0.5, 5, 1024, 16))
+            self.assertIs(system.lts.ram.tlb, system.cpu.tlb)
+
+        self.assertEqual(len(workloads[0]), 20)
+        self.assertEqual(workloads[0], workloads[1])
+
+    def test_defaults(self):
+        """ Settings with sys gen defaults can be left out, others can't """
+        system = self.build([("devices", "disk_policy", None), ("devices", "merge", None),
+                             ("cpu", "policy", None)])
+        self.assertEqual(system.cpu_policy, "sjf")
+        self.assertEqual(system.device("d1")._policy, "flook")
+        self.assertFalse(system.device("d1")._merge)
+        self.assertInvalid("[cpu] tau: missing", ("cpu", "tau", None))
+
+    def test_invalid(self):
+        """ Invalid settings raise ValueError naming the setting """
+        self.assertInvalid("[cpu] alpha: must be from 0 to 1", ("cpu", "alpha", 2))
+        self.assertInvalid("[cpu] cores: must be a whole number", ("cpu", "cores", 1.5))
+        self.assertInvalid("[cpu.quanta] 1: must be 1 or more", ("cpu", "quanta", [2, 0]))
+        self.assertInvalid("[memory] page_size: must be a power of two", ("memory", "page_size", 24))
+        self.assertInvalid("[memory] max_proc_size: cannot be larger than total memory",
+                           ("memory", "max_proc_size", 2048))
+        self.assertInvalid("[devices] merge: must be yes or no", ("devices", "merge", "maybe"))
+        self.assertInvalid("[tlb] entries: must be a multiple of associativity", ("tlb", "ways", 3))
+        self.assertInvalid("[devices] cylinders: must be one number, or one for each of 2 disk drives",
+                           ("devices", "cylinders", [1, 2, 3]))
+
+    def test_unknown(self):
+        self.write("unknown.ini", "[cpu]\nalpha = 0.5\ncolour = red\n")
+        self.assertRaises(ValueError, config.read, os.path.join(self.dir, "unknown.ini"))
+        self.write("unknown.json", json.dumps({"gpu": {}}))
+        self.assertRaises(ValueError, config.read, os.path.join(self.dir, "unknown.json"))
+        self.write("bad.ini", "alpha = 0.5\n")
+        self.assertRaises(ValueError, config.read, os.path.join(self.dir, "bad.ini"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_cpu.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of the CPU scheduling policies: placing processes
+#                   on cores & work stealing, MLFQ demotion & boosts, CFS
+#                   shares by weight, and EDF deadlines & periodic releases.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import os
+import sys
+import unittest
+
+from devices import MultiCoreCPU, MLFQ, CFS, EDF
+from registry import Registry
+from pcb import PCB
+
+def process(pid, est_burst=5):
+    return PCB(pid, 16, 1, 16, 0.5, est_burst)
+
+class CPUTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # Hide console output of the CPU
+        self._stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+    def tearDown(self):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+class MultiCoreTest(CPUTestCase):
+
+    def test_least_loaded_core(self):
+        """ Each new process goes to the core with fewest processes """
+        cpu = MultiCoreCPU(3)
+        for pid in xrange(1, 7):
+            cpu.enqueue(process(pid))
+        self.assertEqual([core.active.pid for core in cpu.cores], [1, 2, 3])
+        self.assertEqual([core.length() for core in cpu.cores], [1, 1, 1])
+
+    def test_work_stealing(self):
+        """ A core with nothing ready takes the head of the busiest ready queue """
+        cpu = MultiCoreCPU(2)
+        registry = Registry()
+        cpu.set_registry(registry)
+        for pid in xrange(1, 6):
+            cpu.enqueue(process(pid))
+
+        # Core 1 runs 2 then 4, then steals from core 0
+        cpu.current = 1
+        self.assertEqual(cpu.dequeue(3).pid, 2)
+        cpu.current = 1
+        self.assertEqual(cpu.dequeue(3).pid, 4)
+        self.assertEqual((cpu.steals, cpu.migrations), (1, 1))
+        self.assertEqual(cpu.cores[1].active.pid, 3)
+        self.assertEqual(cpu.cores[0].length(), 1)
+
+        # Stolen process runs on its new core
+        self.assertIs(registry.get_device(3), cpu)
+        self.assertEqual(cpu.busy_time, [6, 6])
+
+    def test_terminate_on_any_core(self):
+        cpu = MultiCoreCPU(2)
+        for pid in xrange(1, 5):
+            cpu.enqueue(process(pid))
+        cpu.terminate(4, 1)
+        cpu.terminate(1, 1)
+        self.assertFalse(cpu.contains(4) or cpu.contains(1))
+        self.assertEqual(cpu.cores[0].active.pid, 3)
+
+class MLFQTest(CPUTestCase):
+
+    def test_demotion(self):
+        """ A process that uses up its quantum moves down a level """
+        cpu = MLFQ(quanta=(2, 4), boost=100)
+        cpu.enqueue(process(1))
+        cpu.enqueue(process(2))
+
+        cpu.elapse(2)
+        self.assertEqual(cpu.active.pid, 2)
+        self.assertEqual(cpu.demotions, 1)
+
+        # Both demoted, so a new process at the top level preempts
+        cpu.elapse(2)
+        self.assertEqual((cpu.active.pid, cpu.active.level), (1, 1))
+        cpu.enqueue(process(3))
+        self.assertEqual(cpu.active.pid, 3)
+        cpu.dequeue(1)
+        self.assertEqual(cpu.active.pid, 2)
+        self.assertEqual(cpu.demotions, 2)
+
+    def test_boost(self):
+        """ Every boost period, all processes go back to the top level """
+        cpu = MLFQ(quanta=(2, 4), boost=10)
+        procs = [process(1), process(2)]
+        for p in procs:
+            cpu.enqueue(p)
+        cpu.elapse(9)
+        self.assertEqual((cpu.active.pid, procs[0].level), (2, 1))
+        cpu.elapse(1)
+        self.assertEqual(cpu.boosts, 1)
+        self.assertEqual(cpu._levels[0].length(), 1)
+        self.assertEqual([p.level for p in procs], [0, 0])
+
+class CFSTest(CPUTestCase):
+
+    def test_share_by_weight(self):
+        """ CPU time is shared in proportion to weight """
+        cpu = CFS(latency=20, min_granularity=1)
+        procs = [process(1), process(2)]
+        procs[1].set_nice(5)
+        for p in procs:
+            cpu.enqueue(p)
+
+        run = {1: 0, 2: 0}
+        for t in xrange(2000):
+            run[cpu.active.pid] += 1
+            cpu.elapse(1)
+        self.assertAlmostEqual(run[1] / run[2], 1024 / 335, delta=0.1)
+        self.assertLess(abs(procs[0].vruntime - procs[1].vruntime), 20)
+
+    def test_new_process_starts_at_min_vruntime(self):
+        """ A new process can't run ahead on time it never waited for """
+        cpu = CFS(latency=20, min_granularity=1)
+        cpu.enqueue(process(1))
+        cpu.elapse(50)
+        late = process(2)
+        cpu.enqueue(late)
+        self.assertEqual(late.vruntime, 50)
+
+class EDFTest(CPUTestCase):
+
+    def deadline(self, pid, rel_deadline, period=None):
+        proc = process(pid)
+        proc.rel_deadline = rel_deadline
+        proc.period = period
+        return proc
+
+    def test_earliest_deadline_first(self):
+        """ Earlier deadlines preempt, and processes without one run last """
+        cpu = EDF()
+        for proc in (process(1), self.deadline(2, 30), self.deadline(3, 10)):
+            cpu.enqueue(proc)
+        self.assertEqual(cpu.active.pid, 3)
+
+        # Process 3 finishes late, 2 on time
+        cpu.terminate(3, 12)
+        cpu.terminate(2, 5)
+        self.assertEqual(cpu.active.pid, 1)
+        self.assertEqual((cpu.jobs, cpu.misses, cpu.max_lateness), (2, 1, 2))
+        self.assertRaises(IndexError, cpu.terminate, 9)
+
+    def test_periodic_release(self):
+        """ A periodic process back before its next period is held until its release """
+        cpu = EDF()
+        cpu.enqueue(self.deadline(1, 10, 100))
+        proc = cpu.dequeue(1)
+        cpu.enqueue(proc, 20)
+        self.assertEqual((cpu.held(), cpu.busy()), (1, False))
+        self.assertTrue(cpu.contains(1))
+
+        cpu.elapse(78)
+        self.assertEqual(cpu.held(), 1)
+        cpu.elapse(1)
+        self.assertEqual((cpu.held(), cpu.active.pid, cpu.active.deadline), (0, 1, 110))
+
+    def test_release_as_burst_ends(self):
+        """ A process released just as the active process leaves still gets the CPU """
+        for leave in ("dequeue", "terminate"):
+            cpu = EDF()
+            registry = Registry()
+            cpu.set_registry(registry)
+            cpu.enqueue(self.deadline(1, 10, 100))
+            cpu.enqueue(process(2))
+            proc = cpu.dequeue(1)
+            cpu.enqueue(proc, 20)
+
+            getattr(cpu, leave)(elapsed=79)
+            self.assertEqual(cpu.active.pid, 1, leave)
+            self.assertEqual(cpu.active.deadline, 110, leave)
+            self.assertIs(registry.get_device(1), cpu)
+
+    def test_release_on_multicore(self):
+        cpu = MultiCoreCPU(2, new_core=EDF)
+        cpu.enqueue(self.deadline(1, 10, 100))
+        cpu.enqueue(process(2))
+        cpu.enqueue(process(3))
+        cpu.current = 0
+        proc = cpu.dequeue(1)
+        cpu.enqueue(proc, 20)
+        self.assertEqual(cpu.held(), 1)
+
+        # Process 3 leaves core 0 just as process 1 is released there
+        cpu.current = 0
+        cpu.dequeue(79)
+        self.assertEqual(cpu.cores[0].active.pid, 1)
+        self.assertEqual(cpu.held(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_disk.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of the disk scheduling policies on the textbook
+#                   request queue (98, 183, 37, 122, 14, 124, 65, 67, head at
+#                   53 moving up), and of merging requests in disk drives.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import unittest
+
+from devices import DiskDrive
+from disk import disk_schedulers
+from pcb import PCB
+
+queue = [98, 183, 37, 122, 14, 124, 65, 67]
+
+# Order requests are serviced in & total seek distance, on cylinders 0-199
+expected = {
+    "fcfs": ([98, 183, 37, 122, 14, 124, 65, 67], 640),
+    "sstf": ([65, 67, 37, 14, 98, 122, 124, 183], 236),
+    "scan": ([65, 67, 98, 122, 124, 183, 37, 14], 331),
+    "cscan": ([65, 67, 98, 122, 124, 183, 14, 37], 382),
+    "look": ([65, 67, 98, 122, 124, 183, 37, 14], 299),
+    "clook": ([65, 67, 98, 122, 124, 183, 14, 37], 322),
+    # The first request is frozen on its own, the rest wait for the next sweep
+    "flook": ([98, 122, 124, 183, 67, 65, 37, 14], 299),
+}
+
+def request(pid, cyl, rw="w", file_name=None):
+    proc = PCB(pid, 16, 1, 16, 0.5, 5)
+    proc.params["cyl"] = cyl
+    proc.params["rw"] = rw
+    proc.params["file"] = file_name or "f" + str(pid)
+    return proc
+
+class DiskSchedulerTest(unittest.TestCase):
+
+    def drive(self, policy, cyls):
+        drive = DiskDrive("d1", 199, policy)
+        drive.head = 53
+        for pid, cyl in enumerate(cyls, 1):
+            drive.enqueue(request(pid, cyl))
+        return drive
+
+    def test_textbook_queue(self):
+        """ Each policy services requests in order, seeking the expected distance """
+        self.assertEqual(sorted(expected), sorted(disk_schedulers))
+        for policy, (order, seek) in expected.iteritems():
+            drive = self.drive(policy, queue)
+            pids = [p.pid for p in drive._q.order(drive.head, drive.direction)]
+
+            cyls = [queue[drive.dequeue().pid - 1] for c in queue]
+            self.assertEqual(cyls, order, policy)
+            self.assertEqual(drive.total_seek, seek, policy)
+            self.assertEqual(drive.requests_serviced(), len(queue), policy)
+            if policy != "sstf":
+                # Only the first request is exact for SSTF, as the head moves
+                self.assertEqual([queue[pid - 1] for pid in pids], order, policy)
+            self.assertRaises(IndexError, drive.dequeue)
+
+    def test_flook_new_requests_wait(self):
+        """ Requests made during a sweep wait for the next one """
+        drive = self.drive("flook", [60, 90])
+        drive.dequeue()
+        drive.enqueue(request(3, 70))
+        drive.enqueue(request(4, 65))
+        self.assertEqual([drive.dequeue().pid for i in xrange(3)], [2, 3, 4])
+
+    def test_pop(self):
+        """ A request can be taken out of any policy's queue by pid """
+        for policy in disk_schedulers:
+            drive = self.drive(policy, queue)
+            self.assertEqual(drive.pop(5).pid, 5, policy)
+            self.assertFalse(drive.contains(5), policy)
+            self.assertEqual(len([drive.dequeue() for c in queue[1:]]), len(queue) - 1, policy)
+
+class MergeTest(unittest.TestCase):
+
+    def test_merged_counts(self):
+        """ Merged requests count towards queue length, and each saves a seek """
+        drive = DiskDrive("d1", 199, "fcfs", True)
+        drive.enqueue(request(1, 50))
+        drive.enqueue(request(2, 51))
+        drive.enqueue(request(3, 80))
+        drive.enqueue(request(4, 10, "r", "f9"))
+        drive.enqueue(request(5, 150, "r", "f9"))
+        self.assertEqual(drive.length(), 5)
+
+        self.assertEqual([p.pid for p in drive.dequeue_all()], [1, 2])
+        self.assertEqual((drive.merged, drive.seeks_saved, drive.length()), (1, 1, 3))
+
+        self.assertEqual(drive.pop(5).pid, 5)
+        self.assertEqual(drive.length(), 2)
+        self.assertEqual([p.pid for p in drive.dequeue_all()], [3])
+        self.assertEqual([p.pid for p in drive.dequeue_all()], [4])
+        self.assertEqual((drive.merged, drive.seeks_saved, drive.length()), (1, 1, 0))
+        self.assertEqual(drive.requests_serviced(), 3)
+
+    def test_dequeue_one(self):
+        """ Taking only the lead leaves the rest of its group pending """
+        drive = DiskDrive("d1", 199, "look", True)
+        for pid, cyl in ((1, 20), (2, 21), (3, 19)):
+            drive.enqueue(request(pid, cyl))
+        self.assertEqual(drive.length(), 3)
+        self.assertEqual(drive.dequeue().pid, 1)
+        self.assertEqual(drive.length(), 2)
+        self.assertEqual([p.pid for p in drive.dequeue_all()], [2, 3])
+        self.assertEqual((drive.merged, drive.seeks_saved), (1, 1))
+
+if __name__ == '__main__':
+    unittest.main()
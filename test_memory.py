@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_memory.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of memory & the long term scheduler: frames held
+#                   by each process, the compact frame table, the job pool's
+#                   size index and the admission policies.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import os
+import sys
+import random
+import unittest
+from itertools import combinations
+
+from memory import Memory, CompactMemory, JobPool, InvalidProcess, pages_needed, admission_policies
+from pcb import PCB
+
+def process(pid, size, pg_size=16):
+    return PCB(pid, size, pages_needed(size, pg_size), pg_size, 0.5, 5)
+
+class MemoryTest(unittest.TestCase):
+
+    def test_frames_of_process(self):
+        """ Deallocating frees exactly the frames the process holds """
+        mem = Memory(128, 16)
+        p1, p2 = process(1, 40), process(2, 20)
+        mem.allocate(p1)
+        mem.allocate(p2)
+        self.assertEqual([p1.page_table[p] for p in xrange(3)], [0, 1, 2])
+        self.assertEqual([p2.page_table[p] for p in xrange(2)], [3, 4])
+        self.assertTrue(mem.is_in_mem(1))
+
+        mem.deallocate(1)
+        self.assertFalse(mem.is_in_mem(1))
+        self.assertEqual(mem.free_mem(), 96)
+        self.assertEqual(list(mem.free_frames()), [5, 6, 7, 0, 1, 2])
+        self.assertEqual([f for f, owner in mem.frames() if owner], [3, 4])
+        self.assertRaises(InvalidProcess, mem.deallocate, 1)
+
+class CompactMemoryTest(unittest.TestCase):
+
+    def test_same_frames_as_memory(self):
+        """ Freed frames are reused in the same (FIFO) order by both layouts """
+        rand = random.Random(1)
+        mems = [Memory(2**12, 16), CompactMemory(2**12, 16)]
+        live = []
+        for pid in xrange(1, 2000):
+            if live and (rand.random() < 0.5 or mems[0].free_mem() < 512):
+                done = live.pop(rand.randrange(len(live)))
+                for mem in mems:
+                    mem.deallocate(done)
+            else:
+                size = rand.randint(1, 512)
+                procs = [process(pid, size) for mem in mems]
+                for mem, proc in zip(mems, procs):
+                    mem.allocate(proc)
+                self.assertEqual(procs[0].page_table, procs[1].page_table)
+                live.append(pid)
+
+            self.assertEqual(list(mems[0].free_frames()), list(mems[1].free_frames()))
+            self.assertEqual(sorted(mems[0].frames()), list(mems[1].frames()))
+
+class JobPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        # Hide console output of the job pool
+        self._stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+    def tearDown(self):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+    def test_matches_list(self):
+        """ Largest job that fits, oldest first among equal sizes, as found by a scan """
+        rand = random.Random(2)
+        pool = JobPool()
+        waiting = []
+        for pid in xrange(1, 3000):
+            r = rand.random()
+            if r < 0.5 or not waiting:
+                proc = process(pid, rand.randint(1, 40))
+                pool.enqueue(proc)
+                waiting.append(proc)
+            elif r < 0.8:
+                free = rand.randint(1, 40)
+                fits = [p for p in waiting if p.proc_size <= free]
+                if not fits:
+                    self.assertRaises(InvalidProcess, pool.dequeue_largest, free)
+                    continue
+                largest = max(p.proc_size for p in fits)
+                expected = next(p for p in fits if p.proc_size == largest)
+                self.assertIs(pool.dequeue_largest(free), expected)
+                waiting = [p for p in waiting if p is not expected]
+            else:
+                proc = rand.choice(waiting)
+                self.assertIs(pool.dequeue(proc.pid), proc)
+                waiting = [p for p in waiting if p is not proc]
+
+            self.assertEqual(pool.length(), len(waiting))
+            self.assertEqual(sorted(p.pid for p in pool), sorted(p.pid for p in waiting))
+
+        for proc in list(waiting):
+            pool.dequeue(proc.pid)
+        self.assertTrue(pool.empty())
+        self.assertRaises(IndexError, pool.dequeue_largest, 40)
+
+class AdmissionTest(unittest.TestCase):
+
+    def setUp(self):
+        self._stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+    def tearDown(self):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+    def pool(self, sizes):
+        pool = JobPool()
+        for pid, size in enumerate(sizes, 1):
+            pool.enqueue(process(pid, size))
+        return pool
+
+    def test_admitted_jobs_fit(self):
+        """ Every policy admits jobs that fit in free memory together """
+        rand = random.Random(3)
+        for name, admit in admission_policies.iteritems():
+            for i in xrange(50):
+                sizes = [rand.randint(1, 100) for j in xrange(rand.randint(0, 12))]
+                pool = self.pool(sizes)
+                free = rand.randint(0, 20) * 16
+                procs = admit(pool, free, 16)
+                self.assertLessEqual(sum(pages_needed(p.proc_size, 16) for p in procs) * 16, free, name)
+                self.assertEqual(pool.length() + len(procs), len(sizes), name)
+
+    def test_knapsack_fills_most_frames(self):
+        """ Knapsack admits as many frames as the best subset of jobs """
+        rand = random.Random(4)
+        for i in xrange(100):
+            sizes = [rand.randint(1, 100) for j in xrange(rand.randint(1, 9))]
+            free = rand.randint(1, 20) * 16
+            frames = [pages_needed(s, 16) for s in sizes]
+            best = max(sum(c) for n in xrange(len(frames) + 1)
+                       for c in combinations(frames, n) if sum(c) <= free // 16)
+
+            procs = admission_policies["knapsack"](self.pool(sizes), free, 16)
+            self.assertEqual(sum(pages_needed(p.proc_size, 16) for p in procs), best, (sizes, free))
+
+    def test_largest_first(self):
+        """ Largest first admits the largest job that fits, then the next that still fits """
+        procs = admission_policies["largest"](self.pool([10, 50, 30, 40]), 80, 1)
+        self.assertEqual([p.proc_size for p in procs], [50, 30])
+
+if __name__ == '__main__':
+    unittest.main()
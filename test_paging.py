@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_paging.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of the page replacement policies against plain
+#                   list versions of the same algorithms, and of demand
+#                   paged memory.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import random
+import unittest
+
+from paging import replacement_policies
+from memory import DemandPagedMemory, pages_needed
+from pcb import PCB, no_frame
+
+class ListPolicy:
+    """ Frames in a list, searched & reordered in O(n) per reference """
+
+    def __init__(self, name, num_frames):
+        self.name = name
+        self.frames = []
+        self.ref = {}
+        self.clock = [None] * num_frames
+        self.hand = 0
+
+    def insert(self, f):
+        self.frames.append(f)
+        self.ref[f] = self.name == "clock"
+        self.clock[f] = True
+
+    def touch(self, f):
+        if self.name == "lru":
+            self.frames.remove(f)
+            self.frames.append(f)
+        self.ref[f] = True
+
+    def remove(self, f):
+        self.frames.remove(f)
+        self.clock[f] = None
+
+    def victim(self):
+        if self.name == "clock":
+            while True:
+                f = self.hand
+                self.hand = (f + 1) % len(self.clock)
+                if self.clock[f] is not None:
+                    if self.ref[f]:
+                        self.ref[f] = False
+                    else:
+                        self.remove(f)
+                        return f
+        if self.name == "second":
+            while self.ref[self.frames[0]]:
+                f = self.frames.pop(0)
+                self.ref[f] = False
+                self.frames.append(f)
+        f = self.frames[0]
+        self.remove(f)
+        return f
+
+class ReplacementPolicyTest(unittest.TestCase):
+
+    def test_matches_list(self):
+        """ Each policy picks the same victims as its list version """
+        for name in ("fifo", "lru", "clock", "second"):
+            rand = random.Random(5)
+            policy = replacement_policies[name](16)
+            model = ListPolicy(name, 16)
+            resident = {}
+            free = range(16)
+
+            for i in xrange(5000):
+                page = int(rand.paretovariate(1)) % 40
+                if page in resident:
+                    policy.touch(resident[page])
+                    model.touch(resident[page])
+                elif rand.random() < 0.05 and resident:
+                    # Page's process has terminated
+                    f = resident.pop(rand.choice(resident.keys()))
+                    policy.remove(f)
+                    model.remove(f)
+                    free.append(f)
+                else:
+                    if free:
+                        f = free.pop()
+                    else:
+                        f = policy.victim()
+                        self.assertEqual(f, model.victim(), name)
+                        del resident[next(p for p, g in resident.iteritems() if g == f)]
+                    resident[page] = f
+                    policy.insert(f)
+                    model.insert(f)
+
+class DemandPagedMemoryTest(unittest.TestCase):
+
+    def process(self, pid, size):
+        return PCB(pid, size, pages_needed(size, 16), 16, 0.5, 5)
+
+    def test_pages_loaded_on_reference(self):
+        """ Pages are loaded when first referenced, evicting when memory is full """
+        mem = DemandPagedMemory(64, 16, "fifo")
+        proc = self.process(1, 96)
+        mem.allocate(proc)
+        self.assertEqual(mem.free_mem(), 64)
+
+        for page in (0, 1, 2, 3, 0, 4):
+            proc.translate(page * 16)
+        self.assertEqual(proc.page_faults, 5)
+        self.assertEqual(proc.evictions, 1)
+        self.assertEqual(proc.page_table[0], no_frame)
+        self.assertEqual(proc.translate(4 * 16 + 3), 16 * 0 + 3)
+
+        mem.deallocate(1)
+        self.assertEqual(mem.free_mem(), 64)
+        self.assertIs(proc.pager, None)
+
+    def test_working_set_window(self):
+        """ Pages not referenced in the last window references are released """
+        mem = DemandPagedMemory(160, 16, "ws")
+        mem._policy._window = 4
+        proc = self.process(1, 160)
+        mem.allocate(proc)
+
+        proc.translate(0)
+        for page in (1, 2, 3, 1, 2):
+            proc.translate(page * 16)
+        self.assertEqual(proc.page_table[0], no_frame)
+        self.assertNotEqual(proc.page_table[1], no_frame)
+        self.assertEqual(proc.evictions, 1)
+        self.assertEqual(mem.free_mem(), 160 - 3 * 16)
+
+if __name__ == '__main__':
+    unittest.main()
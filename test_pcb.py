@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_pcb.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of the PCB: compact storage of its burst history
+#                   & params, and batch address translation (skipped if
+#                   NumPy isn't installed).
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import random
+import unittest
+
+import pcb
+from pcb import PCB, InvalidAddress
+from memory import Memory, DemandPagedMemory, pages_needed
+
+def process(pid, size, pg_size=16):
+    return PCB(pid, size, pages_needed(size, pg_size), pg_size, 0.5, 5)
+
+class PCBTest(unittest.TestCase):
+
+    def test_slots(self):
+        """ PCBs have no per-instance dict, so attributes can't be misspelt """
+        proc = process(1, 40)
+        self.assertFalse(hasattr(proc, "__dict__"))
+        self.assertRaises(AttributeError, setattr, proc, "burst_totl", 3)
+
+    def test_burst_history(self):
+        """ Averages & totals are kept from running totals of bursts """
+        proc = process(1, 40)
+        self.assertEqual(proc.avg_burst_time(), 0)
+        for burst in (4, 6, 11):
+            proc.update_burst_time(burst - 1)
+            proc.record_burst_time(1)
+            proc.clear_curr_burst()
+        self.assertEqual(proc.tot_burst_time(), 21)
+        self.assertEqual(proc.avg_burst_time(), 7)
+        self.assertEqual(proc.last_burst, 11)
+
+    def test_params_made_when_needed(self):
+        proc = process(1, 40)
+        self.assertEqual(proc._params, None)
+        self.assertEqual(proc.params["file"], None)
+        proc.params["cyl"] = 3
+        proc.clear_params()
+        self.assertEqual(proc.params["cyl"], None)
+
+@unittest.skipIf(pcb.np is None, "NumPy is not installed")
+class TranslateBatchTest(unittest.TestCase):
+
+    def test_matches_translate(self):
+        """ Batch translation gives the same addresses as translating one at a time """
+        mem = Memory(1024, 16)
+        mem.allocate(process(1, 100))
+        proc = process(2, 300)
+        mem.allocate(proc)
+
+        rand = random.Random(7)
+        addrs = [rand.randrange(300) for i in xrange(500)]
+        phys, invalid = proc.translate_batch(addrs)
+        self.assertFalse(invalid.any())
+        self.assertEqual(list(phys), [proc.translate(a) for a in addrs])
+
+    def test_pages_not_loaded(self):
+        """ Pages not in a frame are masked, and are not loaded """
+        mem = DemandPagedMemory(256, 16, "lru")
+        proc = process(1, 64)
+        mem.allocate(proc)
+        frame = proc.translate(20) // 16
+
+        phys, invalid = proc.translate_batch([0, 20, 40])
+        self.assertEqual(list(invalid), [True, False, True])
+        self.assertEqual(list(phys), [-1, frame * 16 + 4, -1])
+        self.assertEqual(proc.page_faults, 1)
+
+    def test_out_of_range(self):
+        proc = process(1, 64)
+        self.assertRaises(InvalidAddress, proc.translate_batch, [0, 64])
+        self.assertRaises(InvalidAddress, proc.translate_batch, [-1])
+
+if __name__ == '__main__':
+    unittest.main()
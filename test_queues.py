@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_queues.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of the queues: the indexed priority queue against
+#                   a sorted list of (key, order enqueued), its lazy ordered
+#                   view, and removing from FIFO queues by pid.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import random
+import unittest
+from itertools import islice
+
+from queues import FIFOQueue, PriorityQueue, by_est_burst
+from pcb import PCB
+
+def process(pid, est_burst=5):
+    return PCB(pid, 16, 1, 16, 0.5, est_burst)
+
+class PriorityQueueTest(unittest.TestCase):
+
+    def test_ties_in_order_enqueued(self):
+        """ Processes with the same key come out in the order they were enqueued """
+        q = PriorityQueue(key=by_est_burst)
+        for pid, burst in [(4, 3), (2, 5), (9, 3), (1, 5), (3, 1)]:
+            q.enqueue(process(pid, burst))
+        self.assertEqual([q.dequeue().pid for i in xrange(5)], [3, 4, 9, 2, 1])
+
+    def test_key_fixed_until_update(self):
+        """ A key is worked out on enqueue, and again only on update """
+        q = PriorityQueue(key=by_est_burst)
+        procs = [process(pid, pid) for pid in (1, 2, 3)]
+        for p in procs:
+            q.enqueue(p)
+        procs[2].next_est_burst = 0
+        self.assertEqual(q.head().pid, 1)
+        q.update(3)
+        self.assertEqual(q.head().pid, 3)
+
+    def test_matches_sorted_list(self):
+        """ Enqueue, dequeue, pop & update match a sorted list of (key, seq) """
+        rand = random.Random(11)
+        q = PriorityQueue(key=by_est_burst)
+        entries = {}
+        seq = 0
+        for pid in xrange(1, 5000):
+            r = rand.random()
+            if r < 0.4 or not entries:
+                seq += 1
+                proc = process(pid, rand.randint(0, 20))
+                q.enqueue(proc)
+                entries[pid] = [proc.next_est_burst, seq, proc]
+            elif r < 0.6:
+                head = min(entries.itervalues())
+                self.assertIs(q.dequeue(), head[2])
+                del entries[head[2].pid]
+            elif r < 0.8:
+                victim = rand.choice(entries.keys())
+                self.assertIs(q.pop(victim), entries.pop(victim)[2])
+                self.assertIs(q.pop(victim), None)
+            else:
+                e = entries[rand.choice(entries.keys())]
+                e[2].next_est_burst = e[0] = rand.randint(0, 20)
+                q.update(e[2].pid)
+
+            self.assertEqual(q.length(), len(entries))
+            if entries:
+                self.assertIs(q.head(), min(entries.itervalues())[2])
+
+        self.assertEqual([p.pid for p in q.ordered()], [e[2].pid for e in sorted(entries.itervalues())])
+        self.assertTrue(all(q.contains(pid) for pid in entries))
+
+    def test_pop_same_key(self):
+        """ Popping by pid takes that process, not another with the same key """
+        q = PriorityQueue(key=by_est_burst)
+        for pid in (1, 2, 3):
+            q.enqueue(process(pid))
+        self.assertEqual(q.pop(2).pid, 2)
+        self.assertEqual([q.dequeue().pid for i in xrange(2)], [1, 3])
+
+    def test_ordered_leaves_heap(self):
+        """ Reading the first few processes in order doesn't change the heap """
+        q = PriorityQueue(key=by_est_burst)
+        for pid in xrange(1, 100):
+            q.enqueue(process(pid, (pid * 37) % 11))
+        heap = list(q._q)
+        first = [p.pid for p in islice(q.ordered(), 5)]
+        self.assertEqual(q._q, heap)
+        self.assertEqual(first, [p.pid for p in islice(q.ordered(), 5)])
+        self.assertEqual([q.dequeue().pid for i in xrange(5)], first)
+
+class FIFOQueueTest(unittest.TestCase):
+
+    def test_pop_by_pid(self):
+        """ Processes can be taken out by pid, keeping the rest in order """
+        q = FIFOQueue()
+        for pid in (5, 3, 8, 1):
+            q.enqueue(process(pid))
+        self.assertEqual(q.pop(8).pid, 8)
+        self.assertIs(q.pop(8), None)
+        self.assertFalse(q.contains(8))
+        self.assertEqual([q.dequeue().pid for i in xrange(3)], [5, 3, 1])
+        self.assertRaises(IndexError, q.dequeue)
+
+if __name__ == '__main__':
+    unittest.main()
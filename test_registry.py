@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_registry.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks that the registry always agrees with where each
+#                   process actually is, as processes move between the CPU,
+#                   devices and the job pool.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import os
+import sys
+import random
+import unittest
+
+from devices import CPU, Device, DiskDrive
+from memory import JobPool
+from registry import Registry
+from pcb import PCB
+
+class RegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        # Hide console output of the devices
+        self._stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+    def tearDown(self):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+    def test_follows_processes(self):
+        """ Registry finds each process in the device that contains it """
+        rand = random.Random(12)
+        registry = Registry()
+        cpu, printer, disk, pool = CPU(), Device("p1", "Printer"), DiskDrive("d1", 50), JobPool()
+        containers = [cpu, printer, disk, pool]
+        for c in containers:
+            c.set_registry(registry)
+
+        live = set()
+        waiting = {"p1": set(), "d1": set()}
+        for pid in xrange(1, 2000):
+            r = rand.random()
+            if r < 0.25:
+                proc = PCB(pid, 16, 1, 16, 0.5, rand.randint(1, 9))
+                (cpu if r < 0.2 else pool).enqueue(proc)
+                live.add(pid)
+            elif r < 0.45 and cpu.active:
+                proc = cpu.dequeue()
+                proc.params["cyl"] = rand.randint(0, 50)
+                proc.params["file"] = "f1"
+                proc.params["rw"] = "w"
+                dev = rand.choice([printer, disk])
+                dev.enqueue(proc)
+                waiting[dev.get_dev_name()].add(proc.pid)
+            elif r < 0.65:
+                dev = rand.choice([printer, disk])
+                if waiting[dev.get_dev_name()]:
+                    proc = dev.dequeue()
+                    waiting[dev.get_dev_name()].remove(proc.pid)
+                    cpu.enqueue(proc)
+            elif r < 0.8 and pool.length():
+                cpu.enqueue(pool.dequeue_largest(16))
+            elif live:
+                # Kill a process wherever it is
+                victim = rand.choice(list(live))
+                dev = registry.get_device(victim)
+                if dev is pool:
+                    pool.dequeue(victim)
+                else:
+                    dev.terminate(victim)
+                for pids in waiting.itervalues():
+                    pids.discard(victim)
+                live.remove(victim)
+
+            self.assertEqual(len(registry), len(live))
+            for p in live:
+                dev = registry.get_device(p)
+                self.assertTrue(dev.contains(p))
+                self.assertEqual([c for c in containers if c.contains(p)], [dev])
+                self.assertEqual(registry.get_proc(p).pid, p)
+
+if __name__ == '__main__':
+    unittest.main()
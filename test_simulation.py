@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_simulation.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of the discrete event simulation: every CPU burst
+#                   of every job is run in full, with each scheduling policy.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import os
+import sys
+import random
+import unittest
+
+from devices import Device, DiskDrive, cpu_policies
+from system import System
+from simulation import Simulator, Job
+
+def random_jobs(seed, n, max_size):
+    """ n jobs arriving up to 40 apart, each with a few printer or disk requests """
+    rand = random.Random(seed)
+    time = 0
+    for i in xrange(n):
+        time += rand.randint(0, 40)
+        size = rand.randint(1, max_size)
+        calls = rand.randint(0, 3)
+        io = [("p1", "f1", 0, "w", 1, None) if rand.random() < 0.5 else
+              ("d1", "f2", 0, "r", None, rand.randint(0, 100)) for c in xrange(calls)]
+        yield Job(time, size, [rand.randint(1, 20) for c in xrange(calls + 1)], io)
+
+class SimulationTest(unittest.TestCase):
+
+    def setUp(self):
+        # Hide console output of the system
+        self._stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+    def tearDown(self):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+    def system(self, policy, cores=1):
+        all_devices = [Device("p1", "Printer"), DiskDrive("d1", 100), Device("c1", "CD/RW")]
+        return System(all_devices, 0.5, 5, 2**14, 16, 512, cores, policy)
+
+    def test_burst_ending_with_quantum(self):
+        """ A burst ending as its quantum or slice ends is still recorded in full """
+        for policy in cpu_policies:
+            system = self.system(policy)
+            sim = Simulator(system)
+            sim.run([Job(0, 4, [2]), Job(0, 4, [5])])
+            self.assertEqual(sim.calendar.now, 7, policy)
+            self.assertEqual(system.total_cpu_time, 7, policy)
+            self.assertEqual(system.completed, 2, policy)
+
+    def test_cpu_time_matches_bursts(self):
+        """ Total CPU time recorded is the sum of all job bursts """
+        for policy in cpu_policies:
+            for cores in (1, 3):
+                system = self.system(policy, cores)
+                jobs = list(random_jobs(1, 300, system.max_proc_size))
+                sim = Simulator(system)
+                sim.run(jobs)
+
+                label = "{} x {}".format(cores, policy)
+                self.assertEqual(system.completed, 300, label)
+                self.assertEqual(sim.live(), 0, label)
+                self.assertEqual(len(system.registry), 0, label)
+                self.assertEqual(system.total_cpu_time, sum(sum(j.bursts) for j in jobs), label)
+
+    def test_periodic_release(self):
+        """ A periodic process back before its next period is held until its release """
+        system = self.system("edf")
+        sim = Simulator(system)
+        print_job = ("p1", "f1", 0, "w", 1, None)
+        jobs = [Job(0, 4, [1, 1, 1], [print_job, print_job], deadline=10, period=100)]
+
+        # Back from the printer at 21, but not released until 100
+        sim.run(jobs, until=50)
+        self.assertEqual(system.cpu.held(), 1)
+        self.assertFalse(system.cpu.busy())
+        self.assertTrue(system.cpu.contains(1))
+
+        sim.run((), until=100)
+        self.assertEqual(system.cpu.held(), 0)
+        self.assertEqual(system.cpu.active.deadline, 110)
+
+        sim.run(())
+        self.assertEqual(sim.calendar.now, 201)
+        self.assertEqual(system.total_cpu_time, 3)
+        self.assertEqual(system.cpu.misses, 0)
+        self.assertEqual(system.completed, 1)
+
+    def test_release_as_burst_ends(self):
+        """ A process released just as the active burst ends still runs """
+        print_job = ("p1", "f1", 0, "w", 1, None)
+        for cores in (1, 2):
+            system = self.system("edf", cores)
+            sim = Simulator(system)
+
+            # Back from the printer at 21, held until 100, when the burst
+            # running on its core ends
+            sim.run([Job(0, 4, [1, 1, 1], [print_job, print_job], deadline=10, period=100),
+                     Job(0, 4, [99]), Job(0, 4, [99])])
+            self.assertEqual(system.completed, 3, cores)
+            self.assertEqual(sim.live(), 0, cores)
+            self.assertEqual(len(system.registry), 0, cores)
+            self.assertEqual(system.total_cpu_time, 201, cores)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_stack_distance.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of the stack distance analyzer against an LRU
+#                   stack kept as a list, and of the fault curve against
+#                   simulating LRU with each number of frames.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import random
+import unittest
+
+from stack_distance import FenwickTree, stack_distances, fault_curve, frames_needed, address_refs
+
+def list_distances(refs):
+    """ Stack distances from an LRU stack kept as a list, most recent first """
+    stack = []
+    for page in refs:
+        if page in stack:
+            d = stack.index(page) + 1
+            stack.remove(page)
+        else:
+            d = None
+        stack.insert(0, page)
+        yield d
+
+def lru_faults(refs, frames):
+    resident = []
+    faults = 0
+    for page in refs:
+        if page in resident:
+            resident.remove(page)
+        else:
+            faults += 1
+            if not frames:
+                continue
+            if len(resident) == frames:
+                resident.pop(0)
+        resident.append(page)
+    return faults
+
+def reference_string(seed, n, pages):
+    """ References with some locality: mostly near recent pages """
+    rand = random.Random(seed)
+    page = 0
+    for i in xrange(n):
+        page = (page + int(rand.gauss(0, 3))) % pages if rand.random() < 0.9 else rand.randrange(pages)
+        yield page
+
+class StackDistanceTest(unittest.TestCase):
+
+    def test_fenwick_tree(self):
+        rand = random.Random(8)
+        tree = FenwickTree(50)
+        counts = [0] * 50
+        for i in xrange(500):
+            j = rand.randrange(50)
+            n = rand.randint(-3, 3)
+            tree.add(j, n)
+            counts[j] += n
+            k = rand.randint(0, 50)
+            self.assertEqual(tree.prefix_sum(k), sum(counts[:k]))
+
+    def test_matches_lru_stack(self):
+        """ Distances match an LRU stack, including after renumbering positions """
+        refs = list(reference_string(9, 5000, 300))
+        self.assertEqual(list(stack_distances(refs)), list(list_distances(refs)))
+
+    def test_pid_pairs(self):
+        refs = [(1, 0), (2, 0), (1, 0), (2, 1), (2, 0)]
+        self.assertEqual(list(stack_distances(refs)), [None, None, 2, None, 3])
+        self.assertEqual(list(address_refs([(1, 5), (1, 40)], 16)), [(1, 0), (1, 2)])
+
+    def test_fault_curve(self):
+        """ Fault curve matches simulating LRU with every number of frames """
+        refs = list(reference_string(10, 2000, 60))
+        curve = fault_curve(refs, 64)
+        self.assertEqual(curve, [lru_faults(refs, f) for f in xrange(65)])
+        self.assertEqual(len(fault_curve(iter(refs))), max(d for d in list_distances(refs) if d) + 1)
+
+        frames = frames_needed(curve, 0.1)
+        self.assertLessEqual(curve[frames], 0.1 * len(refs))
+        self.assertGreater(curve[frames - 1], 0.1 * len(refs))
+        self.assertEqual(frames_needed(curve, 0), None)
+
+if __name__ == '__main__':
+    unittest.main()
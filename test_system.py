@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_system.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Scripted run of the system through its operations, as
+#                   the commands would drive it: new processes, a system
+#                   call, an interrupt, then terminating & killing.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import os
+import sys
+import unittest
+
+from devices import Device, DiskDrive
+from system import System
+
+class SystemTest(unittest.TestCase):
+
+    def setUp(self):
+        # Hide console output of the system
+        self._stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+        # Room in memory for two processes of size 32
+        all_devices = [Device("p1", "Printer"), DiskDrive("d1", 100)]
+        self.system = System(all_devices, 0.5, 5, 64, 16, 64)
+
+    def tearDown(self):
+        sys.stdout.close()
+        sys.stdout = self._stdout
+
+    def where(self, pid):
+        return self.system.registry.get_device(pid)
+
+    def test_process_lifecycle(self):
+        system = self.system
+        cpu, disk, job_pool = system.cpu, system.device("d1"), system.lts.job_pool
+
+        # Two processes fit in memory, the third waits in the job pool
+        for pid in (1, 2, 3):
+            self.assertEqual(system.new_process(32).pid, pid)
+        self.assertEqual(cpu.get_active_process().pid, 1)
+        self.assertIs(self.where(2), cpu)
+        self.assertIs(self.where(3), job_pool)
+
+        # Process 1 requests the disk after running for 3
+        system.syscall("d1", 3, "f1", 0, "r", None, 40)
+        self.assertIs(self.where(1), disk)
+        self.assertEqual(cpu.get_active_process().pid, 2)
+
+        # Disk completes its request & process 1 goes back to the CPU
+        self.assertEqual([p.pid for p in system.interrupt("d1", 2)], [1])
+        self.assertFalse(disk.length())
+        self.assertIs(self.where(1), cpu)
+
+        # Terminating process 2 frees memory for process 3
+        proc = system.terminate(4)
+        self.assertEqual(proc.pid, 2)
+        self.assertEqual(system.completed, 1)
+        self.assertEqual(system.total_cpu_time, 6)
+        self.assertIs(self.where(3), cpu)
+        self.assertNotIn(2, system.registry)
+
+        # Killing the rest leaves the system empty
+        system.kill(3)
+        system.kill(1, 1)
+        self.assertFalse(cpu.busy())
+        self.assertEqual(len(system.registry), 0)
+        self.assertEqual(system.lts.ram.free_mem(), 64)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_tlb.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of the TLB: eviction within a set, address space
+#                   IDs versus flushing on a context switch, and translation
+#                   through the TLB giving the same addresses as without.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import random
+import unittest
+
+from tlb import TLB
+from memory import Memory, DemandPagedMemory, pages_needed
+from pcb import PCB
+
+class TLBTest(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        """ A full set evicts its least recently used entry """
+        tlb = TLB(4, 2)
+        tlb.insert(1, 0, 10)
+        tlb.insert(1, 2, 12)
+        self.assertEqual(tlb.lookup(1, 0), 10)
+
+        # Pages 0, 2 & 4 share a set: page 2 was used longest ago
+        tlb.insert(1, 4, 14)
+        self.assertEqual(tlb.lookup(1, 2), None)
+        self.assertEqual(tlb.lookup(1, 0), 10)
+        self.assertEqual(tlb.lookup(1, 4), 14)
+
+        # Other set is untouched
+        tlb.insert(1, 1, 11)
+        self.assertEqual(tlb.lookup(1, 1), 11)
+        self.assertEqual((tlb.hits, tlb.misses), (4, 1))
+
+    def test_random_eviction(self):
+        """ Random eviction keeps each set within its ways """
+        tlb = TLB(8, 4, "random", seed=1)
+        for page in xrange(0, 40, 2):
+            tlb.insert(1, page, page)
+        resident = [p for p in xrange(0, 40, 2) if tlb.lookup(1, p) is not None]
+        self.assertEqual(len(resident), 4)
+        self.assertIn(38, resident)
+
+    def test_asid_and_flush(self):
+        """ Entries are kept across switches if tagged with pid, else flushed """
+        for asid in (True, False):
+            tlb = TLB(8, 2, asid=asid)
+            tlb.switch(1)
+            tlb.insert(1, 0, 5)
+            tlb.switch(2)
+            self.assertEqual(tlb.lookup(2, 0), None)
+            tlb.insert(2, 0, 6)
+            tlb.switch(1)
+            self.assertEqual(tlb.lookup(1, 0), 5 if asid else None, asid)
+            self.assertEqual(tlb.flushes, 0 if asid else 2, asid)
+
+    def test_invalidate(self):
+        tlb = TLB(8, 2)
+        tlb.insert(1, 3, 7)
+        tlb.invalidate(1, 3)
+        self.assertEqual(tlb.lookup(1, 3), None)
+        tlb.invalidate(1, 3)
+
+    def test_rejects_bad_shape(self):
+        self.assertRaises(ValueError, TLB, 6, 4)
+        self.assertRaises(ValueError, TLB, 8, 2, "mru")
+
+    def test_translation_unchanged(self):
+        """ Translating through a TLB gives the same addresses as the page table """
+        rand = random.Random(6)
+        for mem in (Memory(1024, 16), DemandPagedMemory(256, 16, "lru")):
+            tlb = TLB(8, 2)
+            mem.tlb = tlb
+            procs = [PCB(pid, 300, pages_needed(300, 16), 16, 0.5, 5) for pid in (1, 2)]
+            for proc in procs:
+                mem.allocate(proc)
+
+            for i in xrange(2000):
+                proc = rand.choice(procs)
+                tlb.switch(proc.pid)
+                addr = rand.randrange(300)
+                phys = proc.translate(addr, tlb)
+                self.assertEqual(phys, proc.translate(addr))
+            self.assertGreater(tlb.hits, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             test_workload.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Checks of synthetic workloads: reproducible from a seed,
+#                   with valid system calls for each device picked.
+# Run using:        python -m unittest discover
+
+from __future__ import division
+import random
+import unittest
+from itertools import islice
+
+from devices import Device, DiskDrive
+from workload import Workload, fitted
+
+all_devices = [Device("p1", "Printer"), DiskDrive("d1", 100), Device("c1", "CD/RW")]
+
+class WorkloadTest(unittest.TestCase):
+
+    def test_same_seed_same_jobs(self):
+        """ A workload replays exactly, and matches another with the same seed """
+        for arrivals in ("poisson", "bursty"):
+            for bursts in ("exponential", "hyperexponential"):
+                workload = Workload(all_devices, 64, 7, 200, arrivals, bursts=bursts)
+                jobs = list(workload)
+                self.assertEqual(len(jobs), 200)
+                self.assertEqual(list(workload), jobs)
+                self.assertEqual(list(Workload(all_devices, 64, 7, 200, arrivals, bursts=bursts)), jobs)
+                self.assertNotEqual(list(Workload(all_devices, 64, 8, 200, arrivals, bursts=bursts)), jobs)
+
+    def test_valid_jobs(self):
+        """ Jobs arrive in order, with whole bursts & valid system calls """
+        workload = Workload(all_devices, 64, 3, read_ratio=0.3)
+        last = 0
+        for job in islice(workload, 500):
+            self.assertGreaterEqual(job.time, last)
+            last = job.time
+            self.assertTrue(1 <= job.size <= 64)
+            self.assertEqual(len(job.bursts), len(job.io) + 1)
+            self.assertTrue(all(isinstance(b, int) and b >= 1 for b in job.bursts))
+
+            for name, file_name, address, rw, length, cyl in job.io:
+                self.assertIn(name, ("p1", "d1", "c1"))
+                self.assertTrue(0 <= address < job.size)
+                if name == "p1":
+                    self.assertEqual(rw, "w")
+                if rw == "w":
+                    self.assertTrue(1 <= length <= job.size - address)
+                else:
+                    self.assertIs(length, None)
+                if name == "d1":
+                    self.assertTrue(0 <= cyl <= 100)
+                else:
+                    self.assertIs(cyl, None)
+
+    def test_mix(self):
+        """ A device type with no weight is never requested """
+        workload = Workload(all_devices, 64, 5, 300, mix={"Printer": 0, "CD/RW": 3})
+        names = [io[0] for job in workload for io in job.io]
+        self.assertNotIn("p1", names)
+        self.assertGreater(names.count("c1"), names.count("d1"))
+
+        workload = Workload(all_devices, 64, 5, 50, mix={"Printer": 0, "Disk Drive": 0, "CD/RW": 0})
+        self.assertTrue(all(not job.io for job in workload))
+
+    def test_fitted_bursts(self):
+        """ Bursts fitted to a trace have its mean """
+        rand = random.Random(4)
+        for samples in ([4, 5, 6, 5], [1, 1, 1, 30], [10, 10, 10]):
+            burst = fitted(rand, None, samples)
+            mean = sum(samples) / len(samples)
+            self.assertAlmostEqual(sum(burst() for i in xrange(20000)) / 20000, mean, delta=mean / 10)
+        self.assertRaises(ValueError, fitted, rand, None, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             tlb.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Translation lookaside buffer (TLB) modelled as a set
+#                   associative cache of page -> frame translations in front
+#                   of the page table. Entries can be tagged with an address
+#                   space ID (the pid) or the whole TLB flushed whenever the
+#                   CPU switches to a different process.
+
+from __future__ import division
+import random
+from collections import deque
+import msg
+
+class TLB:
+
+    def __init__(self, entries, ways, policy="lru", asid=True, tlb_time=1, mem_time=100, seed=None):
+        """
+        Initialize empty TLB with given number of entries, split into sets of
+        `ways` entries each. Policy is how a victim entry is chosen in a full
+        set, either "lru" or "random". If asid is False, the TLB is flushed
+        on every context switch.
+        tlb_time & mem_time are the time taken for a TLB lookup & a memory
+        access, used to work out the effective memory access time.
+        """
+        if ways <= 0 or entries % ways:
+            raise ValueError("Number of entries must be a multiple of associativity")
+        if policy not in tlb_policies:
+            raise ValueError("Unknown TLB eviction policy " + str(policy))
+
+        self._entries = entries
+        self._ways = ways
+        self._num_sets = entries // ways
+        self._lru = policy == "lru"
+        self._asid = asid
+        self._rand = random.Random(seed)
+
+        self.tlb_time = tlb_time
+        self.mem_time = mem_time
+
+        self._active = None
+        self.flush()
+
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+
+    def flush(self):
+        """ Invalidates all entries """
+        # Each set maps (pid, page) -> frame. For LRU, each set also has a
+        # queue of (time, key) in order of use, with stale entries skipped
+        # lazily. For random eviction, each set has a list of its keys.
+        self._sets = [{} for i in xrange(self._num_sets)]
+        self._order = [deque() if self._lru else [] for i in xrange(self._num_sets)]
+        self._used = {}
+        self._time = 0
+
+    ## Lookups
+
+    def lookup(self, pid, page):
+        """ Returns frame for given page of process, or None on a TLB miss """
+        key = (pid, page)
+        frame = self._sets[page % self._num_sets].get(key)
+
+        if frame is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            if self._lru:
+                self._touch(page % self._num_sets, key)
+        return frame
+
+    def insert(self, pid, page, frame):
+        """ Adds translation after a TLB miss, evicting an entry if set is full """
+        s = page % self._num_sets
+        entries = self._sets[s]
+        key = (pid, page)
+
+        if key not in entries and len(entries) >= self._ways:
+            self._evict(s)
+
+        entries[key] = frame
+        if self._lru:
+            self._touch(s, key)
+        else:
+            self._order[s].append(key)
+
+    def _touch(self, s, key):
+        self._time += 1
+        self._used[key] = self._time
+        q = self._order[s]
+        q.append((self._time, key))
+
+        # Drop stale entries once they outnumber live ones
+        if len(q) > 2 * self._ways + 8:
+            self._order[s] = deque(e for e in q if self._used.get(e[1]) == e[0])
+
+    def _evict(self, s):
+        """ Removes one entry from full set """
+        if self._lru:
+            q = self._order[s]
+            while True:
+                t, key = q.popleft()
+                if self._used.get(key) == t:
+                    del self._used[key]
+                    break
+        else:
+            keys = self._order[s]
+            i = self._rand.randrange(len(keys))
+            keys[i], keys[-1] = keys[-1], keys[i]
+            key = keys.pop()
+
+        del self._sets[s][key]
+
+    def invalidate(self, pid, page):
+        """ Removes translation for given page, i.e. when page is evicted """
+        s = page % self._num_sets
+        key = (pid, page)
+        if key in self._sets[s]:
+            del self._sets[s][key]
+            if self._lru:
+                del self._used[key]
+            else:
+                self._order[s].remove(key)
+
+    ## Context switching
+
+    def switch(self, pid):
+        """
+        CPU switched to process with given pid. Flush all entries, unless
+        entries are tagged with pid.
+        """
+        if pid != self._active and not self._asid and self._active is not None:
+            self.flush()
+            self.flushes += 1
+        self._active = pid
+
+    ## Stats
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def miss_rate(self):
+        total = self.hits + self.misses
+        return self.misses / total if total else 0
+
+    def effective_access_time(self):
+        """
+        Effective memory access time: a hit costs a TLB lookup and one memory
+        access, a miss costs a TLB lookup, a page table access and a memory
+        access
+        """
+        h = self.hit_rate()
+        return h * (self.tlb_time + self.mem_time) + (1 - h) * (self.tlb_time + 2 * self.mem_time)
+
+    def __str__(self):
+        return "{}-entry {}-way {} TLB ({})".format(self._entries, self._ways, "LRU" if self._lru else "random", "ASID" if self._asid else "flush")
+
+    def snapshot(self):
+        """ Prints TLB stats """
+        print msg.snapshot_header("TLB")
+        print str(self).center(78)
+        print "Hit Rate: {:<8.2%} Miss Rate: {:<8.2%} Eff Access Time: {:<8.2f} Flushes: {:<5}".format(
+            self.hit_rate(), self.miss_rate(), self.effective_access_time(), self.flushes).center(78)
+
+tlb_policies = frozenset(["lru", "random"])
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Author:           Anna Cristina Karingal
+# Name:             workload.py
+# Created:          October 16, 2026
+# Last Updated:     October 16, 2026
+# Description:      Synthetic workloads for the discrete event simulation.
+#                   A workload is a stream of jobs (see simulation.Job), all
+#                   drawn from one seed:
+#                       - arrivals: Poisson, or bursty (runs of jobs arriving
+#                         close together, with quiet gaps in between)
+#                       - process sizes: up to the maximum process size
+#                       - CPU bursts: exponential, hyperexponential (more
+#                         variable than exponential), or fitted to the mean
+#                         & variability of burst lengths from a trace
+#                       - system calls: to devices picked by a weight for
+#                         each device type, with valid params for the device
+#                   Jobs are generated one at a time as they are asked for,
+#                   so a workload can be any length.
+
+from __future__ import division
+import random
+from bisect import bisect
+from math import ceil, log, sqrt
+
+from simulation import Job
+
+## Arrival processes. Each yields the time between one arrival & the next
+
+def poisson(rand, mean_gap):
+    """ Jobs arrive independently, mean_gap apart on average """
+    rate = 1 / mean_gap
+    while True:
+        yield rand.expovariate(rate)
+
+def bursty(rand, mean_gap, burstiness=10, mean_run=20):
+    """
+    Jobs arrive in runs of mean_run on average, burstiness times faster
+    than mean_gap apart. Runs are separated by quiet gaps, long enough
+    that jobs still arrive mean_gap apart on average.
+    """
+    if burstiness <= 1:
+        for gap in poisson(rand, mean_gap):
+            yield gap
+    fast = mean_gap / burstiness
+    while True:
+        run = geometric(rand, mean_run)
+        yield rand.expovariate(1 / (run * (mean_gap - fast))) + rand.expovariate(1 / fast)
+        for i in xrange(run - 1):
+            yield rand.expovariate(1 / fast)
+
+def geometric(rand, mean):
+    """ Whole number from 1 up, with given mean, each more likely than the next """
+    if mean <= 1:
+        return 1
+    return 1 + int(log(1 - rand.random()) / log(1 - 1 / mean))
+
+arrival_processes = {
+    "poisson": poisson,
+    "bursty": bursty,
+}
+
+## CPU burst distributions. Each returns a function giving the next burst
+
+def exponential(rand, mean):
+    rate = 1 / mean
+    return lambda: rand.expovariate(rate)
+
+def hyperexponential(rand, mean, cv=2):
+    """
+    Mix of two exponentials with balanced means, for bursts with a
+    coefficient of variation (standard deviation / mean) of cv > 1: mostly
+    short bursts, with a few very long ones
+    """
+    if cv <= 1:
+        return exponential(rand, mean)
+    p = (1 + sqrt((cv * cv - 1) / (cv * cv + 1))) / 2
+    fast, slow = 2 * p / mean, 2 * (1 - p) / mean
+    return lambda: rand.expovariate(fast if rand.random() < p else slow)
+
+def erlang(rand, mean, k=1):
+    """ Sum of k exponentials, for bursts less variable than exponential """
+    rate = k / mean
+    return lambda: sum(rand.expovariate(rate) for i in xrange(k))
+
+def fitted(rand, mean, samples=()):
+    """
+    Bursts with the same mean & coefficient of variation as the burst
+    lengths in samples (mean is ignored): Erlang if less variable than
+    exponential, else hyperexponential. Bursts are all the mean if they
+    hardly vary.
+    """
+    samples = list(samples)
+    if not samples:
+        raise ValueError("No burst lengths to fit")
+    mean = sum(samples) / len(samples)
+    if mean <= 0:
+        raise ValueError("Burst lengths must be positive")
+    var = sum((s - mean) ** 2 for s in samples) / len(samples)
+    cv = sqrt(var) / mean
+    if cv < 0.1:
+        # Erlang would need over 100 exponentials for each burst
+        return lambda: mean
+    if cv < 1:
+        return erlang(rand, mean, int(round(1 / (cv * cv))))
+    return hyperexponential(rand, mean, cv)
+
+burst_distributions = {
+    "exponential": exponential,
+    "hyperexponential": hyperexponential,
+    "trace": fitted,
+}
+
+def read_bursts(lines):
+    """ Returns burst lengths from lines of whitespace separated numbers """
+    return [float(b) for line in lines for b in line.split()]
+
+class Workload:
+    """
+    Jobs for the given devices, up to max_proc_size, drawn from seed.
+    Iterating over a workload yields its jobs in order of arrival, starting
+    from the same seed each time, so a workload can be replayed exactly.
+
+    arrivals & bursts name one of arrival_processes & burst_distributions,
+    made with arrival_options & burst_options as keyword arguments. Each job
+    makes mean_io system calls on average. mix maps device type to how
+    likely each device of that type is to be picked (1 each by default).
+    read_ratio of requests to devices that can be read from are reads.
+    Files are named f1 to f<files>, so some requests read the same file.
+    """
+
+    def __init__(self, all_devices, max_proc_size, seed=None, jobs=None,
+                 arrivals="poisson", mean_gap=40, arrival_options=None,
+                 bursts="exponential", mean_burst=10, burst_options=None,
+                 mean_io=2, mix=None, read_ratio=0.5, files=100):
+        self.seed = seed
+        self.jobs = jobs
+        self.max_proc_size = max_proc_size
+
+        self._arrivals = arrival_processes[arrivals]
+        self.mean_gap = mean_gap
+        self._arrival_options = arrival_options or {}
+
+        self._bursts = burst_distributions[bursts]
+        self.mean_burst = mean_burst
+        self._burst_options = burst_options or {}
+
+        self.mean_io = mean_io
+        self.read_ratio = read_ratio
+        self.files = files
+
+        # Devices that can be requested, & running totals of their weights
+        # to pick one with a bisect
+        mix = mix or {}
+        self._devices = []
+        self._weights = []
+        total = 0
+        for dev in all_devices:
+            weight = mix.get(dev.get_dev_type(), 1)
+            if weight > 0:
+                total += weight
+                self._devices.append(dev)
+                self._weights.append(total)
+
+    def __iter__(self):
+        rand = random.Random(self.seed)
+        gaps = self._arrivals(rand, self.mean_gap, **self._arrival_options)
+        burst = self._bursts(rand, self.mean_burst, **self._burst_options)
+
+        time = 0
+        n = 0
+        while self.jobs is None or n < self.jobs:
+            n += 1
+            time += next(gaps)
+            size = rand.randint(1, self.max_proc_size)
+            calls = geometric(rand, self.mean_io + 1) - 1 if self._devices else 0
+
+            # Bursts are whole units of time, at least 1
+            bursts = [max(1, int(ceil(burst()))) for i in xrange(calls + 1)]
+            io = [self._syscall(rand, size) for i in xrange(calls)]
+            yield Job(time, size, bursts, io)
+
+    def _syscall(self, rand, size):
+        """ System call params for a random device, valid for a process of given size """
+        dev = self._devices[bisect(self._weights, rand.random() * self._weights[-1])]
+        dev_type = dev.get_dev_type().lower()
+
+        address = rand.randrange(size)
+        rw = "w" if dev_type == "printer" or rand.random() >= self.read_ratio else "r"
+        length = rand.randint(1, size - address) if rw == "w" else None
+        cyl = rand.randint(0, dev.get_num_cylinders()) if dev_type == "disk drive" else None
+        return (dev.get_dev_name(), "f" + str(rand.randint(1, self.files)), address, rw, length, cyl)